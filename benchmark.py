@@ -0,0 +1,728 @@
+import os
+import sys
+import time
+import resource
+import multiprocessing
+from src.lexer.lexer import Lexer
+from src.parser.parser import Parser
+from src.parser.rdparser import RDParser
+import contextlib
+import glob
+import io
+import tracemalloc
+import tempfile
+from src.ast import ast
+from src.cache.cache import ASTCache, ObjectCache
+from src.compiler.compiler import Compiler, SymbolTable, SlotTable
+from src.compiler.parallel import generateParallel
+from src.compiler.incremental import generateIncremental
+from src.compiler.jit import JITSession
+from llvmlite import binding
+from src.optimizer.optimizer import MacroExpander, ConstantFolder, DeadCodeEliminator
+from src.semantic.semantic import SemanticAnalyzer
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+# synthetic machine-generated source with n statements
+def synthetic(n: int) -> str:
+    lines = [f'i32 v{i} = {i} * 2 + (v{i} - 1) / 3;\n' for i in range(n)]
+    return ''.join(lines)
+
+# array initializer with n elements
+def initializer(n: int) -> str:
+    return 'i32 table[] = {' + ', '.join(str(i) for i in range(n)) + '};\n'
+
+# run fn(*args) in a fresh process, returns (seconds, result, peak RSS growth in KB)
+def measure(fn, *args):
+    def child(queue):
+        before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        start = time.perf_counter()
+        try:
+            result = fn(*args)
+        except Exception as error:
+            queue.put(error)                # don't leave the parent waiting
+            raise
+        seconds = time.perf_counter() - start
+        after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        queue.put((seconds, result, after - before))
+
+    ctx = multiprocessing.get_context('fork')
+    queue = ctx.Queue()
+    process = ctx.Process(target=child, args=(queue,))
+    process.start()
+    result = queue.get()
+    process.join()
+    if isinstance(result, Exception):
+        raise result
+    return result
+
+def report(title, header, rows):
+    print(f'\n{title}')
+    print(''.join(f'{h:>16}' for h in header))
+    for row in rows:
+        print(''.join(f'{c:>16.2f}' if isinstance(c, float) else f'{c:>16}' for c in row))
+
+# main() full of arithmetic, comparisons, logic and pointer loads on local variables
+def expressions(n: int) -> str:
+    lines = ['function i32 main(){\n', '    i32 v0 = 1;\n', '    i32 *p = &v0;\n']
+    for i in range(1, n):
+        lines.append(f'    i32 v{i} = 2 * v{i - 1} + (v{i - 1} - {i}) / 3 - v{i - 1} / 5;\n')
+        if i % 2 == 0:
+            lines.append(f'    v{i} = *p + *p / {i} - *p;\n')
+        if i % 4 == 0:
+            lines.append(f'    if(v{i} > {i} and v{i} < {i * 7} or not v{i} == 0){{ v{i} = v{i} + 1; }}\n')
+    lines.append('    return 0;\n}\n')
+    return ''.join(lines)
+
+# constant heavy main(): const scalars, literal arithmetic and conditions
+def constants(n: int) -> str:
+    lines = ['function i32 main(){\n', '    i32 const K = 4;\n', '    i32 total = 0;\n']
+    for i in range(n):
+        lines.append(f'    i32 c{i} = (K * {i} + 3 * 4 - 10 / 2) * (2 + 3);\n')
+        lines.append(f'    if({i} > K and 1 < 2){{ total = total + c{i}; }}\n')
+    lines.append('    return total;\n}\n')
+    return ''.join(lines)
+
+# main() where most code sits behind disabled feature flags, plus helpers
+# only the disabled code calls
+def featureFlags(n: int) -> str:
+    lines = ['bool const DEBUG = false;\n', 'bool const TRACE = false;\n', 'bool const FAST = true;\n']
+    for i in range(0, n, 10):
+        lines.append(f'function i32 trace{i}(i32 x){{ write("trace %d\\n", x); return x; }}\n')
+    lines.append('function i32 main(){\n    i32 total = 0;\n')
+    for i in range(n):
+        lines.append(f'    i32 v{i} = {i} * 3;\n')
+        lines.append(f'    if(DEBUG){{ write("v{i} = %d\\n", v{i}); total = total - v{i}; }}\n')
+        if i % 10 == 0:
+            lines.append(f'    if(TRACE){{ total = total + trace{i}(v{i}); }} elif(FAST){{ total = total + v{i}; }}\n')
+    lines.append('    return total;\n    write("unreachable\\n");\n}\n')
+    return ''.join(lines)
+
+# for loops nested depth deep, each level declares width locals that use the
+# loop counters and locals of every enclosing level
+def nested(depth: int, width: int) -> str:
+    lines = ['function i32 main(){\n', '    i32 total = 0;\n']
+    for d in range(depth):
+        indent = '    ' * (d + 1)
+        lines.append(f'{indent}for(i32 n{d} = 0; n{d} < 2; n{d} = n{d} + 1){{\n')
+        for k in range(width):
+            outer = ' + '.join(f'a{o}_{k}' for o in range(d))
+            lines.append(f'{indent}    i32 a{d}_{k} = n{d} + {k}{" + " + outer if outer else ""};\n')
+        lines.append(f'{indent}    total = total + a{d}_0;\n')
+    for d in reversed(range(depth)):
+        lines.append('    ' * (d + 1) + '}\n')
+    lines.append('    return total;\n}\n')
+    return ''.join(lines)
+
+# n small functions, each calls the one before it, and a global they all
+# read. main() calls the last
+def functions(n: int) -> str:
+    lines = ['i32 SCALE = 3;\n']
+    for k in range(n):
+        call = f'f{k - 1}(a)' if k else 'x'
+        lines.append(f'function i32 f{k}(i32 x){{\n    i32 a = x + SCALE;\n    i32 i = 0;\n')
+        lines.append(f'    while(i < 4){{ a = a + i * {k % 7 + 1} - x / 3; i = i + 1; }}\n')
+        lines.append(f'    if(a > 1000){{ a = a - 1000; }}\n    i32 b = {call};\n    return b - a / 2;\n}}\n')
+    lines.append(f'function i32 main(){{\n    write("%d\\n", f{n - 1}(1));\n    return 0;\n}}\n')
+    return ''.join(lines)
+
+# loops over compile time sizes and coefficients, given as #define macros or
+# as global variables
+def kernels(n: int, define: bool) -> str:
+    values = {'N': 64, 'ALPHA': 3, 'BETA': 2}
+    if define:
+        lines = [f'#define {name} {value};\n' for name, value in values.items()]
+    else:
+        lines = [f'i32 {name} = {value};\n' for name, value in values.items()]
+    lines.append('function i32 main(){\n    i32 total = 0;\n')
+    for i in range(n):
+        lines.append(f'    for(i32 j{i} = 0; j{i} < N; j{i} = j{i} + 1){{ total = total + ALPHA * j{i} + BETA; }}\n')
+    lines.append('    return total;\n}\n')
+    return ''.join(lines)
+
+# LexToken list (tokenize) vs array-backed TokenBuffer (tokenize_compact)
+def benchTokens(n: str = '100000'):
+    text = synthetic(int(n))
+    lexer = Lexer()
+
+    def lexTokens():
+        return len(lexer.tokenize(text))
+
+    def lexCompact():
+        return len(lexer.tokenize_compact(text))
+
+    rows = []
+    for name, fn in (('tokenize', lexTokens), ('compact', lexCompact)):
+        seconds, count, rss = measure(fn)
+        rows.append((name, count, count / seconds, rss / 1024))
+    report(f'lexing {n} statements', ('mode', 'tokens', 'tokens/sec', 'peak RSS MB'), rows)
+
+# cold start: first Lexer() of a process, rebuilt vs loaded from lextab
+def benchLexStart(runs: str = '20'):
+    def build(optimize):
+        start = time.perf_counter()
+        Lexer(optimize).tokenize('i32 a = 1;')
+        return time.perf_counter() - start
+
+    rows = []
+    for name, optimize in (('rebuild', False), ('cached', True)):
+        times = [measure(build, optimize)[1] for _ in range(int(runs))]
+        rows.append((name, 1000 * min(times), 1000 * sum(times) / len(times)))
+    report('Lexer() cold start', ('mode', 'min ms', 'mean ms'), rows)
+
+# cold start: first Parser() of a process, default vs production (--fast) mode
+def benchParseStart(runs: str = '20'):
+    def build(optimize):
+        start = time.perf_counter()
+        Parser(optimize).parse('i32 a = 1;')
+        return time.perf_counter() - start
+
+    rows = []
+    for name, optimize in (('default', False), ('fast', True)):
+        times = [measure(build, optimize)[1] for _ in range(int(runs))]
+        rows.append((name, 1000 * min(times), 1000 * sum(times) / len(times)))
+    report('Parser() cold start', ('mode', 'min ms', 'mean ms'), rows)
+
+# parse time of n statements / n initializer elements, should grow linearly
+def benchParseScale(sizes: str = '1000,10000,100000'):
+    parser = Parser(True)
+    rows = []
+    for n in [int(size) for size in sizes.split(',')]:
+        for name, text in (('statements', synthetic(n)), ('initializer', initializer(n))):
+            start = time.perf_counter()
+            parser.parse(text)
+            seconds = time.perf_counter() - start
+            rows.append((name, n, seconds, 1e6 * seconds / n))
+    report('parse scaling', ('program', 'n', 'seconds', 'us per item'), rows)
+
+# LALR vs recursive-descent backend throughput, best of runs
+def benchRDParse(n: str = '20000', runs: str = '3'):
+    text = synthetic(int(n)) + initializer(int(n))
+    rows = []
+    for name, parser in (('lalr', Parser(True)), ('rd', RDParser(True))):
+        times = []
+        for _ in range(int(runs)):
+            start = time.perf_counter()
+            parser.parse(text)
+            times.append(time.perf_counter() - start)
+        seconds = min(times)
+        rows.append((name, seconds, len(text) / seconds / 1e6, rows[0][1] / seconds if rows else 1.0))
+    report(f'parse {n} statements + {n} element initializer, best of {runs}', ('backend', 'seconds', 'MB/sec', 'speedup'), rows)
+
+# every ASTnode reachable from tree
+def astNodes(tree):
+    stack = [tree]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, list):
+            stack.extend(item)
+        elif isinstance(item, ast.ASTnode):
+            yield item
+            if hasattr(item, '__dict__'):
+                stack.extend(vars(item).values())
+            else:
+                stack.extend(getattr(item, name) for name in type(item).__slots__)
+
+# both backends must build identical trees (and spans) on the test/*.yan corpus
+def checkRDParse(pattern: str = 'test/*.yan'):
+    lalr = Parser(True)
+    rd = RDParser(True)
+    for filename in sorted(glob.glob(pattern)):
+        with open(filename, 'r') as file:
+            text = file.read()
+
+        results = []
+        for parser in (lalr, rd):
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                try:
+                    tree = parser.parse(text)
+                    tree = (repr(tree), [(node.lineno, node.lexpos) for node in astNodes(tree)])
+                except IndexError:              # PLY p_type on a missing type
+                    tree = None
+            results.append(None if 'Syntax Error' in output.getvalue() else tree)
+
+        if results[0] is None:
+            status = 'syntax error' if results[1] is None else 'lalr rejects'
+        else:
+            status = 'identical' if results[0] == results[1] else 'DIFFERENT'
+        print(f'{filename:24} {status}')
+
+# memory the parsed tree keeps alive (nodes, lists, names, literals) per node
+def benchAstMemory(n: str = '10000'):
+    programs = [(filename, open(filename).read()) for filename in ('test/test2.yan', 'test/test3.yan', 'test/test4.yan')]
+    programs.append((f'synthetic {n}', synthetic(int(n)) + initializer(int(n))))
+
+    parser = Parser(True)
+    rows = []
+    for name, text in programs:
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        tree = parser.parse(text)
+        retained = tracemalloc.get_traced_memory()[0] - before
+        tracemalloc.stop()
+
+        nodes = sum(1 for node in astNodes(tree))
+        rows.append((name, nodes, retained / 1024, retained / nodes))
+    report('AST memory', ('program', 'nodes', 'retained KB', 'bytes/node'), rows)
+
+# re-parsing an unchanged source vs loading its tree from the AST cache
+def benchAstCache(n: str = '20000'):
+    text = synthetic(int(n)) + initializer(int(n))
+    with tempfile.TemporaryDirectory() as directory:
+        filename = f'{directory}/source.yan'
+        with open(filename, 'w') as file:
+            file.write(text)
+
+        cache = ASTCache(f'{directory}/cache')
+        parser = Parser(True)
+        rows = []
+
+        start = time.perf_counter()
+        tree = parser.parse(text)
+        rows.append(('parse', time.perf_counter() - start))
+
+        key = cache.key(filename)
+        start = time.perf_counter()
+        cache.store(key, tree)
+        rows.append(('store', time.perf_counter() - start))
+
+        start = time.perf_counter()
+        key = cache.key(filename)
+        cache.load(key)
+        rows.append(('hash + load', time.perf_counter() - start))
+
+        size = os.path.getsize(cache.path(key))
+    report(f'AST cache, {n} statements + {n} element initializer ({size // 1024} KB cached)', ('step', 'seconds'), rows)
+    print(cache.report())
+
+# code generation throughput (llvmlite IR building) on expression heavy code
+def benchCodegen(n: str = '5000', runs: str = '3'):
+    tree = Parser(True).parse(expressions(int(n)))
+    SemanticAnalyzer().analyze(tree)
+    nodes = sum(1 for node in astNodes(tree))
+    times = []
+    for _ in range(int(runs)):
+        compiler = Compiler()
+        start = time.perf_counter()
+        compiler.code_gen(tree)
+        times.append(time.perf_counter() - start)
+    report(f'code_gen, {n} statements', ('nodes', 'min seconds', 'nodes/sec'), [(nodes, min(times), nodes / min(times))])
+
+# seconds spent in each phase of main.py, lexing and parsing included in parse
+def benchPhases(n: str = '5000'):
+    def phases():
+        times = []
+
+        def timed(name, apply, value):
+            start = time.perf_counter()
+            result = apply(value)
+            times.append((name, time.perf_counter() - start))
+            return result
+
+        tree = timed('parse', Parser(True).parse, expressions(int(n)))
+        tree = timed('macros', expand, tree)
+        tree = timed('fold', fold, tree)
+        tree = timed('dce', eliminate, tree)
+        timed('semantic', SemanticAnalyzer().analyze, tree)
+        timed('codegen', Compiler().code_gen, tree)
+        return times
+
+    report(f'phases, {n} statements', ('phase', 'seconds'), measure(phases)[1])
+
+# code generation of deeply nested loops with many locals, and name lookups
+# through a chain of depth scopes (SymbolTable) vs a resolved slot (SlotTable)
+def benchNested(depth: str = '30', width: str = '10', runs: str = '3'):
+    tree = Parser(True).parse(nested(int(depth), int(width)))
+    SemanticAnalyzer().analyze(tree)
+    nodes = sum(1 for node in astNodes(tree))
+    times = []
+    for _ in range(int(runs)):
+        compiler = Compiler()
+        start = time.perf_counter()
+        compiler.code_gen(tree)
+        times.append(time.perf_counter() - start)
+    report(f'code_gen, loops nested {depth} deep, {width} locals each', ('nodes', 'min seconds', 'nodes/sec'), [(nodes, min(times), nodes / min(times))])
+
+    names = [ast.Identifier(f'v{i}') for i in range(int(width))]
+    chain = SymbolTable()
+    slots = SlotTable()
+    for slot, name in enumerate(names):
+        name.slot = slot
+        slots.define(name, slot)
+    chain.push_scope()
+    for name in names:
+        chain.define(name.name, name.slot)             # declared in the outermost scope
+    for _ in range(int(depth)):
+        chain.push_scope()
+
+    lookups = 100000
+    rows = []
+    for kind, lookUp, keys in (('scope chain', chain.lookUp, [name.name for name in names]), ('slot', slots.lookUp, names)):
+        start = time.perf_counter()
+        for _ in range(lookups // len(keys)):
+            for key in keys:
+                lookUp(key)
+        seconds = time.perf_counter() - start
+        rows.append((kind, seconds, lookups / seconds))
+    report(f'{lookups} lookups of outer variables, {depth} scopes deep', ('table', 'seconds', 'lookups/sec'), rows)
+
+# codegen (after the given AST passes), then llc and gcc. Returns
+# (passes + codegen seconds, IR bytes, llc seconds, binary bytes)
+def buildProgram(text, passes=()):
+    tree = Parser(True).parse(text)
+    start = time.perf_counter()
+    for apply in passes:
+        tree = apply(tree)
+    SemanticAnalyzer().analyze(tree)
+    compiler = Compiler()
+    compiler.code_gen(tree)
+    llvmIR = str(compiler.module)
+    seconds = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as directory:
+        with open(f'{directory}/bench.ll', 'w') as file:
+            file.write(llvmIR)
+        start = time.perf_counter()
+        subprocess.run(['llc', '-filetype=obj', f'{directory}/bench.ll', '-relocation-model=pic', '-o', f'{directory}/bench.o'], check=True)
+        llc = time.perf_counter() - start
+        subprocess.run(['gcc', f'{directory}/bench.o', '-o', f'{directory}/bench', '-fno-pie'], check=True)
+        binary = os.path.getsize(f'{directory}/bench')
+    return seconds, len(llvmIR), llc, binary
+
+def expand(tree):
+    return MacroExpander().expand(tree)
+
+def fold(tree):
+    return ConstantFolder().fold(tree)
+
+def eliminate(tree):
+    return DeadCodeEliminator().eliminate(tree)
+
+# IR building, IR size and llc time with and without constant folding
+def benchFold(n: str = '2000'):
+    rows = []
+    for name, passes in (('no folding', ()), ('folding', (fold,))):
+        seconds, size, llc, binary = measure(buildProgram, constants(int(n)), passes)[1]
+        rows.append((name, seconds, size // 1024, llc))
+    report(f'constant folding, {n} statements', ('mode', 'fold+codegen s', 'IR KB', 'llc s'), rows)
+
+# feature flag heavy code with and without dead code elimination
+def benchDeadCode(n: str = '2000'):
+    rows = []
+    for name, passes in (('fold', (fold,)), ('fold + dce', (fold, eliminate))):
+        seconds, size, llc, binary = measure(buildProgram, featureFlags(int(n)), passes)[1]
+        rows.append((name, seconds, size // 1024, llc, binary // 1024))
+    report(f'dead code elimination, {n} statements', ('passes', 'codegen s', 'IR KB', 'llc s', 'binary KB'), rows)
+
+# the same kernels with globals vs #define (expanded, then folded)
+def benchDefine(n: str = '1000'):
+    rows = []
+    for name, define in (('globals', False), ('#define', True)):
+        seconds, size, llc, binary = measure(buildProgram, kernels(int(n), define), (expand, fold))[1]
+        rows.append((name, seconds, size // 1024, llc))
+    report(f'compile time constants, {n} loops', ('constants', 'codegen s', 'IR KB', 'llc s'), rows)
+
+# compile a source like main.py does, at an -O level, in a temporary
+# directory, and run it. codegen overrides the level used for machine code.
+# Returns (best run seconds, allocas, loads) or None if it does not compile
+def runProgram(text, level='0', mem2reg=True, runs=3, codegen=None):
+    codegen = codegen or level
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        try:
+            tree = Parser(True).parse(text)
+            for apply in (expand, fold, eliminate):
+                tree = apply(tree)
+            if tree is None or SemanticAnalyzer().analyze(tree):
+                return None
+            compiler = Compiler()
+            compiler.code_gen(tree)
+        except Exception:
+            return None
+
+    with tempfile.TemporaryDirectory() as directory:
+        mod = compiler.optimize(level, mem2reg)
+        llvmIR = str(mod)
+        compiler.emitObject(mod, f'{directory}/bench.o', codegen)
+        subprocess.run(['gcc', f'{directory}/bench.o', '-o', f'{directory}/bench', '-fno-pie'], check=True)
+        times = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            subprocess.run([f'{directory}/bench'], stdout=subprocess.DEVNULL)
+            times.append(time.perf_counter() - start)
+    return min(times), llvmIR.count(' = alloca '), llvmIR.count(' = load ')
+
+# runtime of the test/ programs with locals in memory vs promoted to registers,
+# no other IR passes, machine code at -O2
+def benchMem2reg(pattern: str = 'test/*.yan'):
+    rows = []
+    for filename in sorted(glob.glob(pattern)):
+        with open(filename, 'r') as file:
+            text = file.read()
+        memory = measure(runProgram, text, '0', False, 3, '2')[1]
+        if memory is None:
+            continue
+        registers = measure(runProgram, text, '0', True, 3, '2')[1]
+        rows.append((os.path.basename(filename), memory[0], registers[0], f'{memory[1]} -> {registers[1]}', f'{memory[2]} -> {registers[2]}'))
+    report('mem2reg, programs that compile', ('program', 'memory s', 'mem2reg s', 'allocas', 'loads'), rows)
+
+# runtime of the test/ programs at each -O level
+def benchOptLevels(pattern: str = 'test/*.yan'):
+    levels = list(Compiler.optLevels)
+    rows = []
+    for filename in sorted(glob.glob(pattern)):
+        with open(filename, 'r') as file:
+            text = file.read()
+        times = [measure(runProgram, text, level)[1] for level in levels]
+        if None in times:
+            continue
+        rows.append((os.path.basename(filename), *[seconds for seconds, allocas, loads in times]))
+    report('runtime seconds per -O level, programs that compile', ('program', *[f'-O{level}' for level in levels]), rows)
+
+# seconds from a generated module to a linked binary, at -O0 without mem2reg.
+# text: the .ll printed, llc run on it, then gcc. in process: the object
+# emitted by the target machine, only gcc runs; with the listing written as
+# text .ll, as bitcode .bc, or not at all
+def backend(text, mode):
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        tree = Parser(True).parse(text)
+        for apply in (expand, fold, eliminate):
+            tree = apply(tree)
+        SemanticAnalyzer().analyze(tree)
+        compiler = Compiler()
+        compiler.code_gen(tree)
+        print(compiler.module)                      # as main.py does, the first print of a module is the slow one
+
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)                         # measure() forks, the parent keeps its directory
+        os.mkdir('build')
+        start = time.perf_counter()
+        if mode == 'llc':
+            with open('build/bench.ll', 'w') as file:
+                file.write(str(compiler.module))
+            subprocess.run(['llc', '-O0', '-opaque-pointers', '-filetype=obj', 'build/bench.ll', '-relocation-model=pic', '-o', 'build/bench.o'], check=True)
+            subprocess.run(['gcc', 'build/bench.o', '-o', 'bench', '-fno-pie'], check=True)
+        else:
+            compiler.generate_llvmIR('bench', mem2reg=False, level='0', listing=mode)
+        return time.perf_counter() - start
+
+def benchBackend(n: str = '3000'):
+    with open('test/test4.yan', 'r') as file:
+        hello = file.read()
+    programs = (('test4.yan', hello), (f'{n} statements', expressions(int(n))))
+    modes = (('llc + gcc', 'llc'), ('emit .ll', 'll'), ('emit .bc', 'bc'), ('emit, no IR', None))
+    rows = []
+    for name, text in programs:
+        rows.append((name, *[min(measure(backend, text, mode)[1] for _ in range(5)) for label, mode in modes]))
+    report('module to binary seconds, -O0 --no-mem2reg', ('program', *[label for label, mode in modes]), rows)
+
+# analyzed tree of a source
+def analyzed(text):
+    tree = Parser(True).parse(text)
+    for apply in (expand, fold, eliminate):
+        tree = apply(tree)
+    SemanticAnalyzer().analyze(tree)
+    return tree
+
+# seconds from an analyzed tree to a linked binary, and what the binary
+# prints. jobs 0 is the serial compiler, otherwise generateParallel
+def buildParallel(tree, jobs, level):
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)                         # measure() forks, the parent keeps its directory
+        os.mkdir('build')
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            if jobs:
+                generateParallel(tree, jobs, 'bench', level=level, listing=None)
+            else:
+                compiler = Compiler()
+                compiler.code_gen(tree)
+                compiler.generate_llvmIR('bench', level=level, listing=None)
+        seconds = time.perf_counter() - start
+        return seconds, subprocess.run(['./bench'], capture_output=True, text=True).stdout
+
+def benchParallel(n: str = '5000', level: str = '2'):
+    tree = analyzed(functions(int(n)))
+    serial, expected = measure(buildParallel, tree, 0, level)[1]
+    rows = [('serial', serial, 1.0, 'yes')]
+    for jobs in (1, 2, 4, 8):
+        seconds, output = measure(buildParallel, tree, jobs, level)[1]
+        rows.append((f'{jobs} workers', seconds, serial / seconds, 'yes' if output == expected else 'NO'))
+    report(f'parallel codegen, {n} functions, -O{level}, {os.cpu_count()} CPUs', ('build', 'seconds', 'speedup', 'same output'), rows)
+
+# seconds to link the binary after: a full serial build, a first incremental
+# build, one with nothing changed and one after editing a function. Each
+# row also has the units reused and rebuilt and what the binary prints
+def buildIncremental(text, edited, level):
+    tree, changed = analyzed(text), analyzed(edited)
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)                         # measure() forks, the parent keeps its directory
+        os.mkdir('build')
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            compiler = Compiler()
+            compiler.code_gen(tree)
+            compiler.generate_llvmIR('bench', level=level, listing=None)
+            rows.append(('serial', time.perf_counter() - start, '-', '-'))
+            for name, program in (('cold', tree), ('unchanged', tree), ('1 edit', changed)):
+                cache = ObjectCache(f'{directory}/obj')
+                start = time.perf_counter()
+                generateIncremental(program, 'bench', level=level, cache=cache)
+                rows.append((name, time.perf_counter() - start, cache.hits, cache.misses))
+        output = subprocess.run(['./bench'], capture_output=True, text=True).stdout
+    return rows, output
+
+def benchIncremental(n: str = '5000', level: str = '2'):
+    n = int(n)
+    text = functions(n)
+    edited = text.replace(f'function i32 f{n // 2}(i32 x){{\n    i32 a = x + SCALE;', f'function i32 f{n // 2}(i32 x){{\n    i32 a = x + SCALE + 1;')
+    rows, output = measure(buildIncremental, text, edited, level)[1]
+    expected = measure(buildParallel, analyzed(edited), 0, level)[1][1]
+    report(f'rebuild after editing 1 of {n} functions, -O{level}, output {"same" if output == expected else "DIFFERENT"}', ('build', 'seconds', 'reused', 'rebuilt'), rows)
+
+# seconds until main() of a program can be called: Compiler.JITExec's
+# steps (whole module, new engine, everything compiled), or a JITSession on
+# the cache directory, added to once (cold) or twice (again, the seconds of
+# the second time)
+def jitMain(text, mode, directory=None):
+    with contextlib.redirect_stdout(io.StringIO()):
+        try:
+            tree = analyzed(text)
+            start = time.perf_counter()
+            if mode == 'jitexec':
+                compiler = Compiler()
+                compiler.code_gen(tree)
+                mod = compiler.optimize('2')
+                machine = binding.Target.from_default_triple().create_target_machine(jit=True)
+                engine = binding.create_mcjit_compiler(mod, machine)
+                engine.finalize_object()
+                engine.get_function_address('main')
+                return time.perf_counter() - start
+            session = JITSession('2', cache=ObjectCache(directory))
+            session.add(tree)
+            session.address('main')
+            if mode == 'again':
+                start = time.perf_counter()
+                session.add(tree)
+                session.address('main')
+        except Exception:                           # codegen bugs of the older test programs
+            return None
+    return time.perf_counter() - start
+
+# JIT compile latency of the test/ programs: JITExec, a session with an
+# empty cache, a new session (process) with the cache filled, and the same
+# program added again to a live session
+def benchJIT(pattern: str = 'test/*.yan'):
+    rows = []
+    for filename in sorted(glob.glob(pattern)):
+        with open(filename, 'r') as file:
+            text = file.read()
+        jitexec = measure(jitMain, text, 'jitexec')[1]
+        if jitexec is None:
+            continue
+        with tempfile.TemporaryDirectory() as directory:
+            cold = measure(jitMain, text, 'cold', directory)[1]
+            warm = measure(jitMain, text, 'cold', directory)[1]
+            again = measure(jitMain, text, 'again', directory)[1]
+        rows.append((os.path.basename(filename), *[seconds * 1000 for seconds in (jitexec, cold, warm, again)]))
+    report('ms until main() can be called, programs that compile', ('program', 'JITExec', 'session cold', 'cached', 'same session'), rows)
+
+# IR of a source, None if it does not compile
+def compileIR(text):
+    try:
+        tree = analyzed(text)
+        compiler = Compiler()
+        compiler.code_gen(tree)
+    except Exception:                               # codegen bugs of the older test programs
+        return None
+    return str(compiler.module) if compiler.success else None
+
+# compiles every test/ program, and a few generated ones, copies times: one after the other in one
+# process, from a thread pool and from a process pool. Every compilation of
+# a program must give the IR of the first
+def checkReentrant(pattern: str = 'test/*.yan', copies: str = '4'):
+    programs = [(filename, open(filename).read()) for filename in sorted(glob.glob(pattern))]
+    programs += [('functions(50)', functions(50)), ('expressions(300)', expressions(300)), ('featureFlags(100)', featureFlags(100))]
+    filenames = [filename for filename, text in programs] * int(copies)
+    texts = [text for filename, text in programs] * int(copies)
+    with contextlib.redirect_stdout(io.StringIO()):     # process wide, so not inside the threads
+        serial = [compileIR(text) for text in texts]
+        with ThreadPoolExecutor(8) as pool:
+            threads = list(pool.map(compileIR, texts))
+        with ProcessPoolExecutor(4) as pool:
+            processes = list(pool.map(compileIR, texts))
+
+    first = {}
+    results = {}
+    for filename, *irs in zip(filenames, serial, threads, processes):
+        first.setdefault(filename, irs[0])
+        results.setdefault(filename, set()).update(ir == first[filename] for ir in irs)
+    different = [filename for filename, same in results.items() if same != {True}]
+    for filename, same in results.items():
+        status = 'does not compile' if first[filename] is None else 'DIFFERENT' if filename in different else 'identical'
+        print(f'{filename:24} {status}')
+    if different:
+        sys.exit(f'(reentrant) {len(different)} of {len(results)} programs compiled to different IR')
+
+# median ms per compile of small test/ programs: a new python main.py
+# process each time, and yanc.py forwarding to a running compile server
+def benchServer(runs: str = '10'):
+    programs = ('test4.yan', 'define.yan', 'loops.yan', 'stack.yan')
+    commands = (('cold', [sys.executable, 'main.py']), ('server', [sys.executable, 'yanc.py']))
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        env = dict(os.environ, YANC_SOCKET=f'{directory}/yanc.sock')
+        server = subprocess.Popen([sys.executable, 'yanc.py', '--serve'], env=env, stdout=subprocess.PIPE, text=True)
+        server.stdout.readline()                    # listening
+        try:
+            for program in programs:
+                medians = []
+                for name, command in commands:
+                    times = []
+                    for _ in range(int(runs)):
+                        start = time.perf_counter()
+                        subprocess.run([*command, program, '-o', 'benchserver'], env=env, stdout=subprocess.DEVNULL, check=True)
+                        times.append(time.perf_counter() - start)
+                    medians.append(sorted(times)[len(times) // 2] * 1000)
+                rows.append((program, *medians, medians[0] / medians[1]))
+        finally:
+            subprocess.run([sys.executable, 'yanc.py', '--stop'], env=env, stdout=subprocess.DEVNULL)
+            server.wait()
+            for path in glob.glob('build/benchserver.*') + ['benchserver']:
+                if os.path.exists(path):
+                    os.remove(path)
+    report(f'ms per compile, median of {runs}', ('program', 'cold', 'server', 'speedup'), rows)
+
+benchmarks = {
+    'tokens': benchTokens,
+    'lexstart': benchLexStart,
+    'parsestart': benchParseStart,
+    'parsescale': benchParseScale,
+    'rdparse': benchRDParse,
+    'rdcheck': checkRDParse,
+    'astmemory': benchAstMemory,
+    'astcache': benchAstCache,
+    'codegen': benchCodegen,
+    'nested': benchNested,
+    'phases': benchPhases,
+    'fold': benchFold,
+    'deadcode': benchDeadCode,
+    'define': benchDefine,
+    'mem2reg': benchMem2reg,
+    'optlevels': benchOptLevels,
+    'backend': benchBackend,
+    'parallel': benchParallel,
+    'incremental': benchIncremental,
+    'jit': benchJIT,
+    'reentrant': checkReentrant,
+    'server': benchServer,
+}
+
+if __name__=='__main__':
+    if len(sys.argv) > 1 and sys.argv[1] in benchmarks:
+        benchmarks[sys.argv[1]](*sys.argv[2:])
+    else:
+        print(f'usage: benchmark.py [{"|".join(benchmarks)}] [args]')
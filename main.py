@@ -1,46 +1,272 @@
+import contextlib
+import cProfile
+import glob
+import io
+import os
+import subprocess
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from src.lexer.lexer import Lexer
 from src.parser.parser import Parser
+from src.parser.rdparser import RDParser
 from src.compiler.compiler import Compiler
+from src.compiler.parallel import generateParallel
+from src.compiler.incremental import generateIncremental
+from src.compiler.jit import JITSession
+from src.cache.cache import ASTCache, ObjectCache
+from src.semantic.semantic import SemanticAnalyzer
+from src.optimizer.optimizer import MacroExpander, ConstantFolder, DeadCodeEliminator
+from src.profiler.profiler import PhaseTimer, NodeProfiler
 
 def lex(line):
     lexer = Lexer()
     tokenize = lexer.tokenize(line)
     print(tokenize)
 
-def pars(line):
-    parser = Parser()
-    ast = parser.parser.parse(line, lexer=parser.lexer.lexer)
+def getParser(fast: bool = False, rd: bool = False):
+    if rd:                      # hand-written recursive-descent backend
+        return RDParser(fast)
+    return Parser(fast)
+
+def pars(line, compact: bool = False, fast: bool = False, rd: bool = False, parser=None):
+    parser = parser or getParser(fast, rd)
+    if compact:                 # array-backed token buffer
+        ast = parser.parse_compact(line)
+    else:
+        ast = parser.parse(line)
     return ast
 
-def main(filename: str):
+# streaming mode: tokens are lexed lazily from the mmap'd file
+def parsFile(filename, fast: bool = False, rd: bool = False, parser=None):
+    parser = parser or getParser(fast, rd)
+    ast = parser.parse_file(filename)
+    return ast
+
+# returns (ast, number of lexer and syntax errors)
+def parseSource(filename, stream: bool = False, compact: bool = False, fast: bool = False, rd: bool = False):
+    parser = getParser(fast, rd)
+    if stream:
+        ast = parsFile(filename, parser=parser)
+    else:
+        with open(filename, 'r') as file:
+            text = file.read()
+            #lex(text)
+            ast = pars(text, compact, parser=parser)
+    return ast, parser.errors + parser.lexer.errors
+
+def main(filename: str, stream: bool = False, compact: bool = False, fast: bool = False, rd: bool = False, cache: bool = True, fold: bool = True, dce: bool = True, mem2reg: bool = True, level: str = '0', listing: str = 'll', jobs: int = 1, incremental: bool = False, jit: bool = False, objname: str = 'main', timer: PhaseTimer = None, nodes: NodeProfiler = None):
     compiler = Compiler()
     #compiler.createMain()
+    timer = compiler.timer = timer or compiler.timer
+    if nodes:
+        nodes.attach(compiler)
 
-    with open(filename, 'r') as file:
-        text = file.read()
-        #lex(text)
-        ast = pars(text)
+    # unchanged sources skip lexing and parsing
+    errors = 0
+    if cache:
+        astCache = ASTCache()
+        with timer.phase('ast cache'):
+            key = astCache.key(filename)
+            ast = astCache.load(key)
+        if ast is None:
+            with timer.phase('parse'):
+                ast, errors = parseSource(filename, stream, compact, fast, rd)
+            if ast is not None and not errors:      # recovered trees are not cached
+                with timer.phase('ast cache store'):
+                    astCache.store(key, ast)
+        print(astCache.report())
+    else:
+        with timer.phase('parse'):
+            ast, errors = parseSource(filename, stream, compact, fast, rd)
+
+    # nothing to compile, the errors were printed
+    if ast is None or errors:
+        return
+
+    # #define substitution, not an optimization so it always runs
+    with timer.phase('macros'):
+        ast = MacroExpander().expand(ast)
+
+    # constant folding and const propagation
+    if fold:
+        with timer.phase('fold'):
+            ast = ConstantFolder().fold(ast)
+
+    # dead branches, code after return, functions main() never calls
+    if dce:
+        with timer.phase('dce'):
+            ast = DeadCodeEliminator().eliminate(ast)
+    with timer.phase('print ast'):
         print(ast)
+
+    # resolve names and type every expression, codegen reads the types
+    with timer.phase('semantic'):
+        errors = SemanticAnalyzer().analyze(ast)
+    for error in errors:
+        print(error)
+    if errors:
+        return
+
+    # run main() in a JIT session, compiled objects are cached on disk
+    if jit:
+        with timer.phase('jit'):
+            session = JITSession(level, mem2reg)
+            if session.add(ast):
+                session.run()
+        print(session.cache.report())
+        return
+
+    # every function its own cached object, only changed ones are compiled
+    if incremental:
+        objectCache = ObjectCache()
+        with timer.phase('incremental build'):
+            generateIncremental(ast, objname, mem2reg=mem2reg, level=level, jobs=jobs, cache=objectCache)
+        print(objectCache.report())
+        return
+
+    # functions generated and compiled by a pool of worker processes
+    if jobs > 1:
+        with timer.phase('parallel build'):
+            generateParallel(ast, jobs, objname, mem2reg=mem2reg, level=level, listing=listing)
+        return
+
+    with timer.phase('codegen'):
         compiler.code_gen(ast)
-        
-        # print module
+
+    # print module
+    with timer.phase('print IR'):
         print(f'{compiler.module}\n\n')
 
-        # JIT compile execution
-        if compiler.success:
-            compiler.generate_llvmIR()
-            #compiler.JITExec()
-            pass
+    # JIT compile execution
+    if compiler.success:
+        compiler.generate_llvmIR(objname, mem2reg=mem2reg, level=level, listing=listing)
+        #compiler.JITExec()
+        pass
 
-if __name__=='__main__':
-    count = len(sys.argv)
-    if count > 1:
-        filename = sys.argv[1]
+# lex the source on its own, the parser lexes as it parses so this is only
+# to see the share of lexing in parse (--time-report). Uses the tokenizer
+# of the parse path that ran, nothing when the tree came from the AST cache
+def timeLexing(filename, timer: PhaseTimer, stream: bool = False, compact: bool = False, fast: bool = False, rd: bool = False, **options):
+    if not any(name == 'parse' for name, wall, cpu in timer.phases):
+        return
+    lexer = Lexer(fast)
+    if stream and not rd:                   # the recursive-descent parser reads the file whole
+        with timer.phase('(lex, in parse)'):
+            for token in lexer.tokenize_file(filename):
+                pass
+        return
+
+    with open(filename, 'r') as file:
+        text = file.read()
+    tokenize = lexer.tokenize_compact if compact or rd else lexer.tokenize
+    with timer.phase('(lex, in parse)'):
+        tokenize(text)
+
+# sources of a batch: files, and the .yan files of directories
+def batchSources(paths):
+    sources = []
+    for path in paths:
+        if os.path.isdir(path):
+            sources += sorted(glob.glob(os.path.join(path, '*.yan')))
+        else:
+            sources.append(path)
+    return sources
+
+# output name of every source, its file name without .yan, or its whole
+# path joined by _ when two sources share a file name
+def batchNames(sources):
+    names = [os.path.splitext(os.path.basename(source))[0] for source in sources]
+    return [name if names.count(name) == 1 else os.path.splitext(os.path.relpath(source))[0].replace(os.sep, '_').strip('._') for source, name in zip(sources, names)]
+
+# one file of a batch, in a worker. Returns (seconds, binary or None, the
+# first error printed, or the last line)
+def batchFile(source, name, outdir, options):
+    os.chdir(outdir)                            # the worker's own directory, build/ is under it
+    if os.path.isfile(name):
+        os.remove(name)
+    output = io.StringIO()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):     # gcc's diagnostics too
+        try:
+            main(filename=source, objname=name, **options)
+        except subprocess.CalledProcessError as error:
+            ld = [line for line in (error.stderr or '').splitlines() if not line.startswith('collect2')]
+            print(f'(link) failed: {ld[-1] if ld else error}')
+        except Exception as error:
+            print(f'(error) {error.__class__.__name__}: {error}')
+    seconds = time.perf_counter() - start
+    lines = output.getvalue().strip().splitlines()
+    errors = [line for line in lines if line.startswith(('(lexer)', '(parser)', '(semantic)', '(link)', '(error)'))]
+    return seconds, os.path.join(outdir, name) if os.path.isfile(name) else None, errors[0] if errors else lines[-1] if lines else ''
+
+# compile many sources, jobs at a time, each into <outdir>/<name> with its
+# objects and IR in <outdir>/build. Prints a line per file as it finishes
+def batch(paths, jobs=1, outdir='build/batch', options={}):
+    sources = list(dict.fromkeys(os.path.abspath(source) for source in batchSources(paths)))     # once each
+    names = batchNames(sources)
+    outdir = os.path.abspath(outdir)
+    os.makedirs(os.path.join(outdir, 'build'), exist_ok=True)
+
+    start = time.perf_counter()
+    failed = 0
+    with ProcessPoolExecutor(jobs) as pool:
+        futures = {pool.submit(batchFile, source, name, outdir, options): source for source, name in zip(sources, names)}
+        for done, future in enumerate(as_completed(futures), 1):
+            source = os.path.relpath(futures[future])
+            seconds, binary, message = future.result()
+            if binary:
+                print(f'[{done}/{len(sources)}] {source:28} {seconds:6.2f}s  {os.path.relpath(binary)}')
+            else:
+                failed += 1
+                print(f'[{done}/{len(sources)}] {source:28} {seconds:6.2f}s  FAILED {message[:60]}')
+    print(f'{len(sources) - failed} built, {failed} failed, {time.perf_counter() - start:.2f}s with -j{jobs}')
+
+# command line, also what the compile server (yanc.py) runs for each request
+def cli(argv):
+    objnames = [argv[i + 1] for i, arg in enumerate(argv[:-1]) if arg == '-o']     # -o name, the binary
+    args = [arg for i, arg in enumerate(argv) if not arg.startswith('-') and (i == 0 or argv[i - 1] != '-o')]
+    flags = [arg for arg in argv if arg.startswith('--')]
+    levels = [arg[2:] for arg in argv if arg.startswith('-O')]      # -O0 .. -O3, -Os
+    level = levels[-1] if levels else '0'           # SROA only, the other levels are opt-in
+    jobs = [arg[2:] for arg in argv if arg.startswith('-j')]        # -j4, parallel codegen, files at a time with --batch
+    jobs = int(jobs[-1]) if jobs and jobs[-1].isdigit() else 1
+    listing = 'bc' if '--bc' in flags else None if '--no-ir' in flags else 'll'
+    options = dict(stream='--stream' in flags, compact='--compact' in flags, fast='--fast' in flags, rd='--rd' in flags, cache='--no-cache' not in flags, fold='--no-fold' not in flags, dce='--no-dce' not in flags, mem2reg='--no-mem2reg' not in flags, level=level, listing=listing, incremental='--incremental' in flags, jit='--jit' in flags)
+    if level not in Compiler.optLevels:
+        print(f'unknown optimization level -O{level}, use -O0, -O1, -O2, -O3 or -Os')
+    elif '--batch' in flags and args:
+        # sources and directories as given, -o is the output directory
+        batch(args, jobs, objnames[-1] if objnames else 'build/batch', options)
+    elif args:
+        filename = args[0]
         filename = f'test/{filename}'
+        objname = objnames[-1] if objnames else 'main'
+        timer = PhaseTimer()
+        nodes = NodeProfiler() if '--time-report' in flags else None
+        profile = cProfile.Profile() if '--profile' in flags else None
         try:
-            main(filename=filename)
+            if profile:
+                profile.enable()
+            main(filename=filename, jobs=jobs, objname=objname, timer=timer, nodes=nodes, **options)
         except FileNotFoundError:
             print(f"File Not Found Error: Bith what the heck is {filename}")
+            return
+        finally:
+            if profile:
+                profile.disable()
+
+        # where the compile time went: phases and codegen per node type, and
+        # a pstats file (python -m pstats build/main.prof)
+        if nodes:
+            timeLexing(filename, timer, **options)
+            print(timer.report())
+            print(nodes.report())
+        if profile:
+            profile.dump_stats(f'build/{objname}.prof')
+            print(f'(profile) build/{objname}.prof')
     else:
         print("no file")
+
+if __name__=='__main__':
+    cli(sys.argv[1:])
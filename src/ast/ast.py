@@ -1,8 +1,39 @@
+# a source span packed into one int: the offset in the high bits, the line
+# in the low 32. The empty span (line 0, offset -1) round trips too
+def packSpan(lineno, lexpos):
+    return lexpos << 32 | lineno
 
+NOSPAN = packSpan(0, -1)
+
+# nodes are slotted, no per-instance __dict__
 class ASTnode:
-    pass
+    # span is the packed source span of the first token, set by the parsers
+    # (Parser.span / RDParser.span), passes that build nodes copy it over.
+    # vtype is the static type of an expression ('i32', 'str', 'i32*', ...)
+    # and slot the declaration an Identifier resolves to, both set by the
+    # semantic pass and not pickled
+    __slots__ = ('span', 'vtype', 'slot')
+
+    @property
+    def lineno(self):
+        return self.span & 0xFFFFFFFF
+
+    @property
+    def lexpos(self):
+        return self.span >> 32
+
+    # pickled as one flat tuple of slot values (AST cache), not a dict per node
+    def __getstate__(self):
+        return (getattr(self, 'span', NOSPAN),) + tuple([getattr(self, name) for name in self.__slots__])
+
+    def __setstate__(self, state):
+        self.span = state[0]
+        for name, value in zip(self.__slots__, state[1:]):
+            setattr(self, name, value)
 
 class Number(ASTnode):
+    __slots__ = ('value', '_float')
+
     def __init__(self, value, _float=False):
         self.value = value
         self._float = _float
@@ -11,6 +42,8 @@ class Number(ASTnode):
         return f"Number({self.value}, {self._float})"
     
 class String(ASTnode):
+    __slots__ = ('value',)
+
     def __init__(self, value):
         self.value = value
 
@@ -18,6 +51,8 @@ class String(ASTnode):
         return f"String({self.value})"
     
 class Character(ASTnode):
+    __slots__ = ('value',)
+
     def __init__(self, value):
         self.value = value
 
@@ -25,6 +60,8 @@ class Character(ASTnode):
         return f"Character({self.value})"
     
 class Bool(ASTnode):
+    __slots__ = ('value',)
+
     def __init__(self, value):
         self.value = value
 
@@ -32,6 +69,8 @@ class Bool(ASTnode):
         return f"Bool({self.value})"
 
 class Identifier(ASTnode):
+    __slots__ = ('name',)
+
     def __init__(self, name):
         self.name = name
 
@@ -39,6 +78,8 @@ class Identifier(ASTnode):
         return f"Identifier({self.name})"
 
 class BinaryOp(ASTnode):
+    __slots__ = ('op', 'left', 'right')
+
     def __init__(self, op, left, right):
         self.op = op
         self.left = left
@@ -48,6 +89,8 @@ class BinaryOp(ASTnode):
         return f"BinaryOp({self.op}, {self.left}, {self.right})"
     
 class CompareOp(ASTnode):
+    __slots__ = ('op', 'left', 'right')
+
     def __init__(self, op, left, right):
         self.op = op                        # ==, !=, <, <=, >, >=
         self.left = left
@@ -57,6 +100,8 @@ class CompareOp(ASTnode):
         return f"CompareOp({self.op}, {self.left}, {self.right})"
 
 class LogicalOp(ASTnode):
+    __slots__ = ('log', 'left', 'right')
+
     def __init__(self, log, left, right):
         self.log = log                      # and, or, not
         self.left = left
@@ -67,6 +112,8 @@ class LogicalOp(ASTnode):
 
 # statement nodes
 class Assign(ASTnode):
+    __slots__ = ('name', 'value', 'type', 'const')
+
     def __init__(self, name, value, _type=None, const=False):
         self.name = name        # name
         self.value = value      # value
@@ -77,13 +124,27 @@ class Assign(ASTnode):
         return f"Assign({self.name}, {self.value}, {self.type}, {self.const})"
 
 class Program(ASTnode):
+    __slots__ = ('statement',)
+
     def __init__(self, statement):
         self.statement = statement
 
     def __repr__(self):
         return f"Program(\n{self.statement}\n)"
     
+# statements in their own scope, left where a dead branch was inlined
+class Block(ASTnode):
+    __slots__ = ('statement',)
+
+    def __init__(self, statement):
+        self.statement = statement
+
+    def __repr__(self):
+        return f"Block(\n{self.statement}\n)"
+
 class Write(ASTnode):
+    __slots__ = ('expr',)
+
     def __init__(self, expr):
         self.expr = expr # string literal or expression
 
@@ -91,6 +152,8 @@ class Write(ASTnode):
         return f"Write({self.expr})"
 
 class Read(ASTnode):
+    __slots__ = ('expr',)
+
     def __init__(self, expr):
         self.expr = expr
 
@@ -98,6 +161,8 @@ class Read(ASTnode):
         return f"Read({self.expr})"
 
 class IfStatement(ASTnode):
+    __slots__ = ('condition', 'then_branch', 'elseif_branch', 'else_branch')
+
     def __init__(self, condition, then_branch, elseif_branch, else_branch=None):
         self.condition = condition
         self.then_branch = then_branch
@@ -108,6 +173,8 @@ class IfStatement(ASTnode):
         return f"IfStatement({self.condition}, {self.then_branch}, {self.elseif_branch}, {self.else_branch})"
 
 class ElseIfStatement(ASTnode):
+    __slots__ = ('condition', 'then_branch')
+
     def __init__(self, condition, then_branch):
         self.condition = condition
         self.then_branch = then_branch
@@ -116,6 +183,8 @@ class ElseIfStatement(ASTnode):
         return f"ElseIfStatement({self.condition}, {self.then_branch})"
 
 class ElseStatement(ASTnode):
+    __slots__ = ('then_branch',)
+
     def __init__(self, then_branch):
         self.then_branch = then_branch
 
@@ -124,6 +193,8 @@ class ElseStatement(ASTnode):
 
 # for Loop 
 class ForLoop(ASTnode):
+    __slots__ = ('exp1', 'exp2', 'exp3', 'block')
+
     def __init__(self, exp1, exp2, exp3, block):
         self.exp1 = exp1
         self.exp2 = exp2
@@ -135,6 +206,8 @@ class ForLoop(ASTnode):
 
 # while loop
 class WhileLoop(ASTnode):
+    __slots__ = ('condition', 'block')
+
     def __init__(self, condition, block):
         self.condition = condition
         self.block = block
@@ -144,6 +217,8 @@ class WhileLoop(ASTnode):
 
 # do while loop
 class doWhileLoop(ASTnode):
+    __slots__ = ('condition', 'block')
+
     def __init__(self, condition, block):
         self.condition = condition
         self.block = block
@@ -152,6 +227,8 @@ class doWhileLoop(ASTnode):
         return f"doWhileLoop({self.condition}, {self.block})"
 
 class Struct(ASTnode):
+    __slots__ = ('name', 'block')
+
     def __init__(self, name, block):
         self.name = name
         self.block = block
@@ -160,6 +237,8 @@ class Struct(ASTnode):
         return f"Struct({self.name}, {self.block})"
 
 class Enum(ASTnode):
+    __slots__ = ('name', 'block')
+
     def __init__(self, name, block: list):
         self.name = name
         self.block = block
@@ -167,6 +246,8 @@ class Enum(ASTnode):
     def __repr__(self):
         return f"Enum({self.name}, {self.block})"
 class EnumVal(ASTnode):
+    __slots__ = ('name', 'value')
+
     def __init__(self, name, value:int = 0):
         self.name = name
         self.value = value
@@ -176,6 +257,8 @@ class EnumVal(ASTnode):
 
 # Arrays
 class Array(ASTnode):
+    __slots__ = ('_type', 'size')
+
     def __init__(self, _type=None, size: int=0):
         self._type = _type
         self.size = size
@@ -184,6 +267,8 @@ class Array(ASTnode):
         return f"Array({self._type}, {self.size})"
 
 class getArray(ASTnode):
+    __slots__ = ('name', 'index')
+
     def __init__(self, name, index):
         self.name = name
         self.index = index
@@ -193,6 +278,8 @@ class getArray(ASTnode):
 
 # group
 class Group(ASTnode):
+    __slots__ = ('value',)
+
     def __init__(self, value):
         self.value = value
 
@@ -200,6 +287,8 @@ class Group(ASTnode):
         return f"Group({self.value})"
 
 class Function(ASTnode):
+    __slots__ = ('name', '_type', 'args', 'block')
+
     def __init__(self, name, _type, args, block):
         self.name = name
         self._type = _type
@@ -210,6 +299,8 @@ class Function(ASTnode):
         return f"Function({self.name}, {self._type}, {self.args}, {self.block})"
 
 class FunctionCall(ASTnode):
+    __slots__ = ('name', 'args')
+
     def __init__(self, name, args):
         self.name = name
         self.args = args
@@ -218,6 +309,8 @@ class FunctionCall(ASTnode):
         return f"FunctionCall({self.name}, {self.args})"
 
 class Return(ASTnode):
+    __slots__ = ('value',)
+
     def __init__(self, value):
         self.value = value
 
@@ -225,6 +318,8 @@ class Return(ASTnode):
         return f"Return({self.value})"
 
 class ControlFlow(ASTnode):
+    __slots__ = ('name',)
+
     def __init__(self, name):
         self.name = name
 
@@ -232,6 +327,8 @@ class ControlFlow(ASTnode):
         return f"ControlFlow({self.name})"
 
 class Access(ASTnode):
+    __slots__ = ('left', 'right')
+
     def __init__(self, left, right):
         self.left = left
         self.right = right
@@ -240,6 +337,8 @@ class Access(ASTnode):
         return f"Access({self.left}, {self.right})"
 
 class Class(ASTnode):
+    __slots__ = ('name', 'block')
+
     def __init__(self, name, block):
         self.name = name
         self.block = block
@@ -248,6 +347,8 @@ class Class(ASTnode):
         return f"Class({self.name}, {self.block})"
 
 class Define(ASTnode):
+    __slots__ = ('name', 'value')
+
     def __init__(self, name, value):
         self.name = name
         self.value = value
@@ -256,6 +357,8 @@ class Define(ASTnode):
         return f"Define({self.name}, {self.value})"
 
 class Include(ASTnode):
+    __slots__ = ('packageName',)
+
     def __init__(self, packageName):
         self.packageName = packageName
 
@@ -263,6 +366,8 @@ class Include(ASTnode):
         return f"Include({self.packageName})"
 
 class Pointer(ASTnode):
+    __slots__ = ('name',)
+
     def __init__(self, name):
         self.name = name
 
@@ -270,6 +375,8 @@ class Pointer(ASTnode):
         return f"Pointer({self.name})"
 
 class Reference(ASTnode):
+    __slots__ = ('name',)
+
     def __init__(self, name):
         self.name = name
 
@@ -0,0 +1,102 @@
+from src.ast import ast
+
+# field values of a node, in __slots__ order (the span slots are not fields)
+def fields(node: ast.ASTnode):
+    return [getattr(node, name) for name in node.__slots__]
+
+# generic AST walk. visit() looks the handler up in a per-class dispatch
+# table keyed by the exact node class, so a node costs one dict lookup no
+# matter how many node types the visitor handles.
+#
+# handlers are found, for the node class and then its bases, in:
+#   visitors  - {node class: function(self, node)} declared on the visitor
+#   visit_<ClassName> methods
+# anything else (including lists and None) goes to generic_visit
+class NodeVisitor:
+
+    visitors = {}
+    dispatch = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.dispatch = {}                   # per visitor class, filled lazily
+
+    def visit(self, node):
+        handler = self.dispatch.get(node.__class__)
+        if handler is None:
+            handler = self.resolve(node.__class__)
+        return handler(self, node)
+
+    @classmethod
+    def resolve(cls, nodeClass):
+        handler = None
+        for base in nodeClass.__mro__:
+            handler = cls.visitors.get(base) or getattr(cls, f'visit_{base.__name__}', None)
+            if handler is not None:
+                break
+        cls.dispatch[nodeClass] = handler or cls.generic_visit
+        return cls.dispatch[nodeClass]
+
+    # visit every child node
+    def generic_visit(self, node):
+        if isinstance(node, list):
+            for item in node:
+                self.visit(item)
+        elif isinstance(node, ast.ASTnode):
+            for value in fields(node):
+                if isinstance(value, (ast.ASTnode, list)):
+                    self.visit(value)
+
+# visitor that rebuilds the tree: every field is replaced by what visiting
+# it returns. In a list, a None result drops the item and a list result is
+# spliced in its place
+class NodeTransformer(NodeVisitor):
+
+    def generic_visit(self, node):
+        if isinstance(node, list):
+            return self.visitList(node)
+        if isinstance(node, ast.ASTnode):
+            for name in node.__slots__:
+                value = getattr(node, name)
+                if isinstance(value, list):
+                    setattr(node, name, self.visitList(value))
+                elif isinstance(value, ast.ASTnode):
+                    setattr(node, name, self.visit(value))
+        return node
+
+    def visitList(self, nodes):
+        result = []
+        for item in nodes:
+            item = self.visit(item) if isinstance(item, ast.ASTnode) else item
+            if item is None:
+                continue
+            if isinstance(item, list):
+                result.extend(item)
+            else:
+                result.append(item)
+        return result
+
+# names a subtree refers to: the functions it calls, the identifiers it
+# uses and the types it declares variables with
+class References(NodeVisitor):
+
+    def __init__(self):
+        self.calls = set()
+        self.names = set()
+        self.types = set()
+
+    def collect(self, node):
+        self.visit(node)
+        return self
+
+    def visit_FunctionCall(self, node: ast.FunctionCall):
+        self.calls.add(node.name)
+        self.generic_visit(node)
+
+    def visit_Identifier(self, node: ast.Identifier):
+        self.names.add(node.name)
+
+    def visit_Assign(self, node: ast.Assign):
+        if isinstance(node.type, str):
+            self.types.add(node.type)
+        self.generic_visit(node)
@@ -0,0 +1,154 @@
+import gc
+import hashlib
+import os
+import pickle
+import shutil
+
+import llvmlite
+import ply
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# the files that decide what tree a source parses into, editing any of them
+# (or updating PLY) invalidates every cached AST
+GRAMMAR_FILES = ('ast/ast.py', 'lexer/lexer.py', 'lexer/lextab.py', 'parser/parser.py', 'parser/rdparser.py')
+
+# on disk cache of parsed ast.Program trees
+# build/.cache/ast/<grammar stamp>/<source hash>.ast, pickled (binary)
+class ASTCache:
+
+    stamp = None
+
+    def __init__(self, directory='build/.cache/ast'):
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def grammarStamp(cls):
+        if cls.stamp is None:
+            digest = hashlib.sha256(ply.__version__.encode())
+            for name in GRAMMAR_FILES:
+                with open(os.path.join(ROOT, name), 'rb') as file:
+                    digest.update(file.read())
+            cls.stamp = digest.hexdigest()[:16]
+        return cls.stamp
+
+    def path(self, key):
+        return os.path.join(self.directory, self.grammarStamp(), f'{key}.ast')
+
+    # content hash of a source file
+    def key(self, filename):
+        with open(filename, 'rb') as file:
+            return hashlib.file_digest(file, 'sha256').hexdigest()
+
+    # cached tree or None
+    def load(self, key):
+        collect = gc.isenabled()
+        gc.disable()                    # unpickling only allocates, no cycles to collect
+        try:
+            with open(self.path(key), 'rb') as file:
+                tree = pickle.load(file)
+        except Exception:               # unreadable, truncated or from older classes: a miss
+            self.misses += 1
+            return None
+        finally:
+            if collect:
+                gc.enable()
+        self.hits += 1
+        return tree
+
+    def store(self, key, tree):
+        path = self.path(key)
+        if not os.path.isdir(os.path.dirname(path)):
+            self.prune()
+
+        try:
+            data = pickle.dumps(tree, protocol=pickle.HIGHEST_PROTOCOL)
+        except RecursionError:          # very deep expression, just don't cache it
+            return
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp = f'{path}.{os.getpid()}'
+        with open(temp, 'wb') as file:
+            file.write(data)
+        os.replace(temp, path)          # atomic, readers never see half a file
+
+    # drop trees cached by other grammar versions
+    def prune(self):
+        if not os.path.isdir(self.directory):
+            return
+        for name in os.listdir(self.directory):
+            if name != self.grammarStamp():
+                shutil.rmtree(os.path.join(self.directory, name), ignore_errors=True)
+
+    def report(self):
+        return f'(cache) ast {self.hits} hit, {self.misses} miss'
+
+# the files that decide what code a function compiles to: the nodes, their
+# dispatch, the passes and how a unit is cut out of the program and
+# compiled. Editing any of them invalidates every cached object
+COMPILER_FILES = (
+    'ast/ast.py',
+    'ast/visitor.py',
+    'semantic/semantic.py',
+    'compiler/compiler.py',
+    'compiler/parallel.py',
+    'compiler/incremental.py',
+    'compiler/jit.py',
+)
+
+# on disk cache of compiled objects, one per function (see src/compiler/incremental.py)
+# build/.cache/obj/<compiler stamp>/<fingerprint>.o
+class ObjectCache:
+
+    stamp = None
+
+    def __init__(self, directory='build/.cache/obj'):
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def compilerStamp(cls):
+        if cls.stamp is None:
+            digest = hashlib.sha256(llvmlite.__version__.encode())
+            for name in COMPILER_FILES:
+                with open(os.path.join(ROOT, name), 'rb') as file:
+                    digest.update(file.read())
+            cls.stamp = digest.hexdigest()[:16]
+        return cls.stamp
+
+    def path(self, key):
+        return os.path.join(self.directory, self.compilerStamp(), f'{key}.o')
+
+    # path of the cached object or None
+    def lookUp(self, key):
+        path = self.path(key)
+        if os.path.isfile(path):
+            self.hits += 1
+            return path
+        self.misses += 1
+        return None
+
+    # where to write a new object, moved in place by store()
+    def temp(self, key):
+        path = self.path(key)
+        if not os.path.isdir(os.path.dirname(path)):
+            self.prune()
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        return f'{path}.{os.getpid()}'
+
+    def store(self, key, temp):
+        os.replace(temp, self.path(key))    # atomic, readers never see half a file
+
+    # drop objects cached by other compiler versions
+    def prune(self):
+        if not os.path.isdir(self.directory):
+            return
+        for name in os.listdir(self.directory):
+            if name != self.compilerStamp():
+                shutil.rmtree(os.path.join(self.directory, name), ignore_errors=True)
+
+    def report(self):
+        return f'(cache) functions {self.hits} reused, {self.misses} rebuilt'
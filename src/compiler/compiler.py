@@ -1,7 +1,10 @@
 from llvmlite import ir, binding
 from src.ast import ast
+from src.ast.visitor import NodeVisitor, References
+from src.profiler.profiler import PhaseTimer
 import ctypes
 import subprocess
+import sys
 
 class SymbolTable:
     def __init__(self):
@@ -22,18 +25,30 @@ class SymbolTable:
                 return scope[name]
         return None
 
-class Compiler:
-    globalStrCount: int = 0
-    ifStatementCount: int = 0
-    symTable = SymbolTable()
-    tempTable = SymbolTable()
-    typeTable = SymbolTable()          # table for types, structs, enums etc
-    loopEndBlock = []
-    
-    # scope tracking
-    scopeTrack:str = 'global'
-
-    success:bool = True
+# variables, indexed by the slot the semantic pass resolved each declaration
+# and every use to (Identifier.slot). Scoping is already decided there, so a
+# lookup is one list index instead of a walk over a chain of scope dicts
+class SlotTable:
+    def __init__(self):
+        self.slots = []
+
+    def define(self, node: ast.Identifier, ptr):
+        if node.slot >= len(self.slots):
+            self.slots.extend([None] * (node.slot + 1 - len(self.slots)))
+        self.slots[node.slot] = ptr
+
+    def lookUp(self, node: ast.Identifier):
+        return self.slots[node.slot]
+
+# THREADS: a Compiler is one compilation and all its state is per instance.
+# The class only holds constant types, dispatch tables and the target
+# machines emitObject shares. Separate instances can compile at the same
+# time, in threads or processes, and give the same IR as one at a time. One
+# instance must not be shared between threads. The LLVM side (optimize,
+# emitObject, JITExec) goes through llvmlite, which serializes every LLVM
+# call with one lock: threads are safe there but do not overlap, use
+# processes (src/compiler/parallel.py) for speed
+class Compiler(NodeVisitor):
 
     i32 = ir.IntType(32)
     i8 = ir.IntType(8)
@@ -54,9 +69,24 @@ class Compiler:
         'void': void
     }
 
-    listFunctions = {}
-
     def __init__(self):
+        self.globalStrCount = 0
+        self.ifStatementCount = 0
+        self.symTable = SlotTable()
+        self.tempTable = SymbolTable()
+        self.typeTable = SymbolTable()          # table for types, structs, enums etc
+        self.loopEndBlock = []                  # break jumps here
+        self.loopNextBlock = []                 # continue jumps here
+        self.listFunctions = {}
+
+        # scope tracking
+        self.scopeTrack = 'global'
+
+        self.success = True
+
+        # phases of the backend, main.py adds the frontend ones (--time-report)
+        self.timer = PhaseTimer()
+
         # initialize LLVM only once
         binding.initialize_native_target()
         binding.initialize_native_asmprinter()
@@ -78,30 +108,41 @@ class Compiler:
         self.printf = self.initPrintf()
 
         # create new scope GLOBAL
-        self.symTable.push_scope()
         self.typeTable.push_scope()
 
     # create main function
     def createMain(self, funcname:str='main', returnType:str='void', args:dict={}):
         
         # arguments
-        argsTypes = list(args.values()) # dict values to list of dict 
-        func_type = ir.FunctionType(self.listDataTypes[returnType], [a['argType'] for a in argsTypes])
-        func = ir.Function(self.module, func_type, name=funcname)
+        func = ir.Function(self.module, self.functionType(returnType, args), name=funcname)
 
+        # entry holds only the allocas and jumps to body, where the code goes
         block = func.append_basic_block(name='entry')
-        self.builder = ir.IRBuilder(block)
+        body = func.append_basic_block(name='body')
+        self.entryBuilder = ir.IRBuilder(block)
+        self.entryBuilder.position_before(self.entryBuilder.branch(body))
+        self.builder = ir.IRBuilder(body)
 
         i:int = 0 
         for name in args:
             func.args[i].name = name
-            ptr = self.builder.alloca(func.args[i].type, name=name)
+            ptr = self.alloca(func.args[i].type, name=name)
             self.builder.store(func.args[i], ptr)
-            self.symTable.define(name, ptr)
+            self.symTable.define(args[name]['node'], ptr)
             i+=1
 
         return func
 
+    def functionType(self, returnType, args):
+        return ir.FunctionType(self.listDataTypes[returnType], [arg['argType'] for arg in args.values()])
+
+    # storage for a local, always in the entry block of the function (before
+    # its branch to body). A declaration inside a loop body then does not
+    # allocate again on each iteration, and mem2reg can promote it. The
+    # value is still stored at the declaration
+    def alloca(self, _type, name=''):
+        return self.entryBuilder.alloca(_type, name=name)
+
     # function return types 
 
     # void return
@@ -120,9 +161,6 @@ class Compiler:
         functionArgs = node.args 
         functionBlock = node.block
 
-        # new scope for local function
-        self.symTable.push_scope()
-
         # change scopeTrack to function name
         self.scopeTrack = functionName
 
@@ -133,81 +171,69 @@ class Compiler:
         nfunc = self.createMain(functionName, returnType, getArgs) # temporary
         self.listFunctions[functionName] = nfunc
 
-        # loop to blocks
+        # loop to blocks, nothing after a return is reachable
         for block in functionBlock.statement:
             self.code_gen(block)
+            if self.builder.block.is_terminated:
+                break
 
         # check if void
-        if returnType == 'void':
+        if returnType == 'void' and not self.builder.block.is_terminated:
             self.voidReturn()
 
         # return the scope to global
         self.scopeTrack = 'global'
 
-        # empty local symbol table
-        self.symTable.pop_scope()
+    # a function compiled in another module, declared so calls can be made
+    def declareFunction(self, node: ast.Function):
+        func_type = self.functionType(node._type, self.getArguments(node.args))
+        self.listFunctions[node.name] = ir.Function(self.module, func_type, name=node.name)
 
     def getArguments(self, functionArgs) -> dict:
         args = {}
         for arg in functionArgs.value:
             if isinstance(arg, ast.Assign):
-                args[arg.name.name] = {'argType': self.listDataTypes[arg.type], 'type': arg.type}
+                args[arg.name.name] = {'argType': self.listDataTypes[arg.type], 'type': arg.type, 'node': arg.name}
         return args
 
-    # code generator
-    def code_gen(self, node: ast.ASTnode):
-        if isinstance(node, ast.Program):               # program
-            for block in node.statement:
-                #print(block)
-                self.code_gen(block)
-        elif isinstance(node, ast.Function):            # function
-            self.createFunction(node)
-        elif isinstance(node, ast.FunctionCall):        # function call
-            return self.nodeFunctionCall(node)
-        elif isinstance(node, ast.Assign):              # Assign
-            return self.nodeAssign(node.name, node.value, node.type, node.const)
-        elif isinstance(node, ast.Number):              # Number
-            return self.nodeNumber(node)
-        elif isinstance(node, ast.BinaryOp):            # BinaryOp
-            return self.nodeBinOP(node)
-        elif isinstance(node, ast.Identifier):          # Identifier
-            return self.nodeID(node)
-        elif isinstance(node, ast.Character):           # Character
-            return self.nodeChar(node)
-        elif isinstance(node, ast.String):              # String
-            return self.nodeString(node)
-        elif isinstance(node, ast.Write):               # print / write
-            return self.nodeWrite(node.expr)
-        elif isinstance(node, ast.Bool):                # bool
-            return self.nodeBool(node)
-        elif isinstance(node, ast.Group):               # group(list)
-            return self.nodeGroup(node)
-        elif isinstance(node, ast.Return):              # return
-            self.nodeReturn(node)
-        elif isinstance(node, ast.LogicalOp):           # LogicalOp
-            return self.nodeLogic(node)
-        elif isinstance(node, ast.CompareOp):           # CompareOp
-            return self.nodeCompare(node)
-        elif isinstance(node, ast.IfStatement):         # If statement
-            self.nodeIfStatement(node)
-        elif isinstance(node, ast.WhileLoop):           # WhileLoop statement
-            self.nodeWhileLoop(node)
-        elif isinstance(node, ast.ControlFlow):         # ControlFlow break continue
-            return self.nodeControlFlow(node)
-        elif isinstance(node, ast.ForLoop):             # ForLoop statement
-            self.nodeForLoop(node)
-        elif isinstance(node, ast.getArray):            # Array Access
-            return self.nodeGetArray(node)
-        elif isinstance(node, ast.Struct):              # Struct statement 
-            return self.nodeStruct(node)
-        elif isinstance(node, ast.Access):              # Dot for accessing struct, enum, etc.
-            return self.nodeAccess(node)
-        elif isinstance(node, ast.Enum):                # Enum 
-            self.nodeEnum(node)
-        elif isinstance(node, ast.Reference):           # Reference
-            return self.nodeReference(node)
-        elif isinstance(node, ast.Pointer):             # pointer
-            return self.nodePointer(node)
+    # code generator, dispatched through the visitors table below
+    code_gen = NodeVisitor.visit
+
+    # nodes without a code generator (Define, Include, Class, ...) are skipped
+    def generic_visit(self, node):
+        return None
+
+    # one partition of a program compiled in parallel (see src/compiler/parallel.py):
+    # the bodies of the functions named in functions, declarations of the
+    # other functions they call. Every partition has the global variables,
+    # the owner defines them and the others declare them external
+    def code_gen_partition(self, node: ast.Program, functions, owner: bool):
+        bodies = [statement for statement in node.statement if isinstance(statement, ast.Function) and statement.name in functions]
+        calls = References().collect(bodies).calls
+
+        for statement in node.statement:
+            if isinstance(statement, ast.Function):
+                if statement.name in functions:
+                    self.code_gen(statement)
+                elif statement.name in calls:
+                    self.declareFunction(statement)
+                continue
+
+            self.code_gen(statement)
+            if isinstance(statement, ast.Assign) and statement.type:
+                gvar = self.module.globals.get(self.declared(statement.name).name)
+                if isinstance(gvar, ir.GlobalVariable):
+                    gvar.linkage = ''                               # visible to the other partitions
+                    if not owner:
+                        gvar.initializer = None
+
+    # PROGRAM
+    def nodeProgram(self, node: ast.Program):
+        for block in node.statement:
+            #print(block)
+            self.code_gen(block)
+            if self.scopeTrack != 'global' and self.builder.block.is_terminated:
+                break
 
     # RETURN 
     def nodeReturn(self, node: ast.Return):
@@ -266,22 +292,13 @@ class Compiler:
         
         return const
     
-    # BINARY OPERATORS
+    # BINARY OPERATORS, the instruction comes from the type the semantic pass resolved
     def nodeBinOP(self, node: ast.BinaryOp):
         left = self.code_gen(node.left)
         right = self.code_gen(node.right)
-        
-        result = None
-        if node.op == '+':
-            result = self.add(left, right)
-        elif node.op == '-':
-            result = self.sub(left, right)
-        elif node.op == '*':
-            result = self.mul(left, right)
-        elif node.op == '/':
-            result = self.sdiv(left, right)
-        
-        return result
+
+        ops = self.floatOps if node.vtype == 'idouble' else self.intOps
+        return ops[node.op](self.builder, left, right)
     
     # ASSIGNING - storing ptr
     def nodeAssign(self, name, value, _type, const):
@@ -304,53 +321,27 @@ class Compiler:
             val = self.storeNewArray(name, value, _type, const)
         elif isinstance(name, ast.Pointer):
             val = self.storePointer(name.name, value, False)
-        elif not _type:
-            # fix this shit
-            g_name = self.getName(name)
-            symExist = self.symTable.lookUp(g_name)
-
-            if symExist:
-                if isinstance(symExist.type.pointee, ir.ArrayType):     # if array: array[0]
-                    val = self.storeArray(name, value)
-                elif isinstance(symExist.type.pointee, ir.PointerType): # pointer
-                    val = self.storePointer(name, value)
-                elif symExist.type.pointee == self.i32:                 # i32
-                    val = self.storeInt(name, value)
-                elif symExist.type.pointee == self.idouble:             # idouble
-                    val = self.storeFloat(name, value)
-                elif symExist.type.pointee == self.char:                # char
-                    val = self.storeChar(name, value)
-                elif symExist.type.pointee == self.boolean:             # boolean
-                    val = self.storeBool(name, value)
-                elif symExist.type.pointee == self.char.as_pointer():   # ptr string
-                    val = self.storeString(name, value)
-                #elif isinstance(symExist.type.pointee, ir.PointerType):
-                #    p = symExist.type.pointee  # type: ignore
-                #    if p == self.char or isinstance(p, ir.ArrayType) and p.element == self.char:
-                #        val = self.storeString(name, value)
-            else:                                               # ERROR
-                print(f'Error: Unknown type for variable: {name.name}')
-                self.success = False
-                return None
+        elif isinstance(name, ast.getArray):                   # array[0] = value
+            val = self.storeArray(name, value)
+        elif name.vtype in self.stores:                         # assignment, target type from the semantic pass
+            val = self.stores[name.vtype](self, name, value)
+        elif name.vtype and name.vtype.endswith('*'):           # pointer
+            val = self.storePointer(name, value)
+        else:                                                   # ERROR
+            print(f'Error: Unknown type for variable: {name.name}')
+            self.success = False
+            return None
 
         return val
 
-    def getName(self, node: ast.ASTnode):
-        if isinstance(node, ast.Identifier):
-            return node.name
-        elif isinstance(node, ast.Pointer):
-            return self.getName(node.name)
-        elif isinstance(node, ast.getArray):
-            return self.getName(node.name)
-
-        return node
-
     # IDENTEFIER
     def nodeID(self, node: ast.Identifier):
         
         # find identefier 
-        ptr = self.symTable.lookUp(node.name)
-        if isinstance(ptr.type.pointee, ir.ArrayType) and ptr.type.pointee.element == self.char:
+        ptr = self.symTable.lookUp(node)
+        if isinstance(ptr, ir.Constant):                    # enum member
+            return ptr
+        if node.vtype == 'char[]':
             return self.builder.gep(ptr, [self.zero, self.zero], inbounds=True, name=node.name)
         
         return self.builder.load(ptr, name=node.name)
@@ -388,9 +379,9 @@ class Compiler:
         log = node.log
         result = None
 
-        if left.type == self.idouble:    # double, float
+        if node.left.vtype == 'idouble':    # double, float
             left_bool, right_bool = self.logicFloat(left, right)
-        elif left.type == self.boolean:    # bool
+        elif node.left.vtype == 'bool':     # bool
             left_bool = left
             right_bool = right
         else:                               # int, char, str, etc.
@@ -425,7 +416,7 @@ class Compiler:
         right = self.code_gen(node.right)
         op = node.op
         
-        if left.type == self.idouble:
+        if node.left.vtype == 'idouble':
             if op == '==':
                 return self.builder.fcmp_unordered(op, left, right)
             return self.builder.fcmp_ordered(op, left, right)
@@ -448,10 +439,7 @@ class Compiler:
 
         # if block
         self.builder.position_at_end(nIfBlock)
-        self.symTable.push_scope()
         self.code_gen(node.then_branch)
-        self.symTable.pop_scope()
-        self.builder.branch(nEndBlock)
         if not self.builder.block.is_terminated:
             self.builder.branch(nEndBlock)
 
@@ -471,9 +459,7 @@ class Compiler:
 
             # elseif then
             self.builder.position_at_end(then_block)
-            self.symTable.push_scope()
             self.code_gen(elseif.then_branch)
-            self.symTable.pop_scope()
 
             if not self.builder.block.is_terminated:
                 self.builder.branch(nEndBlock)
@@ -483,9 +469,7 @@ class Compiler:
         # final else 
         if node.else_branch:
             self.builder.position_at_end(currentElse)
-            self.symTable.push_scope()
             self.code_gen(node.else_branch.then_branch)
-            self.symTable.pop_scope()
 
             if not self.builder.block.is_terminated:
                 self.builder.branch(nEndBlock)
@@ -502,6 +486,7 @@ class Compiler:
         whileBody = func.append_basic_block(f'whileBody{self.ifStatementCount}')
         nEndBlock = func.append_basic_block(f'end{self.ifStatementCount}')
         self.loopEndBlock.append(nEndBlock)
+        self.loopNextBlock.append(whileBlock)
 
         # condition block
         self.builder.branch(whileBlock) # jump to conditional block
@@ -511,16 +496,14 @@ class Compiler:
         
         # while body
         self.builder.position_at_end(whileBody)
-        self.symTable.push_scope()
         self.code_gen(node.block)
-        self.symTable.pop_scope()
-        self.builder.branch(whileBlock)
         if not self.builder.block.is_terminated:
-            self.builder.branch(nEndBlock)
+            self.builder.branch(whileBlock)
         
         #endblock 
         self.builder.position_at_end(nEndBlock)
         self.loopEndBlock.pop()
+        self.loopNextBlock.pop()
 
         self.ifStatementCount+=1
 
@@ -533,8 +516,8 @@ class Compiler:
         loopBody = func.append_basic_block(f'loopBody{self.ifStatementCount}')
         nEndBlock = func.append_basic_block(f'end{self.ifStatementCount}')
         self.loopEndBlock.append(nEndBlock)
+        self.loopNextBlock.append(loopExpr)
 
-        self.symTable.push_scope()          # push new scope
         self.builder.branch(initLoop)       # jump to for loop
         self.builder.position_at_end(initLoop)
         self.code_gen(node.exp1)            # expression
@@ -553,26 +536,30 @@ class Compiler:
         # body
         self.builder.position_at_end(loopBody)
         self.code_gen(node.block)
-        self.builder.branch(loopExpr)    # back to expr
         if not self.builder.block.is_terminated:
-            self.builder.branch(nEndBlock)
+            self.builder.branch(loopExpr)    # back to expr
         
         # endblock
         self.builder.position_at_end(nEndBlock)
         self.loopEndBlock.pop()
-        self.symTable.pop_scope()
+        self.loopNextBlock.pop()
 
         self.ifStatementCount+=1
 
-    def nodeControlFlow(self, node: ast.ControlFlow): # this bitch still not working
-        controlFlow = node.name
-
-        if controlFlow == 'break' and self.loopEndBlock:
-            return controlFlow
+    # break leaves the innermost loop, continue goes to its next iteration
+    # (the condition of a while, the step of a for). The block is terminated,
+    # so the statements after it are not generated
+    def nodeControlFlow(self, node: ast.ControlFlow):
+        if not self.loopEndBlock:               # outside a loop
+            return
+        if node.name == 'break':
+            self.builder.branch(self.loopEndBlock[-1])
         else:
-            pass 
+            self.builder.branch(self.loopNextBlock[-1])
 
-        return
+    # the Identifier a declaration declares, i32 *p declares p
+    def declared(self, name):
+        return name.name if isinstance(name, ast.Pointer) else name
 
     # STORING VALUES (GLOBAL)
 
@@ -587,7 +574,7 @@ class Compiler:
         g_int.initializer = value
         g_int.linkage = 'internal'
 
-        self.symTable.define(valName, g_int)
+        self.symTable.define(self.declared(name), g_int)
 
         return g_int
 
@@ -603,7 +590,7 @@ class Compiler:
         g_float.initializer = value
         g_float.linkage = 'internal'
 
-        self.symTable.define(valName, g_float)
+        self.symTable.define(self.declared(name), g_float)
 
         return g_float
 
@@ -617,7 +604,7 @@ class Compiler:
         g_char.initializer = value
         g_char.linkage = 'internal'
 
-        self.symTable.define(valName, g_char)
+        self.symTable.define(self.declared(name), g_char)
 
         return g_char
 
@@ -631,7 +618,7 @@ class Compiler:
         g_bool.initializer = value
         g_bool.linkage = 'internal'
 
-        self.symTable.define(valName, g_bool)
+        self.symTable.define(self.declared(name), g_bool)
 
         return g_bool
 
@@ -655,7 +642,7 @@ class Compiler:
         arrayType = ir.ArrayType(rType, _size)
         init = ir.Constant(arrayType, value)
 
-        global_arr = ir.GlobalVariable(self.module, arrayType, name=name)
+        global_arr = ir.GlobalVariable(self.module, arrayType, name=name.name)
         global_arr.initializer = init # type: ignore
         global_arr.linkage = 'internal'
         self.symTable.define(name, global_arr)
@@ -667,7 +654,7 @@ class Compiler:
         struct_ptr = getStruct['ptr'] # type: ignore
         struct_arg = getStruct['arg'] # type: ignore
         
-        gStruct = ir.GlobalVariable(self.module, struct_ptr, name=name)
+        gStruct = ir.GlobalVariable(self.module, struct_ptr, name=name.name)
         gStruct.initializer = ir.Constant(struct_ptr, block) # type: ignore
 
         items = {}
@@ -682,7 +669,6 @@ class Compiler:
     # Arrays
     def storeNewArray(self, name, value, array, _const=False):
         _type = array._type
-        name = name.name
 
         if self.scopeTrack == 'global':
             return self.globalStoreArray(name, value, _type, array.size, _const=False)
@@ -703,7 +689,7 @@ class Compiler:
             _size = len(value)
 
         array_type = ir.ArrayType(self.listDataTypes[_type], _size)
-        ptr = self.builder.alloca(array_type, name=name)
+        ptr = self.alloca(array_type, name=name.name)
 
         if value:
             for i, val in enumerate(value):
@@ -721,19 +707,21 @@ class Compiler:
     def nodeGetArray(self, node: ast.getArray):
         name = node.name.name
         index = self.code_gen(node.index)
-        arr_ptr = self.symTable.lookUp(name)
+        arr_ptr = self.symTable.lookUp(node.name)
 
         elem_ptr = self.builder.gep(arr_ptr, [self.zero, index], inbounds=True)
         value = self.builder.load(elem_ptr, name=name)
 
         return value
 
+    # array[index] = value, the index is any i32 expression
     def storeArray(self, array, value):
         value = self.code_gen(value)
-        name = array.name.name 
-        idx = array.index.value
-        arr_ptr = self.symTable.lookUp(name)
-        self.storeArrayAtIndex(arr_ptr, value, idx)
+        index = self.code_gen(array.index)
+        arr_ptr = self.symTable.lookUp(array.name)
+
+        elem_ptr = self.builder.gep(arr_ptr, [self.zero, index], inbounds=True)
+        self.builder.store(value, elem_ptr)
 
     # Struct [Create a struct]
     def nodeStruct(self, node: ast.Struct):
@@ -751,11 +739,10 @@ class Compiler:
 
     def storeNewStruct(self, structName, name, values):
         if self.scopeTrack == 'global':
-            return self.globalStruct(structName, name.name, values)
-        name = name.name
+            return self.globalStruct(structName, name, values)
 
         struct_ptr = self.typeTable.lookUp(structName)
-        newStruct = self.builder.alloca(struct_ptr['ptr'], name=name) # type: ignore
+        newStruct = self.alloca(struct_ptr['ptr'], name=name.name) # type: ignore
 
         items = {}
         for i, item in enumerate(values):
@@ -779,6 +766,10 @@ class Compiler:
 
         self.typeTable.define(name, {'enum': enum_type, 'args': enumVals, 'type': 'enum'})
 
+        # members are constants, at the slots the semantic pass gave them
+        for val in node.block:
+            self.symTable.define(val, enumVals[val.name])
+
     def getEnumVal(self, block):
         ret = {}
         for val in block:
@@ -786,29 +777,22 @@ class Compiler:
 
         return ret
 
+    # an enum variable is an i32, global or local
     def storeNewEnum(self, enumName, name, value):
-        enum_type = self.typeTable.lookUp(enumName)
-        value_ptr = enum_type['args'][value] # type: ignore
-
-        ptr = self.builder.alloca(enum_type['enum'], name=name.name) # type: ignore
-        self.builder.store(value_ptr, ptr)
-        self.symTable.define(name.name, ptr)
-
-        return ptr
+        return self.storeNewInt(name, value)
 
     def lookType(self, _type, name, value):
-        value = self.code_gen(value)
         ptr = self.typeTable.lookUp(_type)
         if ptr['type'] == 'enum': # type: ignore
             return self.storeNewEnum(_type, name, value)
         else:
-            return self.storeNewStruct(_type, name, value)
+            return self.storeNewStruct(_type, name, self.code_gen(value))
 
     def nodeAccess(self, node: ast.Access):
         left = node.left.name
         right = node.right.name 
 
-        obj = self.symTable.lookUp(left)
+        obj = self.symTable.lookUp(node.left)
         ptr = obj['ptr'] # type: ignore
         args = obj['args'][right] # type: ignore
 
@@ -819,27 +803,24 @@ class Compiler:
 
     # Reference
     def nodeReference(self, node: ast.Reference):
-        name = node.name.name
-        ptr = self.symTable.lookUp(name)
+        ptr = self.symTable.lookUp(node.name)
         return ptr
 
     def nodePointer(self, node: ast.Pointer):
         name = node.name.name
-        ptr_p = self.symTable.lookUp(name)
+        ptr_p = self.symTable.lookUp(node.name)
         ptr = self.builder.load(ptr_p)
         return self.builder.load(ptr, name=name)
 
     # POINTER
     def storePointer(self, name, value, addr=True):
-        name = name.name
-
         value = self.code_gen(value)                    # code gen for the value
-        ptr = self.symTable.lookUp(name)                # search for the name in symTable
+        ptr = self.symTable.lookUp(name)                # resolved slot of the name
         
         if addr:                                        # check if value is a reference(address)
             self.builder.store(value, ptr)              # store the value to the ptr pointed
         else:
-            ptr = self.builder.load(ptr, name=name)     # load this shit
+            ptr = self.builder.load(ptr, name=name.name)    # load this shit
             self.builder.store(value, ptr)
         return ptr
 
@@ -856,19 +837,19 @@ class Compiler:
         # check if Pointer
         if isinstance(name, ast.Pointer):
             valName = name.name.name
-            ptr = self.builder.alloca(self.i32.as_pointer(), name=valName)
+            ptr = self.alloca(self.i32.as_pointer(), name=valName)
         else:
             valName = name.name
-            ptr = self.builder.alloca(self.i32, name=valName)
+            ptr = self.alloca(self.i32, name=valName)
         
-        self.symTable.define(valName, ptr)
+        self.symTable.define(self.declared(name), ptr)
         if value:
             self.builder.store(value, ptr)
         return ptr
 
     def storeInt(self, name, value):
         value = self.code_gen(value)
-        ptr = self.symTable.lookUp(name.name)
+        ptr = self.symTable.lookUp(name)
 
         self.builder.store(value, ptr)
         return ptr
@@ -884,19 +865,19 @@ class Compiler:
         # check if pointer
         if isinstance(name, ast.Pointer):
             valName = name.name.name
-            ptr = self.builder.alloca(idouble.as_pointer(), name=valName)
+            ptr = self.alloca(idouble.as_pointer(), name=valName)
         else:
             valName = name.name
-            ptr = self.builder.alloca(idouble, name=name.name)
+            ptr = self.alloca(idouble, name=name.name)
 
-        self.symTable.define(valName, ptr)
+        self.symTable.define(self.declared(name), ptr)
         if value:
             self.builder.store(value, ptr)
         return ptr
 
     def storeFloat(self, name, value):
         value = self.code_gen(value)
-        ptr = self.symTable.lookUp(name.name)
+        ptr = self.symTable.lookUp(name)
         
         self.builder.store(value, ptr)
         return ptr
@@ -907,15 +888,15 @@ class Compiler:
         if self.scopeTrack == 'global':
             ptr = ir.GlobalVariable(self.module, self.char.as_pointer(), name=name.name)
             ptr.initializer = ir.Constant.bitcast(value, self.char.as_pointer())
-            self.symTable.define(name.name, ptr)
+            self.symTable.define(name, ptr)
             return ptr
 
         if isinstance(value, ir.GlobalVariable):
             value = self.builder.gep(value, [self.zero, self.zero], name=name.name, inbounds=True)
         
-        ptr = self.builder.alloca(self.char.as_pointer(), name=name.name)
+        ptr = self.alloca(self.char.as_pointer(), name=name.name)
         
-        self.symTable.define(name.name, ptr)
+        self.symTable.define(name, ptr)
         if value:
             self.builder.store(value, ptr)
         return ptr
@@ -926,7 +907,7 @@ class Compiler:
         if isinstance(value, ir.GlobalVariable):
             value = self.builder.gep(value, [self.zero, self.zero], name=name.name, inbounds=True)
         
-        ptr = self.symTable.lookUp(name.name)
+        ptr = self.symTable.lookUp(name)
         self.builder.store(self.builder.bitcast(value, self.char.as_pointer()), ptr)
         return ptr
    
@@ -941,19 +922,19 @@ class Compiler:
             if isinstance(value, ir.GlobalVariable):
                 value = self.builder.gep(value, [self.zero, self.zero], name=valName, inbounds=True)
 
-            ptr = self.builder.alloca(self.char.as_pointer(), name=valName)
+            ptr = self.alloca(self.char.as_pointer(), name=valName)
         else:
             valName = name.name
-            ptr = self.builder.alloca(self.char, name=valName)
+            ptr = self.alloca(self.char, name=valName)
 
-        self.symTable.define(valName, ptr)
+        self.symTable.define(self.declared(name), ptr)
         if value:
             self.builder.store(value, ptr)
         return ptr
 
     def storeChar(self, name, value):
         value = self.code_gen(value)
-        ptr = self.symTable.lookUp(name.name)
+        ptr = self.symTable.lookUp(name)
         
         self.builder.store(value, ptr)
         return ptr
@@ -966,73 +947,23 @@ class Compiler:
         
         if isinstance(name, ast.Pointer):
             valName = name.name.name
-            ptr = self.builder.alloca(self.boolean.as_pointer(), name=valName)
+            ptr = self.alloca(self.boolean.as_pointer(), name=valName)
         else:
             valName = name.name
-            ptr = self.builder.alloca(self.boolean, name=name.name)
+            ptr = self.alloca(self.boolean, name=name.name)
 
-        self.symTable.define(valName, ptr)
+        self.symTable.define(self.declared(name), ptr)
         if value:
             self.builder.store(value, ptr)
         return ptr
 
     def storeBool(self, name, value):
         value = self.code_gen(value)
-        ptr = self.symTable.lookUp(name.name)
+        ptr = self.symTable.lookUp(name)
         
         self.builder.store(value, ptr)
         return ptr
 
-    # BINARY OPERATIONS
-
-    # ADD
-    def add(self, left, right):
-        result = None
-        if left.type == self.i32:
-            result = self.builder.add(left, right)
-        elif left.type == self.idouble:
-            result = self.builder.fadd(left, right)
-
-        return result
-    
-    # SUB
-    def sub(self, left, right):
-        result = None
-        if left.type == self.i32:
-            result = self.builder.sub(left, right)
-        elif left.type == self.idouble:
-            result = self.builder.fsub(left, right)
-        return result
-    
-    # MUL
-    def mul(self, left, right):
-        result = None
-        if left.type == self.i32:
-            result = self.builder.mul(left, right)
-        elif left.type == self.idouble:
-            result = self.builder.fmul(left, right)
-        return result
-    
-    # DIV (unsigned)
-    def sdiv(self, left, right):
-        result = None
-        if left.type == self.i32:
-            result = self.builder.sdiv(left, right)
-        elif left.type == self.idouble:
-            result = self.builder.fdiv(left, right)
-        return result
-
-    
-    # DIV (signed)
-    def udiv(self, left, right):
-        result = None
-        if left.type == self.i32:
-            result = self.builder.udiv(left, right)
-        elif left.type == self.idouble:
-            result = self.builder.fudiv(left, right)
-        return result
-
-
     # WRITE FUNCTION - NEED TO FIX THIS SHIT
     def nodeWrite(self, expr):
         value = self.code_gen(expr)
@@ -1052,12 +983,36 @@ class Compiler:
         self.builder.call(self.printf, nargs)
 
     # generate llvm
-    def generate_llvmIR(self, objname='main'):
-        with open(f'build/{objname}.ll', 'w') as f:
-            f.write(str(self.module))
-
-        subprocess.run(['llc', '-filetype=obj', f'build/{objname}.ll', '-relocation-model=pic', '-o', f'build/{objname}.o'], check=True)
-        subprocess.run(['gcc', f'build/{objname}.o', '-o', objname, '-fno-pie'], check=True)
+    # the module is optimized and turned into an object in process, the only
+    # subprocess is the link. listing is the IR written next to the object,
+    # 'll' (text), 'bc' (bitcode, no printing) or None
+    def generate_llvmIR(self, objname='main', mem2reg=True, level='0', listing='ll'):
+        self.generateObject(objname, mem2reg, level, listing)
+        with self.timer.phase('link'):
+            self.link([f'build/{objname}.o'], objname)
+
+    # gcc links objects into the binary objname. Its diagnostics go through
+    # sys.stdout and sys.stderr, so a caller that redirects them (the compile
+    # server, a batch worker) gets them too. CalledProcessError if it failed
+    @staticmethod
+    def link(objects, objname):
+        result = subprocess.run(['gcc', *objects, '-o', objname, '-fno-pie'], capture_output=True, text=True)
+        sys.stdout.write(result.stdout)
+        sys.stderr.write(result.stderr)
+        result.check_returncode()
+
+    # build/<objname>.o and its listing
+    def generateObject(self, objname='main', mem2reg=True, level='0', listing='ll'):
+        mod = self.optimize(level, mem2reg)
+        with self.timer.phase('write IR'):
+            if listing == 'll':
+                with open(f'build/{objname}.ll', 'w') as f:
+                    f.write(str(mod))
+            elif listing == 'bc':
+                with open(f'build/{objname}.bc', 'wb') as f:
+                    f.write(mod.as_bitcode())
+        with self.timer.phase('emit object'):
+            self.emitObject(mod, f'build/{objname}.o', level)
 
     # init printf
     def initPrintf(self):
@@ -1072,15 +1027,66 @@ class Compiler:
 
             return printf
 
+    # -O level -> speed level of LLVM's default pipeline and of codegen. s is
+    # 2 tuned for size, llvmlite's pass builder takes no size level
+    optLevels = {'0': 0, '1': 1, '2': 2, '3': 3, 's': 2}
+
+    # the module after the passes of an -O level, as a binding module.
+    # -O0 runs only SROA (mem2reg): scalar locals become registers, with phi
+    # nodes where control flow joins (loop headers, if ends). The other levels
+    # run LLVM's default per-module pipeline, which includes it
+    def optimize(self, level='0', mem2reg=True):
+        with self.timer.phase('IR to text'):
+            text = str(self.module)
+        with self.timer.phase('parse IR'):
+            mod = binding.parse_assembly(text)
+            mod.verify()
+
+        tuning = binding.create_pipeline_tuning_options(self.optLevels[level])
+        if level == 's':
+            tuning.loop_unrolling = False
+            tuning.loop_vectorization = False
+            tuning.slp_vectorization = False
+            tuning.inlining_threshold = 75          # clang's -Os threshold
+        passBuilder = binding.create_pass_builder(self.target_machine, tuning)
+
+        if level == '0':
+            passManager = binding.create_new_module_pass_manager()
+            if mem2reg:
+                passManager.add_sroa_pass()
+        else:
+            passManager = passBuilder.getModulePassManager()
+        with self.timer.phase(f'passes -O{level}'):
+            passManager.run(mod, passBuilder)
+        return mod
+
+    # object file for an optimized binding module, generated in process by
+    # a target machine at the codegen level of the -O level. Not through llc,
+    # which can be an older LLVM than llvmlite's and reject the IR it prints
+    #
+    # target machines are created once per codegen level and shared
+    machines = {}
+
+    def emitObject(self, mod, path, level='0'):
+        opt = self.optLevels[level]
+        machine = self.machines.get(opt)
+        if machine is None:
+            target = binding.Target.from_default_triple()
+            machine = self.machines[opt] = target.create_target_machine(opt=opt, reloc='pic')
+        with open(path, 'wb') as f:
+            f.write(machine.emit_object(mod))
+
     # JIT Execution
-    def JITExec(self):
+    def JITExec(self, mem2reg=True, level='0'):
         # create JIT execution engine
 
-        llvm_ir = str(self.module)
-        mod = binding.parse_assembly(llvm_ir)
-        mod.verify()
+        mod = self.optimize(level, mem2reg)
 
-        engine = binding.create_mcjit_compiler(mod, self.target_machine)
+        # the engine takes ownership of the target machine, so it gets its
+        # own, self.target_machine is still needed (and freed) by the compiler
+        target = binding.Target.from_default_triple()
+        machine = target.create_target_machine(opt=self.optLevels[level], jit=True)
+        engine = binding.create_mcjit_compiler(mod, machine)
         engine.finalize_object() # finalized the code for execution
         engine.run_static_constructors()
 
@@ -1091,5 +1097,56 @@ class Compiler:
         cfunc = ctypes.CFUNCTYPE(None)(func_ptr) # none for void function
         cfunc() # runs the llvm main function
 
+    # binary operator -> instruction
+    intOps = {
+        '+': ir.IRBuilder.add,
+        '-': ir.IRBuilder.sub,
+        '*': ir.IRBuilder.mul,
+        '/': ir.IRBuilder.sdiv,
+    }
 
+    floatOps = {
+        '+': ir.IRBuilder.fadd,
+        '-': ir.IRBuilder.fsub,
+        '*': ir.IRBuilder.fmul,
+        '/': ir.IRBuilder.fdiv,
+    }
+
+    # type of an assignment target -> store
+    stores = {
+        'i32': storeInt,
+        'idouble': storeFloat,
+        'char': storeChar,
+        'bool': storeBool,
+        'str': storeString,
+    }
 
+    # node class -> code generator
+    visitors = {
+        ast.Program: nodeProgram,
+        ast.Block: nodeProgram,                                     # scopes were resolved by the semantic pass
+        ast.Function: createFunction,
+        ast.FunctionCall: nodeFunctionCall,
+        ast.Assign: lambda self, node: self.nodeAssign(node.name, node.value, node.type, node.const),
+        ast.Number: nodeNumber,
+        ast.BinaryOp: nodeBinOP,
+        ast.Identifier: nodeID,
+        ast.Character: nodeChar,
+        ast.String: nodeString,
+        ast.Write: lambda self, node: self.nodeWrite(node.expr),     # print / write
+        ast.Bool: nodeBool,
+        ast.Group: nodeGroup,
+        ast.Return: nodeReturn,
+        ast.LogicalOp: nodeLogic,
+        ast.CompareOp: nodeCompare,
+        ast.IfStatement: nodeIfStatement,
+        ast.WhileLoop: nodeWhileLoop,
+        ast.ControlFlow: nodeControlFlow,                           # break continue
+        ast.ForLoop: nodeForLoop,
+        ast.getArray: nodeGetArray,                                 # Array Access
+        ast.Struct: nodeStruct,
+        ast.Access: nodeAccess,                                     # Dot for accessing struct, enum, etc.
+        ast.Enum: nodeEnum,
+        ast.Reference: nodeReference,
+        ast.Pointer: nodePointer,
+    }
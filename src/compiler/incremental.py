@@ -0,0 +1,114 @@
+import hashlib
+import io
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+from src.ast import ast
+from src.ast.visitor import References, fields
+from src.cache.cache import ObjectCache
+from src.compiler import parallel
+from src.compiler.compiler import Compiler
+
+# incremental compilation. Every function is compiled alone into an object
+# cached under a fingerprint of what its code depends on: its own tree,
+# the signatures of the functions it calls, the struct and enum types it
+# declares variables with, the declarations of the globals and enum
+# members it names, and the -O level and mem2reg. The global variables are
+# one more object, keyed by every top-level statement that is not a
+# function. Only objects whose fingerprint changed are compiled, then
+# everything is linked
+#
+# functions are never inlined into each other, each is its own module
+
+# pickles nodes as their class and fields, without the source span, so a
+# function that only moved in the file keeps its fingerprint. No memo:
+# equal trees give the same bytes however their strings are shared
+class Fingerprinter(pickle.Pickler):
+
+    def reducer_override(self, obj):
+        if isinstance(obj, ast.ASTnode):
+            return obj.__class__, tuple(fields(obj))
+        return NotImplemented
+
+def fingerprint(value):
+    buffer = io.BytesIO()
+    pickler = Fingerprinter(buffer, pickle.HIGHEST_PROTOCOL)
+    pickler.fast = True
+    pickler.dump(value)
+    return hashlib.sha256(buffer.getvalue()).hexdigest()[:32]
+
+# unit -> fingerprint, the units are the function names and '' for the
+# global variables
+def fingerprints(tree: ast.Program, mem2reg=True, level='0'):
+    functions = {}
+    types = {}
+    declarations = {}
+    for statement in tree.statement:
+        if isinstance(statement, ast.Function):
+            functions[statement.name] = statement
+        elif isinstance(statement, (ast.Struct, ast.Enum)):
+            types[statement.name] = statement
+            if isinstance(statement, ast.Enum):         # a member named on its own depends on the whole enum
+                for value in statement.block:
+                    declarations[value.name] = statement
+        elif isinstance(statement, ast.Assign) and statement.type:
+            name = statement.name.name if isinstance(statement.name, ast.Pointer) else statement.name
+            declarations[name.name] = (statement.type, statement.name)
+
+    flags = (mem2reg, level)
+    keys = {'': fingerprint((flags, [statement for statement in tree.statement if not isinstance(statement, ast.Function)]))}
+    for name, node in functions.items():
+        references = References().collect(node)
+        keys[name] = fingerprint((
+            flags,
+            node,
+            [(callee, functions[callee]._type, functions[callee].args) for callee in sorted(references.calls) if callee in functions],
+            [types[typeName] for typeName in sorted(references.types) if typeName in types],
+            [declarations[variable] for variable in sorted(references.names) if variable in declarations],
+        ))
+    return keys
+
+# compile one unit of tree to the object file path, False if code
+# generation failed
+def compileUnit(tree, unit, path, mem2reg, level):
+    compiler = Compiler()
+    compiler.code_gen_partition(tree, {unit}, unit == '')
+    if not compiler.success:
+        return False
+    compiler.emitObject(compiler.optimize(level, mem2reg), path, level)
+    return True
+
+def compileUnitWorker(unit, path, mem2reg, level):
+    return compileUnit(parallel.program, unit, path, mem2reg, level)
+
+# compile tree into the binary objname, reusing the cached objects of
+# unchanged units. Units to rebuild are compiled by jobs worker processes
+# when jobs > 1. False if code generation failed
+def generateIncremental(tree: ast.Program, objname='main', mem2reg=True, level='0', jobs=1, cache: ObjectCache = None):
+    cache = cache or ObjectCache()
+    keys = fingerprints(tree, mem2reg, level)
+
+    objects = []
+    rebuild = []
+    for unit, key in keys.items():
+        path = cache.lookUp(key)
+        if path is None:
+            rebuild.append((unit, key, cache.temp(key)))
+            path = cache.path(key)
+        objects.append(path)
+
+    units = [unit for unit, key, temp in rebuild]
+    temps = [temp for unit, key, temp in rebuild]
+    n = len(rebuild)
+    if jobs > 1 and n > 1:
+        with ProcessPoolExecutor(min(jobs, n), initializer=parallel.initWorker, initargs=(tree,)) as pool:
+            results = list(pool.map(compileUnitWorker, units, temps, [mem2reg] * n, [level] * n))
+    else:
+        results = [compileUnit(tree, unit, temp, mem2reg, level) for unit, temp in zip(units, temps)]
+    if not all(results):
+        return False
+    for unit, key, temp in rebuild:
+        cache.store(key, temp)
+
+    Compiler.link(objects, objname)
+    return True
@@ -0,0 +1,89 @@
+import ctypes
+import os
+
+from llvmlite import binding
+
+from src.ast import ast
+from src.cache.cache import ObjectCache
+from src.compiler.compiler import Compiler
+from src.compiler.incremental import fingerprints
+
+# long lived JIT. One MCJIT engine holds a module per function (and one for
+# the global variables), named by its fingerprint (see src/compiler/incremental.py).
+#
+# adding a program only generates IR. A module is compiled the first time
+# one of its functions is looked up, or when a compiled function refers to
+# it, so functions nothing reaches are never compiled. Compiled objects
+# are kept in an ObjectCache through the engine's object cache hooks: a
+# module already in it is neither optimized nor compiled again, in this
+# session or the next.
+#
+# a function redefined with a different body replaces the whole engine,
+# MCJIT keeps the symbols of removed modules. The cache makes the modules
+# that did not change cheap to load again
+class JITSession:
+
+    def __init__(self, level='0', mem2reg=True, cache: ObjectCache = None):
+        self.level = level
+        self.mem2reg = mem2reg
+        self.cache = cache or ObjectCache('build/.cache/jit')
+        self.engine = None
+        self.units = {}                 # unit -> fingerprint, what the engine holds
+        self.reset()
+
+    # a new, empty engine. It owns its target machine
+    def reset(self):
+        binding.initialize_native_target()
+        binding.initialize_native_asmprinter()
+        target = binding.Target.from_default_triple()
+        machine = target.create_target_machine(opt=Compiler.optLevels[self.level], jit=True)
+        if self.engine is not None:
+            self.engine.close()
+        self.engine = binding.create_mcjit_compiler(binding.parse_assembly(''), machine)
+        self.engine.set_object_cache(self.notify, self.getBuffer)
+        self.units = {}
+
+    # object cache hooks, modules are named by their fingerprint
+    def notify(self, module, buffer):
+        temp = self.cache.temp(module.name)
+        with open(temp, 'wb') as file:
+            file.write(buffer)
+        self.cache.store(module.name, temp)
+
+    def getBuffer(self, module):
+        path = self.cache.lookUp(module.name)
+        if path is None:
+            return None
+        with open(path, 'rb') as file:
+            return file.read()
+
+    # add the functions and globals of an analyzed tree, units the engine
+    # already has are skipped. False if code generation failed
+    def add(self, tree: ast.Program):
+        keys = fingerprints(tree, self.mem2reg, self.level)
+        if any(self.units.get(unit, key) != key for unit, key in keys.items()):
+            self.reset()
+
+        for unit, key in keys.items():
+            if unit in self.units:
+                continue
+            compiler = Compiler()
+            compiler.code_gen_partition(tree, {unit}, unit == '')
+            if not compiler.success:
+                return False
+            if os.path.isfile(self.cache.path(key)):   # compiled before, only the definitions are needed
+                mod = binding.parse_assembly(str(compiler.module))
+            else:
+                mod = compiler.optimize(self.level, self.mem2reg)
+            mod.name = key
+            self.engine.add_module(mod)
+            self.units[unit] = key
+        return True
+
+    # address of a function, compiling what it needs on the first lookup
+    def address(self, name='main'):
+        return self.engine.get_function_address(name)
+
+    def run(self, name='main'):
+        cfunc = ctypes.CFUNCTYPE(None)(self.address(name))     # none for void function
+        cfunc()
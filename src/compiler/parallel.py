@@ -0,0 +1,60 @@
+from concurrent.futures import ProcessPoolExecutor
+
+from src.ast import ast
+from src.compiler.compiler import Compiler
+from src.semantic.semantic import SemanticAnalyzer
+
+# parallel code generation. The top-level functions of a program are split
+# into partitions, one LLVM module each, that a pool of worker processes
+# generate, optimize and emit as objects. The objects are linked once.
+#
+# a partition declares the functions of the others and the global
+# variables (defined by the first partition only), string literals stay
+# internal to their module. Functions are not inlined across partitions
+
+program = None          # the tree being compiled, in each worker
+
+def initWorker(tree: ast.Program):
+    global program
+    program = tree
+    SemanticAnalyzer().analyze(program)     # node types and slots are not pickled
+
+# build/<objname>.o for one partition, False if code generation failed
+def compilePartition(functions, owner, objname, mem2reg, level, listing):
+    compiler = Compiler()
+    compiler.code_gen_partition(program, set(functions), owner)
+    if not compiler.success:
+        return False
+    compiler.generateObject(objname, mem2reg, level, listing)
+    return True
+
+# function names, in jobs contiguous runs of about the same number of
+# statements. Neighbouring functions, which tend to call each other, stay
+# together
+def partition(tree: ast.Program, jobs: int):
+    functions = [node for node in tree.statement if isinstance(node, ast.Function)]
+    total = sum(len(node.block.statement) + 1 for node in functions)
+    partitions = [[]]
+    size = 0
+    for node in functions:
+        if size >= total * len(partitions) / jobs:
+            partitions.append([])
+        partitions[-1].append(node.name)
+        size += len(node.block.statement) + 1
+    return partitions
+
+# compile tree with jobs worker processes into the binary objname, the
+# objects are build/<objname>.<partition>.o. False if code generation failed
+def generateParallel(tree: ast.Program, jobs: int, objname='main', mem2reg=True, level='0', listing='ll'):
+    partitions = partition(tree, jobs)
+    objnames = [f'{objname}.{i}' for i in range(len(partitions))]
+    owners = [i == 0 for i in range(len(partitions))]
+
+    n = len(partitions)
+    with ProcessPoolExecutor(min(jobs, n), initializer=initWorker, initargs=(tree,)) as pool:
+        results = list(pool.map(compilePartition, partitions, owners, objnames, [mem2reg] * n, [level] * n, [listing] * n))
+    if not all(results):
+        return False
+
+    Compiler.link([f'build/{name}.o' for name in objnames], objname)
+    return True
@@ -1,4 +1,11 @@
 import ply.lex as lex
+from array import array
+import hashlib
+import importlib.util
+import mmap
+import os
+import re
+import sys
 
 class Lexer:
 
@@ -118,48 +125,59 @@ class Lexer:
     t_LTE           = r'<='
     t_GT            = r'>'
     t_GTE           = r'>='
-    t_AND           = r'and'
-    t_OR            = r'or'
-    t_NOT           = r'not'
     t_SEMI          = r';'
     t_COMMA         = r','
     t_DOT           = r'\.'
     t_REF           = r'\&'
-    t_IF            = r'if'
-    t_ELSE          = r'else'
-    t_ELIF        = r'elif'
-    t_WHILE         = r'while'
-    t_DO            = r'do'
-    t_FOR           = r'for'
-    t_FUNC          = r'function'       # function
-    t_RETURN        = r'return'
-    t_CONTINUE      = r'continue'
-    t_BREAK         = r'break'
-    t_CLASS         = r'class'          # class
-    t_VOID          = r'void'
-    t_CONST         = r'const'
     t_DEFINE        = r'\#define'
     t_INCLUDE       = r'\#include'
 
-    t_STR           = r'str'
-    t_CHARACTER     = r'char'
+    # keywords (if, while, i32, ...) are matched by t_ID through the reserved dict
 
-    # INT
-    t_I32           = r'i32'
-    t_IDOUBLE       = r'idouble'
-
-    t_BOOL              = r'bool'
-    t_NULL              = r'null'
     t_ignore_COMMENT    = r'//.*'
-    t_WRITE             = r'write'                  # write or printf
-    t_READ              = r'read'
-    # t_ID = r'[a-zA-Z_][a-zA-Z0-9_]*'
 
     # a string conataining ignore characters (spaces and tabs)
     t_ignore            = ' \t\r'
 
-    def __init__(self):
-        self.lexer = lex.lex(module=self)
+    # lexer built once per process in cached mode, cloned by every new Lexer
+    cache = None
+
+    def __init__(self, optimize=False):
+        self.errors = 0                     # illegal characters, the parser resets it per parse
+        if not optimize:
+            self.lexer = lex.lex(module=self)
+        elif Lexer.cache:
+            self.lexer = Lexer.cache.clone(self)
+        else:
+            self.lexer = self.loadTables()
+            Lexer.cache = self.lexer.clone()     # untouched template
+
+    # tables of src/lexer/lextab.py, for the rules of this file and this PLY
+    def signature(self):
+        with open(__file__, 'rb') as file:
+            return hashlib.sha256(file.read() + lex.__version__.encode()).hexdigest()[:16]
+
+    # PLY loads a lextab without checking it against the rules. Ours carries
+    # the signature it was built for, when it does not match (a t_* rule was
+    # edited) it is built and written again
+    def loadTables(self):
+        path = os.path.join(os.path.dirname(__file__), 'lextab.py')
+        signature = self.signature()
+        tables = None
+        if os.path.isfile(path):
+            spec = importlib.util.spec_from_file_location('src.lexer.lextab', path)
+            tables = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(tables)
+        if getattr(tables, '_signature', None) == signature:
+            return lex.lex(module=self, optimize=True, lextab=tables)
+
+        if tables is not None:
+            os.remove(path)                     # or PLY imports it again
+        sys.modules.pop('src.lexer.lextab', None)
+        lexer = lex.lex(module=self, optimize=True, lextab='src.lexer.lextab', outputdir=os.path.dirname(path))
+        with open(path, 'a') as file:
+            file.write(f'_signature    = {signature!r}\n')
+        return lexer
 
     # a regular expression rule with some action
     def t_NUMBER(self, t):
@@ -178,25 +196,133 @@ class Lexer:
         t.value = t.value[1] # extract the inner character
         return t
     
-    def t_TRUE(self, t):
-        r'true'
-        t.value = True
-        return t
-    
-    def t_FALSE(self, t):
-        r'false'
-        t.value = False
-        return t
-
     def t_ID(self, t):
         r'[a-zA-Z_][a-zA-Z_0-9]*'
         t.type = self.reserved.get(t.value, 'ID')
+        if t.type == 'TRUE' or t.type == 'FALSE':
+            t.value = t.type == 'TRUE'
         return t
 
     def tokenize(self, text):
         self.lexer.input(text)
         return list(self.lexer)
 
+    # streaming mode: lex straight from a mmap'd source file and yield
+    # tokens lazily, one newline-aligned chunk at a time
+    def tokenize_file(self, filename, chunksize=1 << 16):
+        self.lexer.lineno = 1
+        offset = 0
+
+        with open(filename, 'rb') as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return
+
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as source:
+                start = 0
+                size = len(source)
+                while start < size:
+                    end = self.chunkEnd(source, start, start + chunksize, size)
+                    text = source[start:end].decode('utf-8')
+
+                    self.lexer.input(text)
+                    for tok in self.lexer:
+                        tok.lexpos += offset    # position in the whole file
+                        yield tok
+
+                    offset += len(text)
+                    start = end
+
+    # what can hide a quote: string and char literals, comments. A " matched
+    # alone opens a string its chunk does not close
+    quoted = re.compile(rb'"(?:[^\\"]|\\.)*"|\'[^\n]\'|//[^\n]*|[^"\'/]+|[\s\S]')
+    string = re.compile(rb'"(?:[^\\"]|\\.)*"')
+
+    # chunks end right after a newline, so no token is split between two
+    # chunks. A string literal spanning lines that is still open there is
+    # taken whole, up to the newline after its closing quote, or to the end
+    # of the file when it is never closed
+    def chunkEnd(self, source, start, end, size):
+        if end >= size:
+            return size
+
+        newline = source.find(b'\n', end)
+        if newline == -1:
+            return size
+
+        for m in self.quoted.finditer(source, start, newline + 1):
+            if m.group() == b'"':
+                closed = self.string.match(source, m.start())
+                if closed is None:
+                    return size
+                return self.chunkEnd(source, closed.end(), closed.end(), size)
+        return newline + 1
+
+    # token function for the parser: returns None at the end of the stream
+    def token_stream(self, filename):
+        tokens = self.tokenize_file(filename)
+        return lambda: next(tokens, None)
+
+    # compact mode: run the master regex directly and keep only type ids,
+    # offsets, lengths and line numbers, no LexToken per token
+    def tokenize_compact(self, text):
+        buffer = TokenBuffer(text, self.tokens)
+        types = buffer.types.append
+        offsets = buffer.offsets.append
+        lengths = buffer.lengths.append
+        lines = buffer.lines.append
+        typeIds = buffer.typeIds
+        reserved = self.reserved
+        master, kinds = self.compactRules()
+
+        lineno = 1
+        for m in master.finditer(text):
+            group = m.lastindex
+            start, end = m.span(group)
+            kind = kinds[group]
+            if kind == 'newline':                   # track line numbers
+                lineno += end - start
+                continue
+            if kind == 'ID':
+                kind = typeIds[reserved.get(m.group(group), 'ID')]
+            elif kind is None:                      # ignored comments
+                continue
+            elif kind == 'illegal':
+                print('(lexer) Illegal character %s' % repr(text[start]), 'at line[', lineno, ']')
+                self.errors += 1
+                continue
+            types(kind)
+            offsets(start)
+            lengths(end - start)
+            lines(lineno)
+
+        return buffer
+
+    # PLY's master regexes joined into one, with the ignored characters
+    # matched in front so a token and the blanks before it are one match,
+    # and any other character last. Per group: the token type id,
+    # 'newline', 'ID' (keywords are looked up), 'illegal' or None
+    # (comments). Built once per process
+    compact = None
+
+    def compactRules(self):
+        if Lexer.compact is None:
+            typeIds = {name: i for i, name in enumerate(self.tokens)}
+            ignore = re.escape(self.lexer.lexignore)
+            blanks = f'[{ignore}]*'
+            rules = {}                              # group name -> token type
+            for regex, index in self.lexer.lexre:
+                for name, group in regex.groupindex.items():
+                    rules[name] = index[group][1]
+            patterns = '|'.join(regex.pattern for regex, index in self.lexer.lexre)
+            master = re.compile(f'{blanks}(?:{patterns})|{blanks}(?P<illegal>[^{ignore}])', self.lexer.lexre[0][0].flags)
+
+            kinds = [None] * (master.groups + 1)
+            for name, group in master.groupindex.items():
+                kind = rules.get(name, name)
+                kinds[group] = kind if kind in ('newline', 'ID', 'illegal') else typeIds.get(kind)
+            Lexer.compact = (master, kinds)
+        return Lexer.compact
+
     # track line numbers
     def t_newline(self, t):
         r'\n+'
@@ -205,4 +331,63 @@ class Lexer:
     # error handling
     def t_error(self, t):
         print('(lexer) Illegal character %s' % repr(t.value[0]), 'at line[', t.lexer.lineno, ']')
+        self.errors += 1
         t.lexer.skip(1)
+
+
+# tokens stored as parallel arrays, values are materialized only on access
+class TokenBuffer:
+
+    # value conversions done by the t_* functions of the Lexer
+    converters = {
+        'NUMBER': int,
+        'FLOAT': float,
+        'STRING': lambda text: text[1:-1],
+        'CHAR': lambda text: text[1],
+        'TRUE': lambda text: True,
+        'FALSE': lambda text: False,
+    }
+
+    def __init__(self, text, tokens):
+        self.text = text
+        self.typeNames = list(tokens)
+        self.typeIds = {name: i for i, name in enumerate(self.typeNames)}
+
+        self.types = array('H')         # token type ids
+        self.offsets = array('I')       # lexpos of each token
+        self.lengths = array('I')       # length of the matched text
+        self.lines = array('I')         # line numbers
+
+    def append(self, typeId, offset, length, lineno):
+        self.types.append(typeId)
+        self.offsets.append(offset)
+        self.lengths.append(length)
+        self.lines.append(lineno)
+
+    def __len__(self):
+        return len(self.types)
+
+    def type(self, i):
+        return self.typeNames[self.types[i]]
+
+    def value(self, i):
+        offset = self.offsets[i]
+        text = self.text[offset:offset + self.lengths[i]]
+        convert = self.converters.get(self.type(i))
+        if convert:
+            return convert(text)
+        return text
+
+    # materialize a single LexToken
+    def __getitem__(self, i):
+        tok = lex.LexToken()
+        tok.type = self.type(i)
+        tok.value = self.value(i)
+        tok.lineno = self.lines[i]
+        tok.lexpos = self.offsets[i]
+        return tok
+
+    # token function for the parser: one LexToken at a time
+    def token_stream(self):
+        tokens = (self[i] for i in range(len(self)))
+        return lambda: next(tokens, None)
@@ -0,0 +1,11 @@
+# lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('AND', 'BOOL', 'BREAK', 'CHAR', 'CHARACTER', 'CLASS', 'COMMA', 'CONST', 'CONTINUE', 'DEFINE', 'DIVIDE', 'DO', 'DOT', 'ELIF', 'ELSE', 'ENUM', 'EQ', 'EQUAL', 'FALSE', 'FLOAT', 'FOR', 'FUNC', 'GT', 'GTE', 'I32', 'ID', 'IDOUBLE', 'IF', 'INCLUDE', 'LBRACE', 'LBRACK', 'LPAREN', 'LT', 'LTE', 'MINUS', 'NEQ', 'NOT', 'NULL', 'NUMBER', 'OR', 'PLUS', 'RBRACE', 'RBRACK', 'READ', 'REF', 'RETURN', 'RPAREN', 'SEMI', 'STR', 'STRING', 'STRUCT', 'TIMES', 'TRUE', 'VOID', 'WHILE', 'WRITE'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_FLOAT>\\d+\\.\\d+)|(?P<t_NUMBER>\\d+)|(?P<t_STRING>\\"([^\\\\\\"]|\\\\.)*\\")|(?P<t_CHAR>\'(.)\')|(?P<t_ID>[a-zA-Z_][a-zA-Z_0-9]*)|(?P<t_newline>\\n+)|(?P<t_INCLUDE>\\#include)|(?P<t_DEFINE>\\#define)|(?P<t_ignore_COMMENT>//.*)|(?P<t_DOT>\\.)|(?P<t_EQ>==)|(?P<t_GTE>>=)|(?P<t_LBRACE>\\{)|(?P<t_LBRACK>\\[)|(?P<t_LPAREN>\\()|(?P<t_LTE><=)|(?P<t_NEQ>!=)|(?P<t_PLUS>\\+)|(?P<t_RBRACE>\\})|(?P<t_RBRACK>\\])|(?P<t_REF>\\&)|(?P<t_RPAREN>\\))|(?P<t_TIMES>\\*)|(?P<t_COMMA>,)|(?P<t_DIVIDE>/)|(?P<t_EQUAL>=)|(?P<t_GT>>)|(?P<t_LT><)|(?P<t_MINUS>-)|(?P<t_SEMI>;)', [None, ('t_FLOAT', 'FLOAT'), ('t_NUMBER', 'NUMBER'), ('t_STRING', 'STRING'), None, ('t_CHAR', 'CHAR'), None, ('t_ID', 'ID'), ('t_newline', 'newline'), (None, 'INCLUDE'), (None, 'DEFINE'), (None, None), (None, 'DOT'), (None, 'EQ'), (None, 'GTE'), (None, 'LBRACE'), (None, 'LBRACK'), (None, 'LPAREN'), (None, 'LTE'), (None, 'NEQ'), (None, 'PLUS'), (None, 'RBRACE'), (None, 'RBRACK'), (None, 'REF'), (None, 'RPAREN'), (None, 'TIMES'), (None, 'COMMA'), (None, 'DIVIDE'), (None, 'EQUAL'), (None, 'GT'), (None, 'LT'), (None, 'MINUS'), (None, 'SEMI')])]}
+_lexstateignore = {'INITIAL': ' \t\r'}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
+_signature    = '348d2485dbf9e5df'
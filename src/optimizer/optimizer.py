@@ -0,0 +1,463 @@
+import copy
+from src.ast import ast
+from src.ast.visitor import NodeVisitor, NodeTransformer
+
+I32_MIN = -2**31
+I32_MAX = 2**31 - 1
+
+# wrap to i32 like the LLVM add/sub/mul the compiler would emit
+def wrapI32(value: int) -> int:
+    return (value - I32_MIN) % 2**32 + I32_MIN
+
+def isInt(node):
+    return type(node) is ast.Number and not node._float and I32_MIN <= node.value <= I32_MAX
+
+def isFloat(node):
+    return type(node) is ast.Number and node._float
+
+def isBool(node):
+    return type(node) is ast.Bool
+
+# new literal node carrying the span of the node it replaces
+def literal(node, value):
+    if isinstance(value, bool):
+        new = ast.Bool(value)
+    else:
+        new = ast.Number(value, isinstance(value, float))
+    new.span = node.span
+    return new
+
+def copyLiteral(node, origin):
+    if type(node) is ast.Number:
+        new = ast.Number(node.value, node._float)
+    elif type(node) is ast.Bool:
+        new = ast.Bool(node.value)
+    else:
+        new = ast.Character(node.value)
+    new.span = origin.span
+    return new
+
+# i32 results of + - * /, None when LLVM would not give a plain value
+def foldInt(op, left, right):
+    if op == '+':
+        return wrapI32(left + right)
+    if op == '-':
+        return wrapI32(left - right)
+    if op == '*':
+        return wrapI32(left * right)
+    if op == '/':                                   # sdiv, truncates toward zero
+        if right == 0 or (left == I32_MIN and right == -1):
+            return None
+        quotient = abs(left) // abs(right)
+        return quotient if (left < 0) == (right < 0) else -quotient
+    return None
+
+def foldFloat(op, left, right):
+    if op == '+':
+        return left + right
+    if op == '-':
+        return left - right
+    if op == '*':
+        return left * right
+    if op == '/' and right != 0.0:
+        return left / right
+    return None
+
+COMPARE = {
+    '==': lambda a, b: a == b,
+    '!=': lambda a, b: a != b,
+    '<': lambda a, b: a < b,
+    '<=': lambda a, b: a <= b,
+    '>': lambda a, b: a > b,
+    '>=': lambda a, b: a >= b,
+}
+
+# #define NAME value: every later use of NAME in an expression is replaced by
+# a copy of value and the Define node is removed. Runs before ConstantFolder
+# so defined sizes and coefficients end up as literals (ir.Constant operands).
+# Like the C preprocessor it follows source order and ignores scopes, but
+# only expression uses are replaced: declared/assigned names, *p, &x and
+# struct fields are left alone
+class MacroExpander(NodeTransformer):
+
+    def __init__(self):
+        self.macros = {}
+        self.expanded = 0
+
+    def expand(self, tree):
+        return self.visit(tree)
+
+    def visit_Define(self, node: ast.Define):
+        value = self.visit(node.value)                  # may use earlier macros
+        if isinstance(node.name, ast.Identifier):
+            self.macros[node.name.name] = value
+        return None
+
+    def visit_Identifier(self, node: ast.Identifier):
+        value = self.macros.get(node.name)
+        if value is None:
+            return node
+        self.expanded += 1
+        value = copy.deepcopy(value)
+        value.span = node.span
+        return value
+
+    def visit_Assign(self, node: ast.Assign):
+        node.value = self.visit(node.value)
+        if isinstance(node.type, ast.Array):
+            node.type = self.visit(node.type)               # i32 a[N]
+        if isinstance(node.name, ast.getArray):
+            node.name = self.visit(node.name)
+        return node
+
+    def visit_getArray(self, node: ast.getArray):
+        node.index = self.visit(node.index)
+        return node
+
+    def visit_Function(self, node: ast.Function):
+        node.block = self.visit(node.block)
+        return node
+
+    def visit_Pointer(self, node: ast.Pointer):
+        return node
+
+    def visit_Reference(self, node: ast.Reference):
+        return node
+
+    def visit_Access(self, node: ast.Access):
+        return node
+
+    def visit_Struct(self, node: ast.Struct):
+        return node
+
+# declarations whose variable can change after it is initialized: targets of
+# plain assignments and reads, and variables whose address is taken. Uses the
+# same scoping as ConstantFolder so a shadowing loop counter doesn't count
+class MutatedDeclarations(NodeVisitor):
+
+    def __init__(self):
+        self.scopes = [{}]              # name -> declaring Assign
+        self.mutated = set()
+
+    def mutate(self, node):
+        if isinstance(node, ast.Identifier):
+            for scope in reversed(self.scopes):
+                if node.name in scope:
+                    self.mutated.add(scope[node.name])
+                    return
+
+    def scoped(self, node):
+        self.scopes.append({})
+        self.generic_visit(node)
+        self.scopes.pop()
+
+    def visit_Program(self, node: ast.Program):
+        self.scoped(node)
+
+    def visit_Block(self, node: ast.Block):
+        self.scoped(node)
+
+    def visit_Function(self, node: ast.Function):
+        self.scoped(node)
+
+    def visit_ForLoop(self, node: ast.ForLoop):
+        self.scoped(node)
+
+    def visit_Assign(self, node: ast.Assign):
+        self.generic_visit(node)
+        if not node.type:
+            self.mutate(node.name)
+        elif isinstance(node.name, ast.Identifier):
+            self.scopes[-1][node.name.name] = node
+        elif isinstance(node.name, ast.Pointer) and isinstance(node.name.name, ast.Identifier):
+            self.scopes[-1][node.name.name.name] = node
+
+    def visit_Read(self, node: ast.Read):
+        self.generic_visit(node)
+        self.mutate(node.expr)
+
+    def visit_Reference(self, node: ast.Reference):
+        self.generic_visit(node)
+        self.mutate(node.name)
+
+# folds BinaryOp/CompareOp/LogicalOp subtrees with literal operands into a
+# Number/Bool, the same value LLVM would compute at run time, and replaces
+# uses of never reassigned const scalars with their literal.
+# Mixed int/double operands and anything that would trap are left alone.
+class ConstantFolder(NodeTransformer):
+
+    def __init__(self):
+        self.scopes = [{}]              # name -> literal of a const, None if shadowed
+        self.mutated = set()            # declarations that are assigned again
+        self.folded = 0
+        self.propagated = 0
+
+    def fold(self, tree):
+        collector = MutatedDeclarations()
+        collector.visit(tree)
+        self.mutated = collector.mutated
+        return self.visit(tree)
+
+    # SCOPES
+
+    def scoped(self, node):
+        self.scopes.append({})
+        node = self.generic_visit(node)
+        self.scopes.pop()
+        return node
+
+    def visit_Program(self, node: ast.Program):
+        return self.scoped(node)
+
+    def visit_Block(self, node: ast.Block):
+        return self.scoped(node)
+
+    def visit_Function(self, node: ast.Function):
+        self.scopes.append({})
+        for arg in node.args.value:
+            if isinstance(arg, ast.Assign) and isinstance(arg.name, ast.Identifier):
+                self.scopes[-1][arg.name.name] = None
+        node.block = self.visit(node.block)
+        self.scopes.pop()
+        return node
+
+    def visit_ForLoop(self, node: ast.ForLoop):
+        return self.scoped(node)
+
+    # struct fields are declarations, not code
+    def visit_Struct(self, node: ast.Struct):
+        return node
+
+    # DECLARATIONS and USES
+
+    def visit_Assign(self, node: ast.Assign):
+        node.value = self.visit(node.value)
+        if isinstance(node.type, ast.Array):
+            node.type = self.visit(node.type)
+
+        name = node.name
+        if not isinstance(name, ast.Identifier):
+            node.name = self.visit(name)                # a[i] = ..., *p = ...
+            if node.type and isinstance(name, ast.Pointer) and isinstance(name.name, ast.Identifier):
+                self.scopes[-1][name.name.name] = None
+            return node
+        if not node.type:
+            return node
+
+        value = node.value
+        if node.const and type(value) in (ast.Number, ast.Bool, ast.Character) and node not in self.mutated:
+            self.scopes[-1][name.name] = value
+        else:
+            self.scopes[-1][name.name] = None
+        return node
+
+    def visit_Identifier(self, node: ast.Identifier):
+        for scope in reversed(self.scopes):
+            if node.name in scope:
+                value = scope[node.name]
+                if value is None:
+                    return node
+                self.propagated += 1
+                return copyLiteral(value, node)
+        return node
+
+    # *p, &x, s.field and #define names are not values
+    def visit_Pointer(self, node: ast.Pointer):
+        return node
+
+    def visit_Reference(self, node: ast.Reference):
+        return node
+
+    def visit_Access(self, node: ast.Access):
+        return node
+
+    def visit_Define(self, node: ast.Define):
+        return node
+
+    def visit_getArray(self, node: ast.getArray):
+        node.index = self.visit(node.index)
+        return node
+
+    # FOLDING
+
+    def visit_BinaryOp(self, node: ast.BinaryOp):
+        node.left = left = self.visit(node.left)
+        node.right = right = self.visit(node.right)
+
+        value = None
+        if isInt(left) and isInt(right):
+            value = foldInt(node.op, left.value, right.value)
+        elif isFloat(left) and isFloat(right):
+            value = foldFloat(node.op, left.value, right.value)
+        if value is None:
+            return node
+        self.folded += 1
+        return literal(node, value)
+
+    def visit_CompareOp(self, node: ast.CompareOp):
+        node.left = left = self.visit(node.left)
+        node.right = right = self.visit(node.right)
+
+        # icmp_signed on i32 / fcmp on double; bools are i1 where true is -1
+        if (isInt(left) and isInt(right)) or (isFloat(left) and isFloat(right)):
+            self.folded += 1
+            return literal(node, COMPARE[node.op](left.value, right.value))
+        return node
+
+    def visit_LogicalOp(self, node: ast.LogicalOp):
+        node.left = left = self.visit(node.left)
+        if node.right is None:                          # not
+            if isBool(left) or isInt(left) or isFloat(left):
+                self.folded += 1
+                return literal(node, not left.value)
+            return node
+
+        node.right = right = self.visit(node.right)
+        if not ((isBool(left) and isBool(right)) or (isInt(left) and isInt(right)) or (isFloat(left) and isFloat(right))):
+            return node
+
+        self.folded += 1
+        if node.log == 'and':
+            return literal(node, bool(left.value) and bool(right.value))
+        return literal(node, bool(left.value) or bool(right.value))
+
+# function name -> names of the functions it calls, None for global code
+class CallGraph(NodeVisitor):
+
+    def __init__(self):
+        self.current = None
+        self.calls = {}
+
+    def visit_Function(self, node: ast.Function):
+        outer = self.current
+        self.current = node.name
+        self.calls.setdefault(node.name, set())
+        self.generic_visit(node)
+        self.current = outer
+
+    def visit_FunctionCall(self, node: ast.FunctionCall):
+        self.calls.setdefault(self.current, set()).add(node.name)
+        self.generic_visit(node)
+
+# removes code that can never run. Runs after ConstantFolder, so conditions
+# are already literals where they can be:
+#   if/elif on a literal: the taken branch is inlined, the others dropped
+#   while(false) loops
+#   statements after return/break/continue in the same block
+#   functions main() can't reach (there are no exports, a file without a
+#   main() is left as is)
+class DeadCodeEliminator(NodeTransformer):
+
+    def __init__(self):
+        self.removed = 0                # statements, branches and functions dropped
+        self.loops = 0                  # loop bodies the visit is inside of
+
+    def eliminate(self, tree):
+        tree = self.visit(tree)
+        self.removeUnusedFunctions(tree)
+        return tree
+
+    # BLOCKS
+
+    def visit_Program(self, node: ast.Program):
+        node.statement = self.reachable(self.visitList(node.statement))
+        return node
+
+    def visit_Block(self, node: ast.Block):
+        return self.visit_Program(node)
+
+    # break and continue end a block only inside a loop, a stray one is left
+    # for the semantic pass to report
+    def reachable(self, statements):
+        for i, statement in enumerate(statements):
+            if isinstance(statement, ast.Return) or (self.loops and isinstance(statement, ast.ControlFlow)):
+                self.removed += len(statements) - i - 1
+                return statements[:i + 1]
+        return statements
+
+    # a taken branch replaces its if statement. Spliced into the enclosing
+    # block, or kept in a Block when it declares variables of its own
+    def inline(self, node, branch):
+        statements = branch.statement if isinstance(branch, ast.Program) else []
+        if not any(isinstance(statement, ast.Assign) and statement.type for statement in statements):
+            return statements
+        block = ast.Block(statements)
+        block.span = node.span
+        return block
+
+    # BRANCHES
+
+    def visit_IfStatement(self, node: ast.IfStatement):
+        self.generic_visit(node)
+
+        # false elifs are dropped, a true elif is the else and ends the chain
+        elseif_branch = []
+        for i, elseif in enumerate(node.elseif_branch):
+            if type(elseif.condition) is not ast.Bool:
+                elseif_branch.append(elseif)
+            elif elseif.condition.value:
+                self.removed += len(node.elseif_branch) - i - 1 + (node.else_branch is not None)
+                node.else_branch = ast.ElseStatement(elseif.then_branch)
+                node.else_branch.span = elseif.span
+                break
+            else:
+                self.removed += 1
+        node.elseif_branch = elseif_branch
+
+        if type(node.condition) is not ast.Bool:
+            return node
+        self.removed += 1
+        if node.condition.value:
+            return self.inline(node, node.then_branch)
+
+        # if(false): the first elif takes its place
+        if elseif_branch:
+            first = elseif_branch[0]
+            new = ast.IfStatement(first.condition, first.then_branch, elseif_branch[1:], node.else_branch)
+            new.span = first.span
+            return new
+        if node.else_branch:
+            return self.inline(node, node.else_branch.then_branch)
+        return None
+
+    # LOOPS
+
+    def loop(self, node):
+        self.loops += 1
+        self.generic_visit(node)
+        self.loops -= 1
+        return node
+
+    def visit_WhileLoop(self, node: ast.WhileLoop):
+        self.loop(node)
+        if type(node.condition) is ast.Bool and not node.condition.value:
+            self.removed += 1
+            return None
+        return node
+
+    def visit_ForLoop(self, node: ast.ForLoop):
+        return self.loop(node)
+
+    def visit_doWhileLoop(self, node: ast.doWhileLoop):
+        return self.loop(node)
+
+    # FUNCTIONS
+
+    def removeUnusedFunctions(self, tree):
+        functions = [statement for statement in tree.statement if isinstance(statement, ast.Function)]
+        if not any(function.name == 'main' for function in functions):
+            return
+
+        graph = CallGraph()
+        graph.visit(tree)
+        live = set()
+        stack = ['main', *graph.calls.get(None, ())]
+        while stack:
+            name = stack.pop()
+            if name not in live:
+                live.add(name)
+                stack.extend(graph.calls.get(name, ()))
+
+        statements = [statement for statement in tree.statement if not isinstance(statement, ast.Function) or statement.name in live]
+        self.removed += len(tree.statement) - len(statements)
+        tree.statement = statements
@@ -1,4 +1,5 @@
 import ply.yacc as yacc
+from ply.lex import LexToken
 from src.lexer.lexer import Lexer
 from src.ast import ast
 
@@ -15,13 +16,50 @@ class Parser:
         ('left', 'TIMES', 'DIVIDE'),
     )
 
-    def __init__(self):
-        self.lexer = Lexer()
-        self.parser = yacc.yacc(module=self)
+    def __init__(self, optimize=False):
+        self.lexer = Lexer(optimize)
+        self.errors = 0                     # syntax errors of the last parse
+        if optimize:
+            # production mode: load src/parser/parsetab.py as is, no signature
+            # check, no grammar validation, never writes parsetab or parser.out
+            self.parser = yacc.yacc(module=self, optimize=True, debug=False, write_tables=False)
+        else:
+            self.parser = yacc.yacc(module=self)
+
+    def parse(self, text):
+        self.lexer.lexer.lineno = 1         # spans count lines per parse
+        self.errors = self.lexer.errors = 0
+        return self.parser.parse(text, lexer=self.lexer.lexer)
+
+    # parse a source file without reading it whole, tokens are streamed
+    def parse_file(self, filename):
+        tokenfunc = self.lexer.token_stream(filename)
+        self.errors = self.lexer.errors = 0
+        return self.parser.parse(lexer=self.lexer.lexer, tokenfunc=tokenfunc)
+
+    # parse from the compact array-backed token buffer
+    def parse_compact(self, text):
+        self.errors = self.lexer.errors = 0
+        tokenfunc = self.lexer.tokenize_compact(text).token_stream()
+        return self.parser.parse(lexer=self.lexer.lexer, tokenfunc=tokenfunc)
+
+    # source span of a node: the first token (or spanned node) from p[n] on
+    def span(self, node, p, n=1):
+        for i in range(n, len(p)):
+            child = p.slice[i]
+            if not isinstance(child, LexToken):
+                child = p[i][0] if isinstance(p[i], list) and p[i] else p[i]
+                if not isinstance(child, ast.ASTnode):
+                    continue
+            node.span = ast.packSpan(child.lineno, child.lexpos) if isinstance(child, LexToken) else child.span
+            break
+        else:
+            node.span = ast.NOSPAN
+        return node
 
     def p_program(self, p):
         "program : statements"
-        p[0] = ast.Program(p[1])
+        p[0] = self.span(ast.Program(p[1]), p)
 
     # gramar: expression : expression plus expression
     def p_program_multiple(self, p):
@@ -32,7 +70,8 @@ class Parser:
         if len(p) == 3:
             p[0] = [p[1]]
         else:
-            p[0] = p[1] + [p[2]]
+            p[1].append(p[2])
+            p[0] = p[1]
 
     def p_program_block(self, p):
         """statements : statements scope
@@ -42,12 +81,13 @@ class Parser:
         if len(p) == 2:
             p[0] = [p[1]]
         else:
-            p[0] = p[1] + [p[2]]
+            p[1].append(p[2])
+            p[0] = p[1]
     
     # identefiers
     def p_expression_id(self, p):
         """expression : ID"""
-        p[0] = ast.Identifier(p[1])
+        p[0] = self.span(ast.Identifier(p[1]), p)
 
     # assignment
     def p_statement_assign(self, p):
@@ -56,43 +96,43 @@ class Parser:
             | expression EQUAL functionCall
             | expression EQUAL group
             | statement EQUAL expression"""
-        p[0] = ast.Assign(p[1], p[3])
+        p[0] = self.span(ast.Assign(p[1], p[3]), p)
 
     # expression
     
     def p_pointer_expression(self, p):
         """expression : TIMES expression"""
-        p[0] = ast.Pointer(p[2])
+        p[0] = self.span(ast.Pointer(p[2]), p)
 
     def p_reference_expression(self, p):
         """expression : REF expression"""
-        p[0] = ast.Reference(p[2])
+        p[0] = self.span(ast.Reference(p[2]), p)
 
     # BINOP
     def p_expression_addsub(self, p):
         """expression : expression PLUS expression 
             | expression MINUS expression"""
-        p[0] = ast.BinaryOp(p[2], p[1], p[3])
+        p[0] = self.span(ast.BinaryOp(p[2], p[1], p[3]), p)
 
     def p_expression_muldiv(self, p):
         """expression : expression DIVIDE expression
             | expression TIMES expression"""
-        p[0] = ast.BinaryOp(p[2], p[1], p[3])
+        p[0] = self.span(ast.BinaryOp(p[2], p[1], p[3]), p)
 
     # numbers
     def p_expression_number(self, p):
         """expression : NUMBER"""
-        p[0] = ast.Number(p[1])
+        p[0] = self.span(ast.Number(p[1]), p)
 
     # floating numbers 
     def p_expression_floatNumber(self, p):
         """expression : FLOAT"""
-        p[0] = ast.Number(p[1], True)
+        p[0] = self.span(ast.Number(p[1], True), p)
 
     # uminus operator
     def p_expression_uminus(self, p):
         "expression : MINUS expression %prec MINUS"
-        p[0] = ast.BinaryOp('-', ast.Number(0), p[2])
+        p[0] = self.span(ast.BinaryOp('-', self.span(ast.Number(0), p), p[2]), p)
 
     # compare operators
     def p_expression_compare(self, p):
@@ -102,7 +142,7 @@ class Parser:
             | expression LTE expression
             | expression GT expression
             | expression GTE expression"""
-        p[0] = ast.CompareOp(p[2], p[1], p[3])
+        p[0] = self.span(ast.CompareOp(p[2], p[1], p[3]), p)
 
     # logical
     def p_expression_logical(self, p):
@@ -110,19 +150,19 @@ class Parser:
             | expression OR expression
             | NOT expression"""
         if len(p) == 3:
-            p[0] = ast.LogicalOp(p[1], p[2], None)
+            p[0] = self.span(ast.LogicalOp(p[1], p[2], None), p)
         else:
-            p[0] = ast.LogicalOp(p[2], p[1], p[3])
+            p[0] = self.span(ast.LogicalOp(p[2], p[1], p[3]), p)
 
     # strings
     def p_expression_string(self, p):
         "expression : STRING"
-        p[0] = ast.String(p[1])
+        p[0] = self.span(ast.String(p[1]), p)
 
     # characters
     def p_expression_character(self, p):
         "expression : CHAR"
-        p[0] = ast.Character(p[1])
+        p[0] = self.span(ast.Character(p[1]), p)
 
     # with parenthesis
     def p_expression_group(self, p):
@@ -155,15 +195,16 @@ class Parser:
             | type expression EQUAL statement
             | type CONST expression EQUAL expression
             | type CONST expression EQUAL functionCall"""
+        # declarations are spanned from the name, type keywords are not tracked
         if len(p) == 6:
-            p[0] = ast.Assign(p[3], p[5], p[1], True)
+            p[0] = self.span(ast.Assign(p[3], p[5], p[1], True), p, 3)
         else:
-            p[0] = ast.Assign(p[2], p[4], p[1])
+            p[0] = self.span(ast.Assign(p[2], p[4], p[1]), p, 2)
 
     def p_newStruct(self, p):
         """statement : ID expression EQUAL group
             | ID expression EQUAL expression"""
-        p[0] = ast.Assign(p[2], p[4], p[1])
+        p[0] = self.span(ast.Assign(p[2], p[4], p[1]), p, 2)
 
     # array declaration with value
     def p_arrayDeclaration(self, p):
@@ -171,14 +212,14 @@ class Parser:
             | type expression BSize EQUAL expression
             | type CONST expression BSize EQUAL group"""
         if len(p) == 7:
-            p[0] = ast.Assign(p[3], p[6], ast.Array(p[1], p[4]), True)
+            p[0] = self.span(ast.Assign(p[3], p[6], self.span(ast.Array(p[1], p[4]), p, 3), True), p, 3)
         else:
-            p[0] = ast.Assign(p[2], p[5], ast.Array(p[1], p[3]))
+            p[0] = self.span(ast.Assign(p[2], p[5], self.span(ast.Array(p[1], p[3]), p, 2)), p, 2)
 
     # get array
     def p_getArray(self, p):
         """statement : expression BSize"""
-        p[0] = ast.getArray(p[1], p[2])
+        p[0] = self.span(ast.getArray(p[1], p[2]), p)
 
     # declaration without initialization
     def p_declaration_no_assign(self, p):
@@ -186,23 +227,23 @@ class Parser:
             | type expression LBRACK expression RBRACK"""
         # ex. int num
         if len(p) == 3:
-            p[0] = ast.Assign(p[2], None, p[1])
+            p[0] = self.span(ast.Assign(p[2], None, p[1]), p, 2)
         else:
-            p[0] = ast.Assign(p[2], None, ast.Array(p[1], p[4]))
+            p[0] = self.span(ast.Assign(p[2], None, self.span(ast.Array(p[1], p[4]), p, 2)), p, 2)
 
     # boolean
     def p_expression_true(self, p):
         "expression : TRUE"
-        p[0] = ast.Bool(True)
+        p[0] = self.span(ast.Bool(True), p)
 
     def p_expression_false(self, p):
         "expression : FALSE"
-        p[0] = ast.Bool(False)
+        p[0] = self.span(ast.Bool(False), p)
 
     # function
     def p_function_creation(self, p):
         """scope : FUNC type ID groupArgs block"""
-        p[0] = ast.Function(p[3], p[2], p[4], p[5])
+        p[0] = self.span(ast.Function(p[3], p[2], p[4], p[5]), p)
 
     # Function Call
     def p_functionCallStatement(self, p):
@@ -213,43 +254,43 @@ class Parser:
         """functionCall : ID groupArgs
             | ID LPAREN expression RPAREN"""
         if len(p) == 5:
-            p[0] = ast.FunctionCall(p[1], ast.Group([p[3]]))
+            p[0] = self.span(ast.FunctionCall(p[1], self.span(ast.Group([p[3]]), p, 2)), p)
         else:
-            p[0] = ast.FunctionCall(p[1], p[2]) 
+            p[0] = self.span(ast.FunctionCall(p[1], p[2]), p)
     
     # return
     def p_return_statement(self, p):
         """statement : RETURN expression
             | RETURN"""
         if len(p) == 3:
-            p[0] = ast.Return(p[2])
+            p[0] = self.span(ast.Return(p[2]), p)
         else:
-            p[0] = ast.Return(None)
+            p[0] = self.span(ast.Return(None), p)
 
     def p_controlFlow(self, p):
         """statement : BREAK
             | CONTINUE"""
-        p[0] = ast.ControlFlow(p[1])
+        p[0] = self.span(ast.ControlFlow(p[1]), p)
 
     # IO functions
     def p_print_expression(self, p):
         """statement : WRITE expression
             | WRITE groupArgs"""
-        p[0] = ast.Write(p[2])
+        p[0] = self.span(ast.Write(p[2]), p)
 
     def p_write_expression(self, p):
         """statement : READ expression"""
-        p[0] = ast.Read(p[2])
+        p[0] = self.span(ast.Read(p[2]), p)
     
     # groupings
 
     def p_groupArgs(self, p):
         """groupArgs : LPAREN groupList RPAREN"""
-        p[0] = ast.Group(p[2])
+        p[0] = self.span(ast.Group(p[2]), p)
 
     def p_group(self, p):
         """group : LBRACE groupList RBRACE"""
-        p[0] = ast.Group(p[2])
+        p[0] = self.span(ast.Group(p[2]), p)
 
     def p_single_group(self, p):
         """groupList : item
@@ -261,7 +302,8 @@ class Parser:
 
     def p_multi_group(self, p):
         """groupList : groupList COMMA item"""
-        p[0] = p[1] + [p[3]]
+        p[1].append(p[3])           # in place, copying is O(n^2) on big initializers
+        p[0] = p[1]
 
     def p_item(self, p):
         """item : expression
@@ -288,10 +330,10 @@ class Parser:
         """IDs : ID 
             | ID NUMBER"""
         if len(p) == 3:
-            p[0] = ast.EnumVal(p[1], p[2])
+            p[0] = self.span(ast.EnumVal(p[1], p[2]), p)
             self.enumCount = int(p[2]) + 1
         else:
-            p[0] = ast.EnumVal(p[1], self.enumCount)
+            p[0] = self.span(ast.EnumVal(p[1], self.enumCount), p)
             self.enumCount+=1
 
     def p_IDLists(self, p):
@@ -300,7 +342,8 @@ class Parser:
         if len(p) == 2:
             p[0] = [p[1]]
         else:
-            p[0] = p[1] + [p[3]]
+            p[1].append(p[3])
+            p[0] = p[1]
     
     # group of ID in Enum
     def p_groupID(self, p):
@@ -311,11 +354,12 @@ class Parser:
 
     def p_statement_if(self, p):
         """scope : IF LPAREN expression RPAREN block elseif_list else_opt"""
-        p[0] = ast.IfStatement(p[3], p[5], p[6], p[7])
+        p[0] = self.span(ast.IfStatement(p[3], p[5], p[6], p[7]), p)
 
     def p_elseif_multi(self, p):
         """elseif_list : elseif_list elseif"""
-        p[0] = p[1] + [p[2]]
+        p[1].append(p[2])
+        p[0] = p[1]
 
     def p_elseif_empty(self, p):
         """elseif_list : """
@@ -323,13 +367,13 @@ class Parser:
 
     def p_elseif_single(self, p):
         """elseif : ELIF LPAREN expression RPAREN block"""
-        p[0] = ast.ElseIfStatement(p[3], p[5])
+        p[0] = self.span(ast.ElseIfStatement(p[3], p[5]), p)
 
     def p_else_opt(self, p):
         """else_opt : ELSE block
             | """
         if(len(p)) == 3:
-            p[0] = ast.ElseStatement(p[2])
+            p[0] = self.span(ast.ElseStatement(p[2]), p)
         else:
             p[0] = None
 
@@ -337,25 +381,25 @@ class Parser:
 
     def p_forloop(self, p):
         """scope : FOR LPAREN statement SEMI expression SEMI statement RPAREN block """
-        p[0] = ast.ForLoop(p[3], p[5], p[7], p[9])
+        p[0] = self.span(ast.ForLoop(p[3], p[5], p[7], p[9]), p)
 
     def p_whileloop(self, p):
         """scope : WHILE LPAREN expression RPAREN block"""
-        p[0] = ast.WhileLoop(p[3], p[5])
+        p[0] = self.span(ast.WhileLoop(p[3], p[5]), p)
     
     def p_doWhileLoop(self, p):
         """scope : DO block WHILE LPAREN expression RPAREN"""
-        p[0] = ast.doWhileLoop(p[5], p[2])
+        p[0] = self.span(ast.doWhileLoop(p[5], p[2]), p)
 
     # enum and struct
 
     def p_struct(self, p):
         """scope : STRUCT ID groupBlock"""
-        p[0] = ast.Struct(p[2], ast.Group(p[3]))
+        p[0] = self.span(ast.Struct(p[2], self.span(ast.Group(p[3]), p, 3)), p)
 
     def p_enum(self, p):
         """scope : ENUM ID groupID"""
-        p[0] = ast.Enum(p[2], p[3])
+        p[0] = self.span(ast.Enum(p[2], p[3]), p)
         self.enumCount = 0
 
     # using dot(.) to access enum, struct, etc.
@@ -364,25 +408,26 @@ class Parser:
             | expression DOT statement
             | statement DOT statement
             | statement DOT expression"""
-        p[0] = ast.Access(p[1], p[3])
+        p[0] = self.span(ast.Access(p[1], p[3]), p)
 
     # class - object oriented
     def p_class(self, p):
         """scope : CLASS expression block"""
-        p[0] = ast.Class(p[2], p[3])
+        p[0] = self.span(ast.Class(p[2], p[3]), p)
     
     # define (create macros) ex. #define PI 3.14159
     def p_define(self, p):
         """statement : DEFINE expression expression"""
-        p[0] = ast.Define(p[2], p[3])
+        p[0] = self.span(ast.Define(p[2], p[3]), p)
 
     # include package : #include packageName
     def p_include_package(self, p):
         """module : INCLUDE expression"""
-        p[0] = ast.Include(p[2])
+        p[0] = self.span(ast.Include(p[2]), p)
 
     # error for syntax error
     def p_error(self, p):
+        self.errors += 1
         if p:
             print('(parser) Syntax Error', p)
         else:
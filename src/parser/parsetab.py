@@ -6,7 +6,7 @@ _tabversion = '3.10'
 
 _lr_method = 'LALR'
 
-_lr_signature = 'nonassocEQLTLTEGTGTENEQleftPLUSMINUSleftTIMESDIVIDEAND BOOL BREAK CHAR CHARACTER CLASS COMMA CONST CONTINUE DEFINE DIVIDE DO DOT ELIF ELSE ENUM EQ EQUAL FALSE FLOAT FOR FUNC GT GTE I32 ID IDOUBLE IF INCLUDE LBRACE LBRACK LPAREN LT LTE MINUS NEQ NOT NULL NUMBER OR PLUS RBRACE RBRACK READ REF RETURN RPAREN SEMI STR STRING STRUCT TIMES TRUE VOID WHILE WRITEprogram : statementsstatements : statements statement SEMI\n| statements expression SEMI\n| statement SEMI\n| expression SEMIstatements : statements scope\n| statements module\n| scope\n| moduleexpression : IDstatement : expression EQUAL expression\n| expression EQUAL functionCall\n| expression EQUAL group\n| statement EQUAL expressionexpression : TIMES expressionexpression : REF expressionexpression : expression PLUS expression \n| expression MINUS expressionexpression : expression DIVIDE expression\n| expression TIMES expressionexpression : NUMBERexpression : FLOATexpression : MINUS expression %prec MINUSexpression : expression EQ expression\n| expression NEQ expression\n| expression LT expression\n| expression LTE expression\n| expression GT expression\n| expression GTE expressionexpression : expression AND expression\n| expression OR expression\n| NOT expressionexpression : STRINGexpression : CHARexpression : LPAREN expression RPARENtype :\n| I32\n| STR\n| IDOUBLE\n| CHARACTER\n| BOOL\n| VOIDBSize : LBRACK expression RBRACK\n| LBRACK RBRACKstatement : type expression EQUAL expression\n| type expression EQUAL statement\n| type CONST expression EQUAL expression\n| type CONST expression EQUAL functionCallstatement : ID expression EQUAL group\n| ID expression EQUAL expressionstatement : type expression BSize EQUAL group\n| type expression BSize EQUAL expression\n| type CONST expression BSize EQUAL groupstatement : expression BSizestatement : type expression\n| type expression LBRACK expression RBRACKexpression : TRUEexpression : FALSEscope : FUNC type ID groupArgs blockexpression : functionCallfunctionCall : ID groupArgs\n| ID LPAREN expression RPARENstatement : RETURN expression\n| RETURNstatement : BREAK\n| CONTINUEstatement : WRITE expression\n| WRITE groupArgsstatement : READ expressiongroupArgs : LPAREN groupList RPARENgroup : LBRACE groupList RBRACEgroupList : item\n| groupList : groupList COMMA itemitem : expression\n| statementblock : LBRACE program RBRACE\n| LBRACE RBRACEgroupBlock : LBRACE statements RBRACEIDs : ID \n| ID NUMBERIDlists : IDlists COMMA IDs\n| IDsgroupID : LBRACE IDlists RBRACEscope : IF LPAREN expression RPAREN block elseif_list else_optelseif_list : elseif_list elseifelseif_list : elseif : ELIF LPAREN expression RPAREN blockelse_opt : ELSE block\n| scope : FOR LPAREN statement SEMI expression SEMI statement RPAREN block scope : WHILE LPAREN expression RPAREN blockscope : DO block WHILE LPAREN expression RPARENscope : STRUCT ID groupBlockscope : ENUM ID groupIDstatement : expression DOT expression\n| expression DOT statement\n| statement DOT statement\n| statement DOT expressionscope : CLASS expression blockstatement : DEFINE expression expressionmodule : INCLUDE expression'
+_lr_signature = 'nonassocEQLTLTEGTGTENEQleftPLUSMINUSleftTIMESDIVIDEAND BOOL BREAK CHAR CHARACTER CLASS COMMA CONST CONTINUE DEFINE DIVIDE DO DOT ELIF ELSE ENUM EQ EQUAL FALSE FLOAT FOR FUNC GT GTE I32 ID IDOUBLE IF INCLUDE LBRACE LBRACK LPAREN LT LTE MINUS NEQ NOT NULL NUMBER OR PLUS RBRACE RBRACK READ REF RETURN RPAREN SEMI STR STRING STRUCT TIMES TRUE VOID WHILE WRITEprogram : statementsstatements : statements statement SEMI\n            | statements expression SEMI\n            | statement SEMI\n            | expression SEMIstatements : statements scope\n            | statements module\n            | scope\n            | moduleexpression : IDstatement : expression EQUAL expression\n            | expression EQUAL functionCall\n            | expression EQUAL group\n            | statement EQUAL expressionexpression : TIMES expressionexpression : REF expressionexpression : expression PLUS expression \n            | expression MINUS expressionexpression : expression DIVIDE expression\n            | expression TIMES expressionexpression : NUMBERexpression : FLOATexpression : MINUS expression %prec MINUSexpression : expression EQ expression\n            | expression NEQ expression\n            | expression LT expression\n            | expression LTE expression\n            | expression GT expression\n            | expression GTE expressionexpression : expression AND expression\n            | expression OR expression\n            | NOT expressionexpression : STRINGexpression : CHARexpression : LPAREN expression RPARENtype :\n            | I32\n            | STR\n            | IDOUBLE\n            | CHARACTER\n            | BOOL\n            | VOIDBSize : LBRACK expression RBRACK\n            | LBRACK RBRACKstatement : type expression EQUAL expression\n            | type expression EQUAL statement\n            | type CONST expression EQUAL expression\n            | type CONST expression EQUAL functionCallstatement : ID expression EQUAL group\n            | ID expression EQUAL expressionstatement : type expression BSize EQUAL group\n            | type expression BSize EQUAL expression\n            | type CONST expression BSize EQUAL groupstatement : expression BSizestatement : type expression\n            | type expression LBRACK expression RBRACKexpression : TRUEexpression : FALSEscope : FUNC type ID groupArgs blockexpression : functionCallfunctionCall : ID groupArgs\n            | ID LPAREN expression RPARENstatement : RETURN expression\n            | RETURNstatement : BREAK\n            | CONTINUEstatement : WRITE expression\n            | WRITE groupArgsstatement : READ expressiongroupArgs : LPAREN groupList RPARENgroup : LBRACE groupList RBRACEgroupList : item\n            | groupList : groupList COMMA itemitem : expression\n            | statementblock : LBRACE program RBRACE\n            | LBRACE RBRACEgroupBlock : LBRACE statements RBRACEIDs : ID \n            | ID NUMBERIDlists : IDlists COMMA IDs\n            | IDsgroupID : LBRACE IDlists RBRACEscope : IF LPAREN expression RPAREN block elseif_list else_optelseif_list : elseif_list elseifelseif_list : elseif : ELIF LPAREN expression RPAREN blockelse_opt : ELSE block\n            | scope : FOR LPAREN statement SEMI expression SEMI statement RPAREN block scope : WHILE LPAREN expression RPAREN blockscope : DO block WHILE LPAREN expression RPARENscope : STRUCT ID groupBlockscope : ENUM ID groupIDstatement : expression DOT expression\n            | expression DOT statement\n            | statement DOT statement\n            | statement DOT expressionscope : CLASS expression blockstatement : DEFINE expression expressionmodule : INCLUDE expression'
     
 _lr_action_items = {'ID':([0,2,5,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,32,33,34,35,36,37,38,39,40,41,44,45,46,47,48,49,50,52,53,54,55,56,57,58,59,60,61,62,63,64,65,67,68,70,71,75,77,78,79,80,81,83,84,85,86,88,92,93,94,101,104,105,106,107,108,109,110,111,112,113,114,115,116,119,121,123,124,125,132,133,134,142,143,144,145,146,147,153,155,160,162,163,164,165,167,169,171,172,173,184,186,187,189,191,192,193,196,197,198,200,201,205,206,209,211,],[9,9,-8,-9,-60,68,68,68,68,68,68,68,68,68,-21,-22,68,-33,-34,68,-57,-58,-36,89,90,68,68,-37,-38,-39,-40,-41,-42,-6,-7,-4,68,9,-5,68,104,68,68,68,68,68,68,68,68,68,68,68,68,68,68,-10,-61,125,125,68,-15,-16,-23,-32,135,68,9,68,9,-102,-2,-3,104,68,-17,-18,-19,-20,-24,-25,-26,-27,-28,-29,-30,-31,104,68,125,68,68,68,68,-35,-78,-94,9,-95,176,-100,68,68,125,-70,104,-18,-20,104,68,68,-77,9,-62,-59,-87,-92,-79,-84,176,-90,9,-93,-85,-86,-89,68,-91,-88,]),'RETURN':([0,2,5,6,7,19,20,22,23,25,26,44,45,46,48,49,52,68,70,71,75,78,79,80,81,85,88,92,93,94,101,105,106,107,108,109,110,111,112,113,114,115,116,119,123,134,142,143,144,145,147,160,162,163,167,172,173,184,186,187,189,191,192,196,197,198,200,201,205,209,211,],[10,10,-8,-9,-60,-21,-22,-33,-34,-57,-58,-6,-7,-4,10,-5,10,-10,-61,10,10,-15,-16,-23,-32,10,10,-102,-2,-3,10,-17,-18,-19,-20,-24,-25,-26,-27,-28,-29,-30,-31,10,10,-35,-78,-94,10,-95,-100,10,-70,10,10,-77,10,-62,-59,-87,-92,-79,-84,-90,10,-93,-85,-86,-89,-91,-88,]),'BREAK':([0,2,5,6,7,19,20,22,23,25,26,44,45,46,48,49,52,68,70,71,75,78,79,80,81,85,88,92,93,94,101,105,106,107,108,109,110,111,112,113,114,115,116,119,123,134,142,143,144,145,147,160,162,163,167,172,173,184,186,187,189,191,192,196,197,198,200,201,205,209,211,],[11,11,-8,-9,-60,-21,-22,-33,-34,-57,-58,-6,-7,-4,11,-5,11,-10,-61,11,11,-15,-16,-23,-32,11,11,-102,-2,-3,11,-17,-18,-19,-20,-24,-25,-26,-27,-28,-29,-30,-31,11,11,-35,-78,-94,11,-95,-100,11,-70,11,11,-77,11,-62,-59,-87,-92,-79,-84,-90,11,-93,-85,-86,-89,-91,-88,]),'CONTINUE':([0,2,5,6,7,19,20,22,23,25,26,44,45,46,48,49,52,68,70,71,75,78,79,80,81,85,88,92,93,94,101,105,106,107,108,109,110,111,112,113,114,115,116,119,123,134,142,143,144,145,147,160,162,163,167,172,173,184,186,187,189,191,192,196,197,198,200,201,205,209,211,],[12,12,-8,-9,-60,-21,-22,-33,-34,-57,-58,-6,-7,-4,12,-5,12,-10,-61,12,12,-15,-16,-23,-32,12,12,-102,-2,-3,12,-17,-18,-19,-20,-24,-25,-26,-27,-28,-29,-30,-31,12,12,-35,-78,-94,12,-95,-100,12,-70,12,12,-77,12,-62,-59,-87,-92,-79,-84,-90,12,-93,-85,-86,-89,-91,-88,]),'WRITE':([0,2,5,6,7,19,20,22,23,25,26,44,45,46,48,49,52,68,70,71,75,78,79,80,81,85,88,92,93,94,101,105,106,107,108,109,110,111,112,113,114,115,116,119,123,134,142,143,144,145,147,160,162,163,167,172,173,184,186,187,189,191,192,196,197,198,200,201,205,209,211,],[13,13,-8,-9,-60,-21,-22,-33,-34,-57,-58,-6,-7,-4,13,-5,13,-10,-61,13,13,-15,-16,-23,-32,13,13,-102,-2,-3,13,-17,-18,-19,-20,-24,-25,-26,-27,-28,-29,-30,-31,13,13,-35,-78,-94,13,-95,-100,13,-70,13,13,-77,13,-62,-59,-87,-92,-79,-84,-90,13,-93,-85,-86,-89,-91,-88,]),'READ':([0,2,5,6,7,19,20,22,23,25,26,44,45,46,48,49,52,68,70,71,75,78,79,80,81,85,88,92,93,94,101,105,106,107,108,109,110,111,112,113,114,115,116,119,123,134,142,143,144,145,147,160,162,163,167,172,173,184,186,187,189,191,192,196,197,198,200,201,205,209,211,],[14,14,-8,-9,-60,-21,-22,-33,-34,-57,-58,-6,-7,-4,14,-5,14,-10,-61,14,14,-15,-16,-23,-32,14,14,-102,-2,-3,14,-17,-18,-19,-20,-24,-25,-26,-27,-28,-29,-30,-31,14,14,-35,-78,-94,14,-95,-100,14,-70,14,14,-77,14,-62,-59,-87,-92,-79,-84,-90,14,-93,-85,-86,-89,-91,-88,]),'DEFINE':([0,2,5,6,7,19,20,22,23,25,26,44,45,46,48,49,52,68,70,71,75,78,79,80,81,85,88,92,93,94,101,105,106,107,108,109,110,111,112,113,114,115,116,119,123,134,142,143,144,145,147,160,162,163,167,172,173,184,186,187,189,191,192,196,197,198,200,201,205,209,211,],[15,15,-8,-9,-60,-21,-22,-33,-34,-57,-58,-6,-7,-4,15,-5,15,-10,-61,15,15,-15,-16,-23,-32,15,15,-102,-2,-3,15,-17,-18,-19,-20,-24,-25,-26,-27,-28,-29,-30,-31,15,15,-35,-78,-94,15,-95,-100,15,-70,15,15,-77,15,-62,-59,-87,-92,-79,-84,-90,15,-93,-85,-86,-89,-91,-88,]),'TIMES':([0,2,4,5,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,34,35,36,37,38,39,40,41,43,44,45,46,47,48,49,50,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,75,76,77,78,79,80,81,82,84,85,86,88,91,92,93,94,95,97,98,99,101,102,104,105,106,107,108,109,110,111,112,113,114,115,116,117,119,121,122,123,124,125,126,130,131,132,133,134,136,138,139,142,143,144,145,147,149,151,153,154,155,157,158,160,161,162,163,164,165,167,169,171,172,173,178,181,182,184,186,187,188,189,190,191,192,196,197,198,200,201,205,206,208,209,211,],[16,16,56,-8,-9,-60,16,16,16,16,16,16,16,16,16,-21,-22,16,-33,-34,16,-57,-58,16,16,-37,-38,-39,-40,-41,-42,56,-6,-7,-4,16,16,-5,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,56,16,-10,56,-61,16,56,56,16,56,133,-15,56,56,56,56,16,16,16,16,56,56,-2,-3,56,56,56,-60,16,56,16,56,56,-19,-20,56,56,56,56,56,56,56,56,56,16,16,56,16,16,16,56,56,56,16,16,-35,56,56,56,-78,-94,16,-95,-100,56,56,16,56,16,56,56,16,-35,-70,16,56,-15,16,16,16,-77,16,56,56,-60,-62,-59,-87,56,-92,56,-79,-84,-90,16,-93,-85,-86,-89,16,56,-91,-88,]),'REF':([0,2,5,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,34,35,36,37,38,39,40,41,44,45,46,47,48,49,50,52,53,54,55,56,57,58,59,60,61,62,63,64,65,67,68,70,71,75,77,78,79,80,81,84,85,86,88,92,93,94,101,104,105,106,107,108,109,110,111,112,113,114,115,116,119,121,123,124,125,132,133,134,142,143,144,145,147,153,155,160,162,163,164,165,167,169,171,172,173,184,186,187,189,191,192,196,197,198,200,201,205,206,209,211,],[17,17,-8,-9,-60,17,17,17,17,17,17,17,17,17,-21,-22,17,-33,-34,17,-57,-58,17,17,-37,-38,-39,-40,-41,-42,-6,-7,-4,17,17,-5,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,-10,-61,17,17,17,-15,-16,-23,-32,17,17,17,17,-102,-2,-3,17,17,-17,-18,-19,-20,-24,-25,-26,-27,-28,-29,-30,-31,17,17,17,17,17,17,17,-35,-78,-94,17,-95,-100,17,17,17,-70,17,-18,-20,17,17,17,-77,17,-62,-59,-87,-92,-79,-84,-90,17,-93,-85,-86,-89,17,-91,-88,]),'NUMBER':([0,2,5,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,34,35,36,37,38,39,40,41,44,45,46,47,48,49,50,52,53,54,55,56,57,58,59,60,61,62,63,64,65,67,68,70,71,75,77,78,79,80,81,84,85,86,88,92,93,94,101,104,105,106,107,108,109,110,111,112,113,114,115,116,119,121,123,124,125,132,133,134,142,143,144,145,147,153,155,160,162,163,164,165,167,169,171,172,173,176,184,186,187,189,191,192,196,197,198,200,201,205,206,209,211,],[19,19,-8,-9,-60,19,19,19,19,19,19,19,19,19,-21,-22,19,-33,-34,19,-57,-58,19,19,-37,-38,-39,-40,-41,-42,-6,-7,-4,19,19,-5,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,-10,-61,19,19,19,-15,-16,-23,-32,19,19,19,19,-102,-2,-3,19,19,-17,-18,-19,-20,-24,-25,-26,-27,-28,-29,-30,-31,19,19,19,19,19,19,19,-35,-78,-94,19,-95,-100,19,19,19,-70,19,-18,-20,19,19,19,-77,19,194,-62,-59,-87,-92,-79,-84,-90,19,-93,-85,-86,-89,19,-91,-88,]),'FLOAT':([0,2,5,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,34,35,36,37,38,39,40,41,44,45,46,47,48,49,50,52,53,54,55,56,57,58,59,60,61,62,63,64,65,67,68,70,71,75,77,78,79,80,81,84,85,86,88,92,93,94,101,104,105,106,107,108,109,110,111,112,113,114,115,116,119,121,123,124,125,132,133,134,142,143,144,145,147,153,155,160,162,163,164,165,167,169,171,172,173,184,186,187,189,191,192,196,197,198,200,201,205,206,209,211,],[20,20,-8,-9,-60,20,20,20,20,20,20,20,20,20,-21,-22,20,-33,-34,20,-57,-58,20,20,-37,-38,-39,-40,-41,-42,-6,-7,-4,20,20,-5,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,-10,-61,20,20,20,-15,-16,-23,-32,20,20,20,20,-102,-2,-3,20,20,-17,-18,-19,-20,-24,-25,-26,-27,-28,-29,-30,-31,20,20,20,20,20,20,20,-35,-78,-94,20,-95,-100,20,20,20,-70,20,-18,-20,20,20,20,-77,20,-62,-59,-87,-92,-79,-84,-90,20,-93,-85,-86,-89,20,-91,-88,]),'MINUS':([0,2,4,5,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,34,35,36,37,38,39,40,41,43,44,45,46,47,48,49,50,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,75,76,77,78,79,80,81,82,84,85,86,88,91,92,93,94,95,97,98,99,101,102,104,105,106,107,108,109,110,111,112,113,114,115,116,117,119,121,122,123,124,125,126,130,131,132,133,134,136,138,139,142,143,144,145,147,149,151,153,154,155,157,158,160,161,162,163,164,165,167,169,171,172,173,178,181,182,184,186,187,188,189,190,191,192,196,197,198,200,201,205,206,208,209,211,],[18,18,54,-8,-9,-60,18,18,18,18,18,18,18,18,18,-21,-22,18,-33,-34,18,-57,-58,18,18,-37,-38,-39,-40,-41,-42,54,-6,-7,-4,18,18,-5,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,54,18,-10,54,-61,18,54,54,18,54,132,-15,54,-23,54,54,18,18,18,18,54,54,-2,-3,54,54,54,-60,18,54,18,-17,-18,-19,-20,54,54,54,54,54,54,54,54,54,18,18,54,18,18,18,54,54,54,18,18,-35,54,54,54,-78,-94,18,-95,-100,54,54,18,54,18,54,54,18,-35,-70,18,-18,-15,18,18,18,-77,18,54,54,-60,-62,-59,-87,54,-92,54,-79,-84,-90,18,-93,-85,-86,-89,18,54,-91,-88,]),'NOT':([0,2,5,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,34,35,36,37,38,39,40,41,44,45,46,47,48,49,50,52,53,54,55,56,57,58,59,60,61,62,63,64,65,67,68,70,71,75,77,78,79,80,81,84,85,86,88,92,93,94,101,104,105,106,107,108,109,110,111,112,113,114,115,116,119,121,123,124,125,132,133,134,142,143,144,145,147,153,155,160,162,163,164,165,167,169,171,172,173,184,186,187,189,191,192,196,197,198,200,201,205,206,209,211,],[21,21,-8,-9,-60,21,21,21,21,21,21,21,21,21,-21,-22,21,-33,-34,21,-57,-58,21,21,-37,-38,-39,-40,-41,-42,-6,-7,-4,21,21,-5,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,-10,-61,21,21,21,-15,-16,-23,-32,21,21,21,21,-102,-2,-3,21,21,-17,-18,-19,-20,-24,-25,-26,-27,-28,-29,-30,-31,21,21,21,21,21,21,21,-35,-78,-94,21,-95,-100,21,21,21,-70,21,-18,-20,21,21,21,-77,21,-62,-59,-87,-92,-79,-84,-90,21,-93,-85,-86,-89,21,-91,-88,]),'STRING':([0,2,5,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,34,35,36,37,38,39,40,41,44,45,46,47,48,49,50,52,53,54,55,56,57,58,59,60,61,62,63,64,65,67,68,70,71,75,77,78,79,80,81,84,85,86,88,92,93,94,101,104,105,106,107,108,109,110,111,112,113,114,115,116,119,121,123,124,125,132,133,134,142,143,144,145,147,153,155,160,162,163,164,165,167,169,171,172,173,184,186,187,189,191,192,196,197,198,200,201,205,206,209,211,],[22,22,-8,-9,-60,22,22,22,22,22,22,22,22,22,-21,-22,22,-33,-34,22,-57,-58,22,22,-37,-38,-39,-40,-41,-42,-6,-7,-4,22,22,-5,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,-10,-61,22,22,22,-15,-16,-23,-32,22,22,22,22,-102,-2,-3,22,22,-17,-18,-19,-20,-24,-25,-26,-27,-28,-29,-30,-31,22,22,22,22,22,22,22,-35,-78,-94,22,-95,-100,22,22,22,-70,22,-18,-20,22,22,22,-77,22,-62,-59,-87,-92,-79,-84,-90,22,-93,-85,-86,-89,22,-91,-88,]),'CHAR':([0,2,5,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,34,35,36,37,38,39,40,41,44,45,46,47,48,49,50,52,53,54,55,56,57,58,59,60,61,62,63,64,65,67,68,70,71,75,77,78,79,80,81,84,85,86,88,92,93,94,101,104,105,106,107,108,109,110,111,112,113,114,115,116,119,121,123,124,125,132,133,134,142,143,144,145,147,153,155,160,162,163,164,165,167,169,171,172,173,184,186,187,189,191,192,196,197,198,200,201,205,206,209,211,],[23,23,-8,-9,-60,23,23,23,23,23,23,23,23,23,-21,-22,23,-33,-34,23,-57,-58,23,23,-37,-38,-39,-40,-41,-42,-6,-7,-4,23,23,-5,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,-10,-61,23,23,23,-15,-16,-23,-32,23,23,23,23,-102,-2,-3,23,23,-17,-18,-19,-20,-24,-25,-26,-27,-28,-29,-30,-31,23,23,23,23,23,23,23,-35,-78,-94,23,-95,-100,23,23,23,-70,23,-18,-20,23,23,23,-77,23,-62,-59,-87,-92,-79,-84,-90,23,-93,-85,-86,-89,23,-91,-88,]),'LPAREN':([0,2,5,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,28,29,30,34,35,36,37,38,39,40,41,44,45,46,47,48,49,50,52,53,54,55,56,57,58,59,60,61,62,63,64,65,67,68,70,71,75,77,78,79,80,81,84,85,86,88,92,93,94,101,104,105,106,107,108,109,110,111,112,113,114,115,116,119,121,123,124,125,132,133,134,135,140,142,143,144,145,147,153,155,160,162,163,164,165,167,169,171,172,173,184,186,187,189,191,192,196,197,198,200,201,203,205,206,209,211,],[24,24,-8,-9,-60,24,71,24,75,24,24,24,24,24,-21,-22,24,-33,-34,24,-57,-58,84,85,86,24,24,-37,-38,-39,-40,-41,-42,-6,-7,-4,24,24,-5,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,123,-61,24,24,24,-15,-16,-23,-32,24,24,24,24,-102,-2,-3,24,71,-17,-18,-19,-20,-24,-25,-26,-27,-28,-29,-30,-31,24,24,24,24,160,24,24,-35,167,171,-78,-94,24,-95,-100,24,24,24,-70,24,-18,-20,24,24,24,-77,24,-62,-59,-87,-92,-79,-84,-90,24,-93,-85,-86,206,-89,24,-91,-88,]),'TRUE':([0,2,5,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,34,35,36,37,38,39,40,41,44,45,46,47,48,49,50,52,53,54,55,56,57,58,59,60,61,62,63,64,65,67,68,70,71,75,77,78,79,80,81,84,85,86,88,92,93,94,101,104,105,106,107,108,109,110,111,112,113,114,115,116,119,121,123,124,125,132,133,134,142,143,144,145,147,153,155,160,162,163,164,165,167,169,171,172,173,184,186,187,189,191,192,196,197,198,200,201,205,206,209,211,],[25,25,-8,-9,-60,25,25,25,25,25,25,25,25,25,-21,-22,25,-33,-34,25,-57,-58,25,25,-37,-38,-39,-40,-41,-42,-6,-7,-4,25,25,-5,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,-10,-61,25,25,25,-15,-16,-23,-32,25,25,25,25,-102,-2,-3,25,25,-17,-18,-19,-20,-24,-25,-26,-27,-28,-29,-30,-31,25,25,25,25,25,25,25,-35,-78,-94,25,-95,-100,25,25,25,-70,25,-18,-20,25,25,25,-77,25,-62,-59,-87,-92,-79,-84,-90,25,-93,-85,-86,-89,25,-91,-88,]),'FALSE':([0,2,5,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,34,35,36,37,38,39,40,41,44,45,46,47,48,49,50,52,53,54,55,56,57,58,59,60,61,62,63,64,65,67,68,70,71,75,77,78,79,80,81,84,85,86,88,92,93,94,101,104,105,106,107,108,109,110,111,112,113,114,115,116,119,121,123,124,125,132,133,134,142,143,144,145,147,153,155,160,162,163,164,165,167,169,171,172,173,184,186,187,189,191,192,196,197,198,200,201,205,206,209,211,],[26,26,-8,-9,-60,26,26,26,26,26,26,26,26,26,-21,-22,26,-33,-34,26,-57,-58,26,26,-37,-38,-39,-40,-41,-42,-6,-7,-4,26,26,-5,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,-10,-61,26,26,26,-15,-16,-23,-32,26,26,26,26,-102,-2,-3,26,26,-17,-18,-19,-20,-24,-25,-26,-27,-28,-29,-30,-31,26,26,26,26,26,26,26,-35,-78,-94,26,-95,-100,26,26,26,-70,26,-18,-20,26,26,26,-77,26,-62,-59,-87,-92,-79,-84,-90,26,-93,-85,-86,-89,26,-91,-88,]),'FUNC':([0,2,5,6,7,19,20,22,23,25,26,44,45,46,49,68,70,78,79,80,81,88,92,93,94,105,106,107,108,109,110,111,112,113,114,115,116,134,142,143,144,145,147,162,172,173,184,186,187,189,191,192,196,198,200,201,205,209,211,],[27,27,-8,-9,-60,-21,-22,-33,-34,-57,-58,-6,-7,-4,-5,-10,-61,-15,-16,-23,-32,27,-102,-2,-3,-17,-18,-19,-20,-24,-25,-26,-27,-28,-29,-30,-31,-35,-78,-94,27,-95,-100,-70,-77,27,-62,-59,-87,-92,-79,-84,-90,-93,-85,-86,-89,-91,-88,]),'IF':([0,2,5,6,7,19,20,22,23,25,26,44,45,46,49,68,70,78,79,80,81,88,92,93,94,105,106,107,108,109,110,111,112,113,114,115,116,134,142,143,144,145,147,162,172,173,184,186,187,189,191,192,196,198,200,201,205,209,211,],[28,28,-8,-9,-60,-21,-22,-33,-34,-57,-58,-6,-7,-4,-5,-10,-61,-15,-16,-23,-32,28,-102,-2,-3,-17,-18,-19,-20,-24,-25,-26,-27,-28,-29,-30,-31,-35,-78,-94,28,-95,-100,-70,-77,28,-62,-59,-87,-92,-79,-84,-90,-93,-85,-86,-89,-91,-88,]),'FOR':([0,2,5,6,7,19,20,22,23,25,26,44,45,46,49,68,70,78,79,80,81,88,92,93,94,105,106,107,108,109,110,111,112,113,114,115,116,134,142,143,144,145,147,162,172,173,184,186,187,189,191,192,196,198,200,201,205,209,211,],[29,29,-8,-9,-60,-21,-22,-33,-34,-57,-58,-6,-7,-4,-5,-10,-61,-15,-16,-23,-32,29,-102,-2,-3,-17,-18,-19,-20,-24,-25,-26,-27,-28,-29,-30,-31,-35,-78,-94,29,-95,-100,-70,-77,29,-62,-59,-87,-92,-79,-84,-90,-93,-85,-86,-89,-91,-88,]),'WHILE':([0,2,5,6,7,19,20,22,23,25,26,44,45,46,49,68,70,78,79,80,81,87,88,92,93,94,105,106,107,108,109,110,111,112,113,114,115,116,134,142,143,144,145,147,162,172,173,184,186,187,189,191,192,196,198,200,201,205,209,211,],[30,30,-8,-9,-60,-21,-22,-33,-34,-57,-58,-6,-7,-4,-5,-10,-61,-15,-16,-23,-32,140,30,-102,-2,-3,-17,-18,-19,-20,-24,-25,-26,-27,-28,-29,-30,-31,-35,-78,-94,30,-95,-100,-70,-77,30,-62,-59,-87,-92,-79,-84,-90,-93,-85,-86,-89,-91,-88,]),'DO':([0,2,5,6,7,19,20,22,23,25,26,44,45,46,49,68,70,78,79,80,81,88,92,93,94,105,106,107,108,109,110,111,112,113,114,115,116,134,142,143,144,145,147,162,172,173,184,186,187,189,191,192,196,198,200,201,205,209,211,],[31,31,-8,-9,-60,-21,-22,-33,-34,-57,-58,-6,-7,-4,-5,-10,-61,-15,-16,-23,-32,31,-102,-2,-3,-17,-18,-19,-20,-24,-25,-26,-27,-28,-29,-30,-31,-35,-78,-94,31,-95,-100,-70,-77,31,-62,-59,-87,-92,-79,-84,-90,-93,-85,-86,-89,-91,-88,]),'STRUCT':([0,2,5,6,7,19,20,22,23,25,26,44,45,46,49,68,70,78,79,80,81,88,92,93,94,105,106,107,108,109,110,111,112,113,114,115,116,134,142,143,144,145,147,162,172,173,184,186,187,189,191,192,196,198,200,201,205,209,211,],[32,32,-8,-9,-60,-21,-22,-33,-34,-57,-58,-6,-7,-4,-5,-10,-61,-15,-16,-23,-32,32,-102,-2,-3,-17,-18,-19,-20,-24,-25,-26,-27,-28,-29,-30,-31,-35,-78,-94,32,-95,-100,-70,-77,32,-62,-59,-87,-92,-79,-84,-90,-93,-85,-86,-89,-91,-88,]),'ENUM':([0,2,5,6,7,19,20,22,23,25,26,44,45,46,49,68,70,78,79,80,81,88,92,93,94,105,106,107,108,109,110,111,112,113,114,115,116,134,142,143,144,145,147,162,172,173,184,186,187,189,191,192,196,198,200,201,205,209,211,],[33,33,-8,-9,-60,-21,-22,-33,-34,-57,-58,-6,-7,-4,-5,-10,-61,-15,-16,-23,-32,33,-102,-2,-3,-17,-18,-19,-20,-24,-25,-26,-27,-28,-29,-30,-31,-35,-78,-94,33,-95,-100,-70,-77,33,-62,-59,-87,-92,-79,-84,-90,-93,-85,-86,-89,-91,-88,]),'CLASS':([0,2,5,6,7,19,20,22,23,25,26,44,45,46,49,68,70,78,79,80,81,88,92,93,94,105,106,107,108,109,110,111,112,113,114,115,116,134,142,143,144,145,147,162,172,173,184,186,187,189,191,192,196,198,200,201,205,209,211,],[34,34,-8,-9,-60,-21,-22,-33,-34,-57,-58,-6,-7,-4,-5,-10,-61,-15,-16,-23,-32,34,-102,-2,-3,-17,-18,-19,-20,-24,-25,-26,-27,-28,-29,-30,-31,-35,-78,-94,34,-95,-100,-70,-77,34,-62,-59,-87,-92,-79,-84,-90,-93,-85,-86,-89,-91,-88,]),'INCLUDE':([0,2,5,6,7,19,20,22,23,25,26,44,45,46,49,68,70,78,79,80,81,88,92,93,94,105,106,107,108,109,110,111,112,113,114,115,116,134,142,143,144,145,147,162,172,173,184,186,187,189,191,192,196,198,200,201,205,209,211,],[35,35,-8,-9,-60,-21,-22,-33,-34,-57,-58,-6,-7,-4,-5,-10,-61,-15,-16,-23,-32,35,-102,-2,-3,-17,-18,-19,-20,-24,-25,-26,-27,-28,-29,-30,-31,-35,-78,-94,35,-95,-100,-70,-77,35,-62,-59,-87,-92,-79,-84,-90,-93,-85,-86,-89,-91,-88,]),'CONST':([0,2,5,6,7,8,19,20,22,23,25,26,36,37,38,39,40,41,44,45,46,48,49,52,68,70,71,75,78,79,80,81,85,88,92,93,94,101,105,106,107,108,109,110,111,112,113,114,115,116,119,123,134,142,143,144,145,147,160,162,163,167,172,173,184,186,187,189,191,192,196,197,198,200,201,205,209,211,],[-36,-36,-8,-9,-60,67,-21,-22,-33,-34,-57,-58,-37,-38,-39,-40,-41,-42,-6,-7,-4,-36,-5,-36,-10,-61,-36,-36,-15,-16,-23,-32,-36,-36,-102,-2,-3,-36,-17,-18,-19,-20,-24,-25,-26,-27,-28,-29,-30,-31,-36,-36,-35,-78,-94,-36,-95,-100,-36,-70,-36,-36,-77,-36,-62,-59,-87,-92,-79,-84,-90,-36,-93,-85,-86,-89,-91,-88,]),'I32':([0,2,5,6,7,19,20,22,23,25,26,27,44,45,46,48,49,52,68,70,71,75,78,79,80,81,85,88,92,93,94,101,105,106,107,108,109,110,111,112,113,114,115,116,119,123,134,142,143,144,145,147,160,162,163,167,172,173,184,186,187,189,191,192,196,197,198,200,201,205,209,211,],[36,36,-8,-9,-60,-21,-22,-33,-34,-57,-58,36,-6,-7,-4,36,-5,36,-10,-61,36,36,-15,-16,-23,-32,36,36,-102,-2,-3,36,-17,-18,-19,-20,-24,-25,-26,-27,-28,-29,-30,-31,36,36,-35,-78,-94,36,-95,-100,36,-70,36,36,-77,36,-62,-59,-87,-92,-79,-84,-90,36,-93,-85,-86,-89,-91,-88,]),'STR':([0,2,5,6,7,19,20,22,23,25,26,27,44,45,46,48,49,52,68,70,71,75,78,79,80,81,85,88,92,93,94,101,105,106,107,108,109,110,111,112,113,114,115,116,119,123,134,142,143,144,145,147,160,162,163,167,172,173,184,186,187,189,191,192,196,197,198,200,201,205,209,211,],[37,37,-8,-9,-60,-21,-22,-33,-34,-57,-58,37,-6,-7,-4,37,-5,37,-10,-61,37,37,-15,-16,-23,-32,37,37,-102,-2,-3,37,-17,-18,-19,-20,-24,-25,-26,-27,-28,-29,-30,-31,37,37,-35,-78,-94,37,-95,-100,37,-70,37,37,-77,37,-62,-59,-87,-92,-79,-84,-90,37,-93,-85,-86,-89,-91,-88,]),'IDOUBLE':([0,2,5,6,7,19,20,22,23,25,26,27,44,45,46,48,49,52,68,70,71,75,78,79,80,81,85,88,92,93,94,101,105,106,107,108,109,110,111,112,113,114,115,116,119,123,134,142,143,144,145,147,160,162,163,167,172,173,184,186,187,189,191,192,196,197,198,200,201,205,209,211,],[38,38,-8,-9,-60,-21,-22,-33,-34,-57,-58,38,-6,-7,-4,38,-5,38,-10,-61,38,38,-15,-16,-23,-32,38,38,-102,-2,-3,38,-17,-18,-19,-20,-24,-25,-26,-27,-28,-29,-30,-31,38,38,-35,-78,-94,38,-95,-100,38,-70,38,38,-77,38,-62,-59,-87,-92,-79,-84,-90,38,-93,-85,-86,-89,-91,-88,]),'CHARACTER':([0,2,5,6,7,19,20,22,23,25,26,27,44,45,46,48,49,52,68,70,71,75,78,79,80,81,85,88,92,93,94,101,105,106,107,108,109,110,111,112,113,114,115,116,119,123,134,142,143,144,145,147,160,162,163,167,172,173,184,186,187,189,191,192,196,197,198,200,201,205,209,211,],[39,39,-8,-9,-60,-21,-22,-33,-34,-57,-58,39,-6,-7,-4,39,-5,39,-10,-61,39,39,-15,-16,-23,-32,39,39,-102,-2,-3,39,-17,-18,-19,-20,-24,-25,-26,-27,-28,-29,-30,-31,39,39,-35,-78,-94,39,-95,-100,39,-70,39,39,-77,39,-62,-59,-87,-92,-79,-84,-90,39,-93,-85,-86,-89,-91,-88,]),'BOOL':([0,2,5,6,7,19,20,22,23,25,26,27,44,45,46,48,49,52,68,70,71,75,78,79,80,81,85,88,92,93,94,101,105,106,107,108,109,110,111,112,113,114,115,116,119,123,134,142,143,144,145,147,160,162,163,167,172,173,184,186,187,189,191,192,196,197,198,200,201,205,209,211,],[40,40,-8,-9,-60,-21,-22,-33,-34,-57,-58,40,-6,-7,-4,40,-5,40,-10,-61,40,40,-15,-16,-23,-32,40,40,-102,-2,-3,40,-17,-18,-19,-20,-24,-25,-26,-27,-28,-29,-30,-31,40,40,-35,-78,-94,40,-95,-100,40,-70,40,40,-77,40,-62,-59,-87,-92,-79,-84,-90,40,-93,-85,-86,-89,-91,-88,]),'VOID':([0,2,5,6,7,19,20,22,23,25,26,27,44,45,46,48,49,52,68,70,71,75,78,79,80,81,85,88,92,93,94,101,105,106,107,108,109,110,111,112,113,114,115,116,119,123,134,142,143,144,145,147,160,162,163,167,172,173,184,186,187,189,191,192,196,197,198,200,201,205,209,211,],[41,41,-8,-9,-60,-21,-22,-33,-34,-57,-58,41,-6,-7,-4,41,-5,41,-10,-61,41,41,-15,-16,-23,-32,41,41,-102,-2,-3,41,-17,-18,-19,-20,-24,-25,-26,-27,-28,-29,-30,-31,41,41,-35,-78,-94,41,-95,-100,41,-70,41,41,-77,41,-62,-59,-87,-92,-79,-84,-90,41,-93,-85,-86,-89,-91,-88,]),'$end':([1,2,5,6,7,19,20,22,23,25,26,44,45,46,49,68,70,78,79,80,81,92,93,94,105,106,107,108,109,110,111,112,113,114,115,116,134,142,143,145,147,162,172,184,186,187,189,191,192,196,198,200,201,205,209,211,],[0,-1,-8,-9,-60,-21,-22,-33,-34,-57,-58,-6,-7,-4,-5,-10,-61,-15,-16,-23,-32,-102,-2,-3,-17,-18,-19,-20,-24,-25,-26,-27,-28,-29,-30,-31,-35,-78,-94,-95,-100,-70,-77,-62,-59,-87,-92,-79,-84,-90,-93,-85,-86,-89,-91,-88,]),'RBRACE':([2,5,6,7,9,10,11,12,19,20,22,23,25,26,44,45,46,49,51,66,68,70,72,73,74,76,78,79,80,81,88,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,118,128,129,131,134,141,142,143,145,147,148,149,150,151,152,158,159,161,162,164,165,172,173,174,175,176,177,178,179,180,181,182,184,185,186,187,189,191,192,194,195,196,198,199,200,201,205,209,211,],[-1,-8,-9,-60,-10,-64,-65,-66,-21,-22,-33,-34,-57,-58,-6,-7,-4,-5,-54,-55,-10,-61,-63,-67,-68,-69,-15,-16,-23,-32,142,-102,-2,-3,-14,-98,-99,-11,-12,-13,-73,-96,-97,-10,-17,-18,-19,-20,-24,-25,-26,-27,-28,-29,-30,-31,-44,-72,-76,-101,-35,172,-78,-94,-95,-100,177,-75,-43,-45,-46,-50,-49,-62,-70,-23,-15,-77,191,192,-83,-80,-71,-52,-51,-56,-47,-48,-62,-74,-59,-87,-92,-79,-84,-81,-53,-90,-93,-82,-85,-86,-89,-91,-88,]),'SEMI':([3,4,7,9,10,11,12,19,20,22,23,25,26,42,43,51,66,68,70,72,73,74,76,78,79,80,81,95,96,97,98,99,100,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,118,131,134,137,150,151,152,158,159,161,162,164,165,177,178,179,180,181,182,184,188,195,],[46,49,-60,-10,-64,-65,-66,-21,-22,-33,-34,-57,-58,93,94,-54,-55,-10,-61,-63,-67,-68,-69,-15,-16,-23,-32,-14,-98,-99,-11,-12,-13,-96,-97,-10,-17,-18,-19,-20,-24,-25,-26,-27,-28,-29,-30,-31,-44,-101,-35,169,-43,-45,-46,-50,-49,-62,-70,-23,-15,-71,-52,-51,-56,-47,-48,-62,197,-53,]),'EQUAL':([3,4,7,9,10,11,12,19,20,22,23,25,26,42,43,51,66,68,69,70,72,73,74,76,78,79,80,81,95,96,97,98,99,100,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,118,120,122,125,126,129,130,131,134,137,138,149,150,151,152,156,157,158,159,161,162,164,165,177,178,179,180,181,182,184,195,204,],[47,50,-60,-10,-64,-65,-66,-21,-22,-33,-34,-57,-58,47,50,-54,119,-10,124,-61,-63,-67,-68,-69,-15,-16,-23,-32,-14,47,50,-11,-12,-13,50,47,-10,-17,-18,-19,-20,-24,-25,-26,-27,-28,-29,-30,-31,-44,153,155,-10,50,47,50,-101,-35,47,50,50,-43,50,47,183,50,-50,-49,-35,-70,-23,-15,-71,-52,-51,-43,-47,-48,-62,-53,47,]),'DOT':([3,4,7,9,10,11,12,19,20,22,23,25,26,42,43,51,66,68,70,72,73,74,76,78,79,80,81,95,96,97,98,99,100,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,118,125,126,129,130,131,134,137,138,149,150,151,152,157,158,159,161,162,164,165,177,178,179,180,181,182,184,195,204,],[48,52,-60,-10,-64,-65,-66,-21,-22,-33,-34,-57,-58,48,52,-54,-55,-10,-61,-63,-67,-68,-69,-15,-16,-23,-32,-14,48,52,-11,-12,-13,52,48,-10,-17,-18,-19,-20,-24,-25,-26,-27,-28,-29,-30,-31,-44,-10,52,48,52,-101,-35,48,52,52,-43,52,48,52,-50,-49,-62,-70,-23,-15,-71,-52,-51,-56,-47,-48,-62,-53,48,]),'PLUS':([4,7,9,19,20,22,23,25,26,43,66,68,69,70,72,73,76,77,78,79,80,81,82,91,92,95,97,98,99,102,104,105,106,107,108,109,110,111,112,113,114,115,116,117,122,125,126,130,131,134,136,138,139,149,151,154,157,158,161,162,164,165,178,181,182,184,188,190,208,],[53,-60,-10,-21,-22,-33,-34,-57,-58,53,53,-10,53,-61,53,53,53,53,-15,53,-23,53,53,53,53,53,53,53,-60,53,-10,-17,-18,-19,-20,53,53,53,53,53,53,53,53,53,53,-10,53,53,53,-35,53,53,53,53,53,53,53,53,-35,-70,-18,-15,53,53,-60,-62,53,53,53,]),'DIVIDE':([4,7,9,19,20,22,23,25,26,43,66,68,69,70,72,73,76,77,78,79,80,81,82,91,92,95,97,98,99,102,104,105,106,107,108,109,110,111,112,113,114,115,116,117,122,125,126,130,131,134,136,138,139,149,151,154,157,158,161,162,164,165,178,181,182,184,188,190,208,],[55,-60,-10,-21,-22,-33,-34,-57,-58,55,55,-10,55,-61,55,55,55,55,-15,55,55,55,55,55,55,55,55,55,-60,55,-10,55,55,-19,-20,55,55,55,55,55,55,55,55,55,55,-10,55,55,55,-35,55,55,55,55,55,55,55,55,-35,-70,55,-15,55,55,-60,-62,55,55,55,]),'EQ':([4,7,9,19,20,22,23,25,26,43,66,68,69,70,72,73,76,77,78,79,80,81,82,91,92,95,97,98,99,102,104,105,106,107,108,109,110,111,112,113,114,115,116,117,122,125,126,130,131,134,136,138,139,149,151,154,157,158,161,162,164,165,178,181,182,184,188,190,208,],[57,-60,-10,-21,-22,-33,-34,-57,-58,57,57,-10,57,-61,57,57,57,57,-15,57,-23,57,57,57,57,57,57,57,-60,57,-10,-17,-18,-19,-20,None,None,None,None,None,None,57,57,57,57,-10,57,57,57,-35,57,57,57,57,57,57,57,57,-35,-70,-18,-15,57,57,-60,-62,57,57,57,]),'NEQ':([4,7,9,19,20,22,23,25,26,43,66,68,69,70,72,73,76,77,78,79,80,81,82,91,92,95,97,98,99,102,104,105,106,107,108,109,110,111,112,113,114,115,116,117,122,125,126,130,131,134,136,138,139,149,151,154,157,158,161,162,164,165,178,181,182,184,188,190,208,],[58,-60,-10,-21,-22,-33,-34,-57,-58,58,58,-10,58,-61,58,58,58,58,-15,58,-23,58,58,58,58,58,58,58,-60,58,-10,-17,-18,-19,-20,None,None,None,None,None,None,58,58,58,58,-10,58,58,58,-35,58,58,58,58,58,58,58,58,-35,-70,-18,-15,58,58,-60,-62,58,58,58,]),'LT':([4,7,9,19,20,22,23,25,26,43,66,68,69,70,72,73,76,77,78,79,80,81,82,91,92,95,97,98,99,102,104,105,106,107,108,109,110,111,112,113,114,115,116,117,122,125,126,130,131,134,136,138,139,149,151,154,157,158,161,162,164,165,178,181,182,184,188,190,208,],[59,-60,-10,-21,-22,-33,-34,-57,-58,59,59,-10,59,-61,59,59,59,59,-15,59,-23,59,59,59,59,59,59,59,-60,59,-10,-17,-18,-19,-20,None,None,None,None,None,None,59,59,59,59,-10,59,59,59,-35,59,59,59,59,59,59,59,59,-35,-70,-18,-15,59,59,-60,-62,59,59,59,]),'LTE':([4,7,9,19,20,22,23,25,26,43,66,68,69,70,72,73,76,77,78,79,80,81,82,91,92,95,97,98,99,102,104,105,106,107,108,109,110,111,112,113,114,115,116,117,122,125,126,130,131,134,136,138,139,149,151,154,157,158,161,162,164,165,178,181,182,184,188,190,208,],[60,-60,-10,-21,-22,-33,-34,-57,-58,60,60,-10,60,-61,60,60,60,60,-15,60,-23,60,60,60,60,60,60,60,-60,60,-10,-17,-18,-19,-20,None,None,None,None,None,None,60,60,60,60,-10,60,60,60,-35,60,60,60,60,60,60,60,60,-35,-70,-18,-15,60,60,-60,-62,60,60,60,]),'GT':([4,7,9,19,20,22,23,25,26,43,66,68,69,70,72,73,76,77,78,79,80,81,82,91,92,95,97,98,99,102,104,105,106,107,108,109,110,111,112,113,114,115,116,117,122,125,126,130,131,134,136,138,139,149,151,154,157,158,161,162,164,165,178,181,182,184,188,190,208,],[61,-60,-10,-21,-22,-33,-34,-57,-58,61,61,-10,61,-61,61,61,61,61,-15,61,-23,61,61,61,61,61,61,61,-60,61,-10,-17,-18,-19,-20,None,None,None,None,None,None,61,61,61,61,-10,61,61,61,-35,61,61,61,61,61,61,61,61,-35,-70,-18,-15,61,61,-60,-62,61,61,61,]),'GTE':([4,7,9,19,20,22,23,25,26,43,66,68,69,70,72,73,76,77,78,79,80,81,82,91,92,95,97,98,99,102,104,105,106,107,108,109,110,111,112,113,114,115,116,117,122,125,126,130,131,134,136,138,139,149,151,154,157,158,161,162,164,165,178,181,182,184,188,190,208,],[62,-60,-10,-21,-22,-33,-34,-57,-58,62,62,-10,62,-61,62,62,62,62,-15,62,-23,62,62,62,62,62,62,62,-60,62,-10,-17,-18,-19,-20,None,None,None,None,None,None,62,62,62,62,-10,62,62,62,-35,62,62,62,62,62,62,62,62,-35,-70,-18,-15,62,62,-60,-62,62,62,62,]),'AND':([4,7,9,19,20,22,23,25,26,43,66,68,69,70,72,73,76,77,78,79,80,81,82,91,92,95,97,98,99,102,104,105,106,107,108,109,110,111,112,113,114,115,116,117,122,125,126,130,131,134,136,138,139,149,151,154,157,158,161,162,164,165,178,181,182,184,188,190,208,],[63,-60,-10,-21,-22,-33,-34,-57,-58,63,63,-10,63,-61,63,63,63,63,-15,63,-23,63,63,63,63,63,63,63,-60,63,-10,-17,-18,-19,-20,-24,-25,-26,-27,-28,-29,63,63,63,63,-10,63,63,63,-35,63,63,63,63,63,63,63,63,-35,-70,-18,-15,63,63,-60,-62,63,63,63,]),'OR':([4,7,9,19,20,22,23,25,26,43,66,68,69,70,72,73,76,77,78,79,80,81,82,91,92,95,97,98,99,102,104,105,106,107,108,109,110,111,112,113,114,115,116,117,122,125,126,130,131,134,136,138,139,149,151,154,157,158,161,162,164,165,178,181,182,184,188,190,208,],[64,-60,-10,-21,-22,-33,-34,-57,-58,64,64,-10,64,-61,64,64,64,64,-15,64,-23,64,64,64,64,64,64,64,-60,64,-10,-17,-18,-19,-20,-24,-25,-26,-27,-28,-29,64,64,64,64,-10,64,64,64,-35,64,64,64,64,64,64,64,64,-35,-70,-18,-15,64,64,-60,-62,64,64,64,]),'LBRACK':([4,7,9,19,20,22,23,25,26,43,66,68,70,78,79,80,81,97,102,104,105,106,107,108,109,110,111,112,113,114,115,116,122,125,126,130,134,138,149,151,157,161,162,184,],[65,-60,-10,-21,-22,-33,-34,-57,-58,65,121,-10,-61,-15,-16,-23,-32,65,65,-10,-17,-18,-19,-20,-24,-25,-26,-27,-28,-29,-30,-31,65,-10,65,65,-35,65,65,65,65,-62,-70,-62,]),'RPAREN':([7,9,10,11,12,19,20,22,23,25,26,51,66,68,70,71,72,73,74,75,76,78,79,80,81,82,95,96,97,98,99,100,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,118,123,125,126,127,128,129,130,131,134,136,139,149,150,151,152,157,158,159,160,161,162,164,165,167,177,178,179,180,181,182,184,185,190,195,204,208,],[-60,-10,-64,-65,-66,-21,-22,-33,-34,-57,-58,-54,-55,-10,-61,-73,-63,-67,-68,-73,-69,-15,-16,-23,-32,134,-14,-98,-99,-11,-12,-13,-96,-97,-10,-17,-18,-19,-20,-24,-25,-26,-27,-28,-29,-30,-31,-44,-73,-10,161,162,-72,-76,134,-101,-35,168,170,-75,-43,-45,-46,184,-50,-49,-73,-62,-70,-23,-15,-73,-71,-52,-51,-56,-47,-48,-62,-74,198,-53,207,210,]),'COMMA':([7,9,10,11,12,19,20,22,23,25,26,51,66,68,70,71,72,73,74,75,76,78,79,80,81,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,118,123,125,126,127,128,129,130,131,134,148,149,150,151,152,157,158,159,160,161,162,164,165,167,174,175,176,177,178,179,180,181,182,184,185,194,195,199,],[-60,-10,-64,-65,-66,-21,-22,-33,-34,-57,-58,-54,-55,-10,-61,-73,-63,-67,-68,-73,-69,-15,-16,-23,-32,-14,-98,-99,-11,-12,-13,-73,-96,-97,-10,-17,-18,-19,-20,-24,-25,-26,-27,-28,-29,-30,-31,-44,-73,-10,-75,163,-72,-76,-75,-101,-35,163,-75,-43,-45,-46,-75,-50,-49,-73,-62,-70,-23,-15,-73,193,-83,-80,-71,-52,-51,-56,-47,-48,-62,-74,-81,-53,-82,]),'LBRACE':([7,19,20,22,23,25,26,31,50,68,70,78,79,80,81,89,90,91,105,106,107,108,109,110,111,112,113,114,115,116,124,134,153,162,166,168,170,183,184,202,207,210,],[-60,-21,-22,-33,-34,-57,-58,88,101,-10,-61,-15,-16,-23,-32,144,146,88,-17,-18,-19,-20,-24,-25,-26,-27,-28,-29,-30,-31,101,-35,101,-70,88,88,88,101,-62,88,88,88,]),'RBRACK':([7,19,20,22,23,25,26,65,68,70,78,79,80,81,105,106,107,108,109,110,111,112,113,114,115,116,117,121,134,154,162,184,],[-60,-21,-22,-33,-34,-57,-58,118,-10,-61,-15,-16,-23,-32,-17,-18,-19,-20,-24,-25,-26,-27,-28,-29,-30,-31,150,118,-35,180,-70,-62,]),'ELSE':([142,172,187,196,201,211,],[-78,-77,-87,202,-86,-88,]),'ELIF':([142,172,187,196,201,211,],[-78,-77,-87,203,-86,-88,]),}
 
@@ -27,106 +27,106 @@ for _k, _v in _lr_goto_items.items():
 del _lr_goto_items
 _lr_productions = [
   ("S' -> program","S'",1,None,None,None),
-  ('program -> statements','program',1,'p_program','parser.py',23),
-  ('statements -> statements statement SEMI','statements',3,'p_program_multiple','parser.py',28),
-  ('statements -> statements expression SEMI','statements',3,'p_program_multiple','parser.py',29),
-  ('statements -> statement SEMI','statements',2,'p_program_multiple','parser.py',30),
-  ('statements -> expression SEMI','statements',2,'p_program_multiple','parser.py',31),
-  ('statements -> statements scope','statements',2,'p_program_block','parser.py',38),
-  ('statements -> statements module','statements',2,'p_program_block','parser.py',39),
-  ('statements -> scope','statements',1,'p_program_block','parser.py',40),
-  ('statements -> module','statements',1,'p_program_block','parser.py',41),
-  ('expression -> ID','expression',1,'p_expression_id','parser.py',49),
-  ('statement -> expression EQUAL expression','statement',3,'p_statement_assign','parser.py',54),
-  ('statement -> expression EQUAL functionCall','statement',3,'p_statement_assign','parser.py',55),
-  ('statement -> expression EQUAL group','statement',3,'p_statement_assign','parser.py',56),
-  ('statement -> statement EQUAL expression','statement',3,'p_statement_assign','parser.py',57),
-  ('expression -> TIMES expression','expression',2,'p_pointer_expression','parser.py',64),
-  ('expression -> REF expression','expression',2,'p_reference_expression','parser.py',68),
-  ('expression -> expression PLUS expression','expression',3,'p_expression_addsub','parser.py',73),
-  ('expression -> expression MINUS expression','expression',3,'p_expression_addsub','parser.py',74),
-  ('expression -> expression DIVIDE expression','expression',3,'p_expression_muldiv','parser.py',78),
-  ('expression -> expression TIMES expression','expression',3,'p_expression_muldiv','parser.py',79),
-  ('expression -> NUMBER','expression',1,'p_expression_number','parser.py',84),
-  ('expression -> FLOAT','expression',1,'p_expression_floatNumber','parser.py',89),
-  ('expression -> MINUS expression','expression',2,'p_expression_uminus','parser.py',94),
-  ('expression -> expression EQ expression','expression',3,'p_expression_compare','parser.py',99),
-  ('expression -> expression NEQ expression','expression',3,'p_expression_compare','parser.py',100),
-  ('expression -> expression LT expression','expression',3,'p_expression_compare','parser.py',101),
-  ('expression -> expression LTE expression','expression',3,'p_expression_compare','parser.py',102),
-  ('expression -> expression GT expression','expression',3,'p_expression_compare','parser.py',103),
-  ('expression -> expression GTE expression','expression',3,'p_expression_compare','parser.py',104),
-  ('expression -> expression AND expression','expression',3,'p_expression_logical','parser.py',109),
-  ('expression -> expression OR expression','expression',3,'p_expression_logical','parser.py',110),
-  ('expression -> NOT expression','expression',2,'p_expression_logical','parser.py',111),
-  ('expression -> STRING','expression',1,'p_expression_string','parser.py',119),
-  ('expression -> CHAR','expression',1,'p_expression_character','parser.py',124),
-  ('expression -> LPAREN expression RPAREN','expression',3,'p_expression_group','parser.py',129),
-  ('type -> <empty>','type',0,'p_type','parser.py',134),
-  ('type -> I32','type',1,'p_type','parser.py',135),
-  ('type -> STR','type',1,'p_type','parser.py',136),
-  ('type -> IDOUBLE','type',1,'p_type','parser.py',137),
-  ('type -> CHARACTER','type',1,'p_type','parser.py',138),
-  ('type -> BOOL','type',1,'p_type','parser.py',139),
-  ('type -> VOID','type',1,'p_type','parser.py',140),
-  ('BSize -> LBRACK expression RBRACK','BSize',3,'p_brackIndex','parser.py',145),
-  ('BSize -> LBRACK RBRACK','BSize',2,'p_brackIndex','parser.py',146),
-  ('statement -> type expression EQUAL expression','statement',4,'p_declaration','parser.py',154),
-  ('statement -> type expression EQUAL statement','statement',4,'p_declaration','parser.py',155),
-  ('statement -> type CONST expression EQUAL expression','statement',5,'p_declaration','parser.py',156),
-  ('statement -> type CONST expression EQUAL functionCall','statement',5,'p_declaration','parser.py',157),
-  ('statement -> ID expression EQUAL group','statement',4,'p_newStruct','parser.py',164),
-  ('statement -> ID expression EQUAL expression','statement',4,'p_newStruct','parser.py',165),
-  ('statement -> type expression BSize EQUAL group','statement',5,'p_arrayDeclaration','parser.py',170),
-  ('statement -> type expression BSize EQUAL expression','statement',5,'p_arrayDeclaration','parser.py',171),
-  ('statement -> type CONST expression BSize EQUAL group','statement',6,'p_arrayDeclaration','parser.py',172),
-  ('statement -> expression BSize','statement',2,'p_getArray','parser.py',180),
-  ('statement -> type expression','statement',2,'p_declaration_no_assign','parser.py',185),
-  ('statement -> type expression LBRACK expression RBRACK','statement',5,'p_declaration_no_assign','parser.py',186),
-  ('expression -> TRUE','expression',1,'p_expression_true','parser.py',195),
-  ('expression -> FALSE','expression',1,'p_expression_false','parser.py',199),
-  ('scope -> FUNC type ID groupArgs block','scope',5,'p_function_creation','parser.py',204),
-  ('expression -> functionCall','expression',1,'p_functionCallStatement','parser.py',209),
-  ('functionCall -> ID groupArgs','functionCall',2,'p_function_call','parser.py',213),
-  ('functionCall -> ID LPAREN expression RPAREN','functionCall',4,'p_function_call','parser.py',214),
-  ('statement -> RETURN expression','statement',2,'p_return_statement','parser.py',222),
-  ('statement -> RETURN','statement',1,'p_return_statement','parser.py',223),
-  ('statement -> BREAK','statement',1,'p_controlFlow','parser.py',230),
-  ('statement -> CONTINUE','statement',1,'p_controlFlow','parser.py',231),
-  ('statement -> WRITE expression','statement',2,'p_print_expression','parser.py',236),
-  ('statement -> WRITE groupArgs','statement',2,'p_print_expression','parser.py',237),
-  ('statement -> READ expression','statement',2,'p_write_expression','parser.py',241),
-  ('groupArgs -> LPAREN groupList RPAREN','groupArgs',3,'p_groupArgs','parser.py',247),
-  ('group -> LBRACE groupList RBRACE','group',3,'p_group','parser.py',251),
-  ('groupList -> item','groupList',1,'p_single_group','parser.py',255),
-  ('groupList -> <empty>','groupList',0,'p_single_group','parser.py',256),
-  ('groupList -> groupList COMMA item','groupList',3,'p_multi_group','parser.py',263),
-  ('item -> expression','item',1,'p_item','parser.py',267),
-  ('item -> statement','item',1,'p_item','parser.py',268),
-  ('block -> LBRACE program RBRACE','block',3,'p_block','parser.py',273),
-  ('block -> LBRACE RBRACE','block',2,'p_block','parser.py',274),
-  ('groupBlock -> LBRACE statements RBRACE','groupBlock',3,'p_groupBlock','parser.py',282),
-  ('IDs -> ID','IDs',1,'p_IDs','parser.py',288),
-  ('IDs -> ID NUMBER','IDs',2,'p_IDs','parser.py',289),
-  ('IDlists -> IDlists COMMA IDs','IDlists',3,'p_IDLists','parser.py',298),
-  ('IDlists -> IDs','IDlists',1,'p_IDLists','parser.py',299),
-  ('groupID -> LBRACE IDlists RBRACE','groupID',3,'p_groupID','parser.py',307),
-  ('scope -> IF LPAREN expression RPAREN block elseif_list else_opt','scope',7,'p_statement_if','parser.py',313),
-  ('elseif_list -> elseif_list elseif','elseif_list',2,'p_elseif_multi','parser.py',317),
-  ('elseif_list -> <empty>','elseif_list',0,'p_elseif_empty','parser.py',321),
-  ('elseif -> ELIF LPAREN expression RPAREN block','elseif',5,'p_elseif_single','parser.py',325),
-  ('else_opt -> ELSE block','else_opt',2,'p_else_opt','parser.py',329),
-  ('else_opt -> <empty>','else_opt',0,'p_else_opt','parser.py',330),
-  ('scope -> FOR LPAREN statement SEMI expression SEMI statement RPAREN block','scope',9,'p_forloop','parser.py',339),
-  ('scope -> WHILE LPAREN expression RPAREN block','scope',5,'p_whileloop','parser.py',343),
-  ('scope -> DO block WHILE LPAREN expression RPAREN','scope',6,'p_doWhileLoop','parser.py',347),
-  ('scope -> STRUCT ID groupBlock','scope',3,'p_struct','parser.py',353),
-  ('scope -> ENUM ID groupID','scope',3,'p_enum','parser.py',357),
-  ('statement -> expression DOT expression','statement',3,'p_dot_access','parser.py',363),
-  ('statement -> expression DOT statement','statement',3,'p_dot_access','parser.py',364),
-  ('statement -> statement DOT statement','statement',3,'p_dot_access','parser.py',365),
-  ('statement -> statement DOT expression','statement',3,'p_dot_access','parser.py',366),
-  ('scope -> CLASS expression block','scope',3,'p_class','parser.py',371),
-  ('statement -> DEFINE expression expression','statement',3,'p_define','parser.py',376),
-  ('module -> INCLUDE expression','module',2,'p_include_package','parser.py',381),
+  ('program -> statements','program',1,'p_program','parser.py',47),
+  ('statements -> statements statement SEMI','statements',3,'p_program_multiple','parser.py',52),
+  ('statements -> statements expression SEMI','statements',3,'p_program_multiple','parser.py',53),
+  ('statements -> statement SEMI','statements',2,'p_program_multiple','parser.py',54),
+  ('statements -> expression SEMI','statements',2,'p_program_multiple','parser.py',55),
+  ('statements -> statements scope','statements',2,'p_program_block','parser.py',62),
+  ('statements -> statements module','statements',2,'p_program_block','parser.py',63),
+  ('statements -> scope','statements',1,'p_program_block','parser.py',64),
+  ('statements -> module','statements',1,'p_program_block','parser.py',65),
+  ('expression -> ID','expression',1,'p_expression_id','parser.py',73),
+  ('statement -> expression EQUAL expression','statement',3,'p_statement_assign','parser.py',78),
+  ('statement -> expression EQUAL functionCall','statement',3,'p_statement_assign','parser.py',79),
+  ('statement -> expression EQUAL group','statement',3,'p_statement_assign','parser.py',80),
+  ('statement -> statement EQUAL expression','statement',3,'p_statement_assign','parser.py',81),
+  ('expression -> TIMES expression','expression',2,'p_pointer_expression','parser.py',88),
+  ('expression -> REF expression','expression',2,'p_reference_expression','parser.py',92),
+  ('expression -> expression PLUS expression','expression',3,'p_expression_addsub','parser.py',97),
+  ('expression -> expression MINUS expression','expression',3,'p_expression_addsub','parser.py',98),
+  ('expression -> expression DIVIDE expression','expression',3,'p_expression_muldiv','parser.py',102),
+  ('expression -> expression TIMES expression','expression',3,'p_expression_muldiv','parser.py',103),
+  ('expression -> NUMBER','expression',1,'p_expression_number','parser.py',108),
+  ('expression -> FLOAT','expression',1,'p_expression_floatNumber','parser.py',113),
+  ('expression -> MINUS expression','expression',2,'p_expression_uminus','parser.py',118),
+  ('expression -> expression EQ expression','expression',3,'p_expression_compare','parser.py',123),
+  ('expression -> expression NEQ expression','expression',3,'p_expression_compare','parser.py',124),
+  ('expression -> expression LT expression','expression',3,'p_expression_compare','parser.py',125),
+  ('expression -> expression LTE expression','expression',3,'p_expression_compare','parser.py',126),
+  ('expression -> expression GT expression','expression',3,'p_expression_compare','parser.py',127),
+  ('expression -> expression GTE expression','expression',3,'p_expression_compare','parser.py',128),
+  ('expression -> expression AND expression','expression',3,'p_expression_logical','parser.py',133),
+  ('expression -> expression OR expression','expression',3,'p_expression_logical','parser.py',134),
+  ('expression -> NOT expression','expression',2,'p_expression_logical','parser.py',135),
+  ('expression -> STRING','expression',1,'p_expression_string','parser.py',143),
+  ('expression -> CHAR','expression',1,'p_expression_character','parser.py',148),
+  ('expression -> LPAREN expression RPAREN','expression',3,'p_expression_group','parser.py',153),
+  ('type -> <empty>','type',0,'p_type','parser.py',158),
+  ('type -> I32','type',1,'p_type','parser.py',159),
+  ('type -> STR','type',1,'p_type','parser.py',160),
+  ('type -> IDOUBLE','type',1,'p_type','parser.py',161),
+  ('type -> CHARACTER','type',1,'p_type','parser.py',162),
+  ('type -> BOOL','type',1,'p_type','parser.py',163),
+  ('type -> VOID','type',1,'p_type','parser.py',164),
+  ('BSize -> LBRACK expression RBRACK','BSize',3,'p_brackIndex','parser.py',169),
+  ('BSize -> LBRACK RBRACK','BSize',2,'p_brackIndex','parser.py',170),
+  ('statement -> type expression EQUAL expression','statement',4,'p_declaration','parser.py',178),
+  ('statement -> type expression EQUAL statement','statement',4,'p_declaration','parser.py',179),
+  ('statement -> type CONST expression EQUAL expression','statement',5,'p_declaration','parser.py',180),
+  ('statement -> type CONST expression EQUAL functionCall','statement',5,'p_declaration','parser.py',181),
+  ('statement -> ID expression EQUAL group','statement',4,'p_newStruct','parser.py',188),
+  ('statement -> ID expression EQUAL expression','statement',4,'p_newStruct','parser.py',189),
+  ('statement -> type expression BSize EQUAL group','statement',5,'p_arrayDeclaration','parser.py',194),
+  ('statement -> type expression BSize EQUAL expression','statement',5,'p_arrayDeclaration','parser.py',195),
+  ('statement -> type CONST expression BSize EQUAL group','statement',6,'p_arrayDeclaration','parser.py',196),
+  ('statement -> expression BSize','statement',2,'p_getArray','parser.py',204),
+  ('statement -> type expression','statement',2,'p_declaration_no_assign','parser.py',209),
+  ('statement -> type expression LBRACK expression RBRACK','statement',5,'p_declaration_no_assign','parser.py',210),
+  ('expression -> TRUE','expression',1,'p_expression_true','parser.py',219),
+  ('expression -> FALSE','expression',1,'p_expression_false','parser.py',223),
+  ('scope -> FUNC type ID groupArgs block','scope',5,'p_function_creation','parser.py',228),
+  ('expression -> functionCall','expression',1,'p_functionCallStatement','parser.py',233),
+  ('functionCall -> ID groupArgs','functionCall',2,'p_function_call','parser.py',237),
+  ('functionCall -> ID LPAREN expression RPAREN','functionCall',4,'p_function_call','parser.py',238),
+  ('statement -> RETURN expression','statement',2,'p_return_statement','parser.py',246),
+  ('statement -> RETURN','statement',1,'p_return_statement','parser.py',247),
+  ('statement -> BREAK','statement',1,'p_controlFlow','parser.py',254),
+  ('statement -> CONTINUE','statement',1,'p_controlFlow','parser.py',255),
+  ('statement -> WRITE expression','statement',2,'p_print_expression','parser.py',260),
+  ('statement -> WRITE groupArgs','statement',2,'p_print_expression','parser.py',261),
+  ('statement -> READ expression','statement',2,'p_write_expression','parser.py',265),
+  ('groupArgs -> LPAREN groupList RPAREN','groupArgs',3,'p_groupArgs','parser.py',271),
+  ('group -> LBRACE groupList RBRACE','group',3,'p_group','parser.py',275),
+  ('groupList -> item','groupList',1,'p_single_group','parser.py',279),
+  ('groupList -> <empty>','groupList',0,'p_single_group','parser.py',280),
+  ('groupList -> groupList COMMA item','groupList',3,'p_multi_group','parser.py',287),
+  ('item -> expression','item',1,'p_item','parser.py',291),
+  ('item -> statement','item',1,'p_item','parser.py',292),
+  ('block -> LBRACE program RBRACE','block',3,'p_block','parser.py',297),
+  ('block -> LBRACE RBRACE','block',2,'p_block','parser.py',298),
+  ('groupBlock -> LBRACE statements RBRACE','groupBlock',3,'p_groupBlock','parser.py',306),
+  ('IDs -> ID','IDs',1,'p_IDs','parser.py',312),
+  ('IDs -> ID NUMBER','IDs',2,'p_IDs','parser.py',313),
+  ('IDlists -> IDlists COMMA IDs','IDlists',3,'p_IDLists','parser.py',322),
+  ('IDlists -> IDs','IDlists',1,'p_IDLists','parser.py',323),
+  ('groupID -> LBRACE IDlists RBRACE','groupID',3,'p_groupID','parser.py',331),
+  ('scope -> IF LPAREN expression RPAREN block elseif_list else_opt','scope',7,'p_statement_if','parser.py',337),
+  ('elseif_list -> elseif_list elseif','elseif_list',2,'p_elseif_multi','parser.py',341),
+  ('elseif_list -> <empty>','elseif_list',0,'p_elseif_empty','parser.py',345),
+  ('elseif -> ELIF LPAREN expression RPAREN block','elseif',5,'p_elseif_single','parser.py',349),
+  ('else_opt -> ELSE block','else_opt',2,'p_else_opt','parser.py',353),
+  ('else_opt -> <empty>','else_opt',0,'p_else_opt','parser.py',354),
+  ('scope -> FOR LPAREN statement SEMI expression SEMI statement RPAREN block','scope',9,'p_forloop','parser.py',363),
+  ('scope -> WHILE LPAREN expression RPAREN block','scope',5,'p_whileloop','parser.py',367),
+  ('scope -> DO block WHILE LPAREN expression RPAREN','scope',6,'p_doWhileLoop','parser.py',371),
+  ('scope -> STRUCT ID groupBlock','scope',3,'p_struct','parser.py',377),
+  ('scope -> ENUM ID groupID','scope',3,'p_enum','parser.py',381),
+  ('statement -> expression DOT expression','statement',3,'p_dot_access','parser.py',387),
+  ('statement -> expression DOT statement','statement',3,'p_dot_access','parser.py',388),
+  ('statement -> statement DOT statement','statement',3,'p_dot_access','parser.py',389),
+  ('statement -> statement DOT expression','statement',3,'p_dot_access','parser.py',390),
+  ('scope -> CLASS expression block','scope',3,'p_class','parser.py',395),
+  ('statement -> DEFINE expression expression','statement',3,'p_define','parser.py',400),
+  ('module -> INCLUDE expression','module',2,'p_include_package','parser.py',405),
 ]
@@ -0,0 +1,501 @@
+import gc
+
+from src.lexer.lexer import Lexer
+from src.ast import ast
+
+# hand-written recursive-descent backend, builds the same tree as the PLY
+# Parser (including the way its LALR conflicts are resolved) without a
+# YaccProduction per reduction
+
+class ParseError(Exception):
+    def __init__(self, pos):
+        self.pos = pos
+
+TYPES = {'I32', 'STR', 'IDOUBLE', 'CHARACTER', 'BOOL', 'VOID'}
+SCOPES = {'FUNC', 'IF', 'FOR', 'WHILE', 'DO', 'STRUCT', 'ENUM', 'CLASS'}
+
+# binding powers, same order as Parser.precedence; and/or have no precedence
+# there so they bind loosest and group to the right
+INFIX = {
+    'AND': 1, 'OR': 1,
+    'EQ': 2, 'NEQ': 2, 'LT': 2, 'LTE': 2, 'GT': 2, 'GTE': 2,
+    'PLUS': 3, 'MINUS': 3,
+    'TIMES': 4, 'DIVIDE': 4,
+}
+LOGICAL = 1
+COMPARE = 2
+
+EXPR_START = {'ID', 'NUMBER', 'FLOAT', 'STRING', 'CHAR', 'TRUE', 'FALSE', 'LPAREN', 'TIMES', 'REF', 'MINUS', 'NOT'}
+
+# at the start of a statement "ID <one of these>" is a struct declaration
+# (statement : ID expression EQUAL ...), PLY shifts instead of reducing ID
+DECL_START = EXPR_START - {'LPAREN'}
+
+# "#define N -1": after the macro name * and - start the value, not an operator
+DEFINE_STOP = {'TIMES', 'MINUS'}
+
+class RDParser:
+
+    def __init__(self, optimize=False):
+        self.lexer = Lexer(optimize)
+        self.errors = 0                     # syntax errors of the last parse
+
+    # the token arrays are read directly, values are sliced from the text
+    # and converted where the grammar knows their type
+    def parse(self, text):
+        collect = gc.isenabled()
+        gc.disable()                    # tokens and nodes are only allocated, no cycles to collect
+        try:
+            self.lexer.errors = 0
+            self.tokens = tokens = self.lexer.tokenize_compact(text)
+            names = tokens.typeNames
+            self.types = [names[t] for t in tokens.types]
+            self.types.append('$end')
+            self.text = text
+            self.offsets = tokens.offsets
+            self.lengths = tokens.lengths
+            self.lines = tokens.lines
+            self.pos = 0
+            self.errors = 0
+
+            try:
+                return self.program(self.statements('$end'))
+            except ParseError as e:
+                self.error(e.pos)
+                return None
+        finally:
+            if collect:
+                gc.enable()
+
+    # tokens always come from the compact TokenBuffer
+    parse_compact = parse
+
+    def parse_file(self, filename):
+        with open(filename, 'r') as file:
+            return self.parse(file.read())
+
+    # same messages as Parser.p_error
+    def error(self, pos):
+        self.errors += 1
+        if pos < len(self.tokens):
+            print('(parser) Syntax Error', self.tokens[pos])
+        else:
+            print('(parser) Syntax Error at EOF ->', None, '<-')
+
+    # source text of the token at pos
+    def value(self, pos):
+        offset = self.offsets[pos]
+        return self.text[offset:offset + self.lengths[pos]]
+
+    # source span of the token at pos, same spans as Parser.span
+    def span(self, node, pos):
+        node.span = self.offsets[pos] << 32 | self.lines[pos]       # ast.packSpan, inlined
+        return node
+
+    # span copied from the node the source starts with
+    def spanOf(self, node, first):
+        node.span = first.span
+        return node
+
+    def program(self, nodes):
+        return self.spanOf(ast.Program(nodes), nodes[0])
+
+    def expect(self, tokType):
+        if self.types[self.pos] != tokType:
+            raise ParseError(self.pos)
+        self.pos += 1
+        return self.pos - 1
+
+    # statements : (statement SEMI | expression SEMI | scope | module)+
+    def statements(self, end):
+        types = self.types
+        nodes = []
+        while True:
+            t = types[self.pos]
+            if t in SCOPES:
+                nodes.append(self.scope(t))
+            elif t == 'INCLUDE':
+                start = self.pos
+                self.pos += 1
+                nodes.append(self.span(ast.Include(self.expression()), start))
+            else:
+                nodes.append(self.statement()[0])
+                self.expect('SEMI')
+
+            if types[self.pos] == end and nodes:
+                return nodes
+
+    # statement or expression, returns (node, True if it is a statement)
+    def statement(self):
+        types = self.types
+        start = self.pos
+        t = types[start]
+
+        if t in TYPES:
+            node = self.declaration()
+        elif t == 'RETURN':
+            self.pos += 1
+            value = self.expression() if types[self.pos] in EXPR_START else None
+            node = self.span(ast.Return(value), start)
+        elif t == 'BREAK' or t == 'CONTINUE':
+            node = self.span(ast.ControlFlow(self.value(start)), start)
+            self.pos += 1
+        elif t == 'WRITE':
+            node = self.span(self.write(), start)
+        elif t == 'READ':
+            self.pos += 1
+            node = self.span(ast.Read(self.expression()), start)
+        elif t == 'DEFINE':
+            self.pos += 1
+            name = self.infix(self.prefix(), 0, DEFINE_STOP)
+            node = self.span(ast.Define(name, self.expression()), start)
+        elif t == 'ID' and types[self.pos + 1] in DECL_START:
+            node = self.structDeclaration()
+        else:
+            if t == 'ID' and types[self.pos + 1] == 'LPAREN':
+                node, isStatement = self.callStatement()
+                if isStatement:
+                    return self.statementTail(node), True
+            else:
+                node = self.expression()
+
+            node, isStatement = self.expressionTail(node)
+            if not isStatement:
+                return node, False
+
+        return self.statementTail(node), True
+
+    # expression BSize | expression EQUAL ... | expression DOT ...
+    def expressionTail(self, node):
+        t = self.types[self.pos]
+        if t == 'LBRACK':
+            return self.spanOf(ast.getArray(node, self.bsize()), node), True
+        if t == 'EQUAL':
+            self.pos += 1
+            value = self.group() if self.types[self.pos] == 'LBRACE' else self.expression()
+            return self.spanOf(ast.Assign(node, value), node), True
+        if t == 'DOT':
+            self.pos += 1
+            return self.spanOf(ast.Access(node, self.statement()[0]), node), True
+        return node, False
+
+    # statement EQUAL expression | statement DOT (statement | expression)
+    def statementTail(self, node):
+        types = self.types
+        while True:
+            t = types[self.pos]
+            if t == 'EQUAL':
+                self.pos += 1
+                node = self.spanOf(ast.Assign(node, self.expression()), node)
+            elif t == 'DOT':
+                self.pos += 1
+                node = self.spanOf(ast.Access(node, self.statement()[0]), node)
+            else:
+                return node
+
+    # type [CONST] expression [BSize] [EQUAL value]
+    def declaration(self):
+        types = self.types
+        _type = self.value(self.pos)
+        self.pos += 1
+        const = types[self.pos] == 'CONST'
+        if const:
+            self.pos += 1
+        name = self.expression()
+        return self.spanOf(self.declarationTail(name, _type, const), name)
+
+    # rest of a declaration after the name
+    def declarationTail(self, name, _type, const):
+        types = self.types
+
+        if types[self.pos] == 'LBRACK':
+            size = self.bsize()
+            if types[self.pos] == 'EQUAL':
+                self.pos += 1
+                if const or types[self.pos] == 'LBRACE':
+                    value = self.group()
+                else:
+                    value = self.expression()
+                return ast.Assign(name, value, self.spanOf(ast.Array(_type, size), name), const)
+            if const or size == 'empty':
+                raise ParseError(self.pos)
+            return ast.Assign(name, None, self.spanOf(ast.Array(_type, size), name))
+
+        if types[self.pos] == 'EQUAL':
+            self.pos += 1
+            if const:
+                return ast.Assign(name, self.expression(), _type, True)
+            return ast.Assign(name, self.statement()[0], _type)
+
+        if const:
+            raise ParseError(self.pos)
+        return ast.Assign(name, None, _type)
+
+    # ID expression EQUAL (group | expression), ex. Student s = {...}
+    def structDeclaration(self):
+        _type = self.value(self.pos)
+        self.pos += 1
+        name = self.expression()
+        self.expect('EQUAL')
+        value = self.group() if self.types[self.pos] == 'LBRACE' else self.expression()
+        return self.spanOf(ast.Assign(name, value, _type), name)
+
+    # "ID ( expression )" at the start of a statement is either a call or a
+    # struct declaration with a parenthesized name, decided by what follows
+    # (f(1) = 2 and f(1) + 2 = 3 are declarations, f(1, 2) + 3 is a call)
+    def callStatement(self):
+        start = self.pos
+        name = self.value(start)
+        self.pos += 2
+        items, single = self.groupList('RPAREN')
+        self.expect('RPAREN')
+        call = self.span(ast.FunctionCall(name, self.span(ast.Group(items), start + 1)), start)
+
+        if single is not None:
+            t = self.types[self.pos]
+            if t == 'EQUAL' or t in INFIX:
+                single = self.infix(single, 0)
+                self.expect('EQUAL')
+                value = self.group() if self.types[self.pos] == 'LBRACE' else self.expression()
+                return self.spanOf(ast.Assign(single, value, name), single), True
+            return call, False
+
+        return self.infix(call, 0), False
+
+    # WRITE expression | WRITE groupArgs
+    def write(self):
+        self.pos += 1
+        if self.types[self.pos] != 'LPAREN':
+            return ast.Write(self.expression())
+
+        start = self.pos
+        self.pos += 1
+        items, single = self.groupList('RPAREN')
+        self.expect('RPAREN')
+        if single is not None:          # write(expression) ...
+            return ast.Write(self.infix(single, 0))
+        return ast.Write(self.span(ast.Group(items), start))
+
+    # [expression] or [] -> "empty"
+    def bsize(self):
+        self.pos += 1
+        if self.types[self.pos] == 'RBRACK':
+            self.pos += 1
+            return 'empty'
+        size = self.expression()
+        self.expect('RBRACK')
+        return size
+
+    # items separated by commas, returns (items, the item if it is a lone expression)
+    def groupList(self, end):
+        types = self.types
+        items = []
+        if types[self.pos] == end:
+            return items, None
+
+        if types[self.pos] != 'COMMA':
+            node, isStatement = self.statement()
+            items.append(node)
+            if not isStatement and types[self.pos] == end:
+                return items, node
+
+        while types[self.pos] == 'COMMA':
+            self.pos += 1
+            items.append(self.statement()[0])
+        return items, None
+
+    def group(self):
+        start = self.expect('LBRACE')
+        items = self.groupList('RBRACE')[0]
+        self.expect('RBRACE')
+        return self.span(ast.Group(items), start)
+
+    def groupArgs(self):
+        start = self.expect('LPAREN')
+        items = self.groupList('RPAREN')[0]
+        self.expect('RPAREN')
+        return self.span(ast.Group(items), start)
+
+    def block(self):
+        self.expect('LBRACE')
+        if self.types[self.pos] == 'RBRACE':
+            self.pos += 1
+            return []
+        program = self.program(self.statements('RBRACE'))
+        self.expect('RBRACE')
+        return program
+
+    # EXPRESSIONS (Pratt)
+
+    def expression(self, rbp=0):
+        return self.infix(self.prefix(), rbp)
+
+    # operands are parsed by infix(prefix()) directly, one call less per
+    # operand than expression()
+    def infix(self, left, rbp, stop=()):
+        types = self.types
+        while True:
+            pos = self.pos
+            t = types[pos]
+            lbp = INFIX.get(t)
+            if lbp is None or lbp <= rbp or t in stop:
+                return left
+
+            offset = self.offsets[pos]
+            op = self.text[offset:offset + self.lengths[pos]]
+            self.pos = pos + 1
+            if lbp == LOGICAL:
+                node = ast.LogicalOp(op, left, self.infix(self.prefix(), lbp - 1))
+            elif lbp == COMPARE:
+                node = ast.CompareOp(op, left, self.infix(self.prefix(), lbp))
+                if INFIX.get(types[self.pos]) == COMPARE:       # nonassoc
+                    raise ParseError(self.pos)
+            else:
+                node = ast.BinaryOp(op, left, self.infix(self.prefix(), lbp))
+            node.span = left.span
+            left = node
+
+    def prefix(self):
+        pos = self.pos
+        t = self.types[pos]
+        self.pos = pos + 1
+
+        if t == 'ID' or t == 'NUMBER':
+            offset = self.offsets[pos]
+            value = self.text[offset:offset + self.lengths[pos]]
+            if t == 'NUMBER':
+                node = ast.Number(int(value))
+            elif self.types[pos + 1] == 'LPAREN':
+                node = ast.FunctionCall(value, self.groupArgs())
+            else:
+                node = ast.Identifier(value)
+            node.span = offset << 32 | self.lines[pos]
+            return node
+        elif t == 'FLOAT':
+            return self.span(ast.Number(float(self.value(pos)), True), pos)
+        elif t == 'STRING':
+            return self.span(ast.String(self.value(pos)[1:-1]), pos)
+        elif t == 'CHAR':
+            return self.span(ast.Character(self.value(pos)[1]), pos)
+        elif t == 'TRUE':
+            return self.span(ast.Bool(True), pos)
+        elif t == 'FALSE':
+            return self.span(ast.Bool(False), pos)
+        elif t == 'LPAREN':
+            node = self.expression()
+            self.expect('RPAREN')
+            return node
+        elif t == 'TIMES':                  # pointer
+            return self.span(ast.Pointer(self.expression(INFIX['TIMES'])), pos)
+        elif t == 'REF':                    # reference
+            return self.span(ast.Reference(self.expression()), pos)
+        elif t == 'MINUS':                  # uminus
+            zero = self.span(ast.Number(0), pos)
+            return self.span(ast.BinaryOp('-', zero, self.expression(INFIX['MINUS'])), pos)
+        elif t == 'NOT':
+            return self.span(ast.LogicalOp(self.value(pos), self.expression(), None), pos)
+
+        raise ParseError(pos)
+
+    # SCOPES
+
+    def scope(self, t):
+        start = self.pos
+        self.pos += 1
+        if t == 'FUNC':
+            if self.types[self.pos] not in TYPES:
+                raise ParseError(self.pos)
+            _type = self.value(self.pos)
+            self.pos += 1
+            name = self.value(self.expect('ID'))
+            args = self.groupArgs()
+            return self.span(ast.Function(name, _type, args, self.block()), start)
+
+        elif t == 'IF':
+            condition = self.condition()
+            then_branch = self.block()
+            elseif_branch = []
+            while self.types[self.pos] == 'ELIF':
+                elseif_start = self.pos
+                self.pos += 1
+                elseif_condition = self.condition()
+                elseif = ast.ElseIfStatement(elseif_condition, self.block())
+                elseif_branch.append(self.span(elseif, elseif_start))
+            else_branch = None
+            if self.types[self.pos] == 'ELSE':
+                else_start = self.pos
+                self.pos += 1
+                else_branch = self.span(ast.ElseStatement(self.block()), else_start)
+            return self.span(ast.IfStatement(condition, then_branch, elseif_branch, else_branch), start)
+
+        elif t == 'FOR':
+            self.expect('LPAREN')
+            exp1 = self.loopStatement()
+            self.expect('SEMI')
+            exp2 = self.expression()
+            self.expect('SEMI')
+            exp3 = self.loopStatement()
+            self.expect('RPAREN')
+            return self.span(ast.ForLoop(exp1, exp2, exp3, self.block()), start)
+
+        elif t == 'WHILE':
+            condition = self.condition()
+            return self.span(ast.WhileLoop(condition, self.block()), start)
+
+        elif t == 'DO':
+            block = self.block()
+            self.expect('WHILE')
+            return self.span(ast.doWhileLoop(self.condition(), block), start)
+
+        elif t == 'STRUCT':
+            name = self.value(self.expect('ID'))
+            self.expect('LBRACE')
+            block = self.statements('RBRACE')
+            self.expect('RBRACE')
+            return self.span(ast.Struct(name, self.spanOf(ast.Group(block), block[0])), start)
+
+        elif t == 'ENUM':
+            name = self.value(self.expect('ID'))
+            return self.span(ast.Enum(name, self.enumValues()), start)
+
+        # CLASS
+        name = self.expression()
+        return self.span(ast.Class(name, self.block()), start)
+
+    # ( expression )
+    def condition(self):
+        self.expect('LPAREN')
+        node = self.expression()
+        self.expect('RPAREN')
+        return node
+
+    # for loop parts must be statements, not bare expressions
+    def loopStatement(self):
+        pos = self.pos
+        node, isStatement = self.statement()
+        if not isStatement:
+            raise ParseError(pos)
+        return node
+
+    # { ID [NUMBER], ... }
+    def enumValues(self):
+        self.expect('LBRACE')
+        values = []
+        count = 0
+        while True:
+            pos = self.expect('ID')
+            name = self.value(pos)
+            if self.types[self.pos] == 'NUMBER':
+                value = int(self.value(self.pos))
+                self.pos += 1
+                count = int(value) + 1
+            else:
+                value = count
+                count += 1
+            values.append(self.span(ast.EnumVal(name, value), pos))
+
+            if self.types[self.pos] != 'COMMA':
+                break
+            self.pos += 1
+        self.expect('RBRACE')
+        return values
@@ -0,0 +1,75 @@
+import contextlib
+import os
+import time
+
+# wall and CPU seconds of each compile phase. CPU counts this process and
+# the children it waited for (gcc), so a subprocess phase shows its cost.
+# A phase named in parentheses is not added to the total, it is part of
+# another one (lexing happens inside parsing)
+class PhaseTimer:
+
+    def __init__(self):
+        self.phases = []                    # (name, wall, cpu) in the order they ran
+
+    @staticmethod
+    def cpu():
+        children = os.times()
+        return time.process_time() + children.children_user + children.children_system
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        wall = time.perf_counter()
+        cpu = self.cpu()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - wall, self.cpu() - cpu))
+
+    def report(self):
+        total = sum(wall for name, wall, cpu in self.phases if not name.startswith('('))
+        lines = ['(time) phase                 wall s    cpu s      %']
+        for name, wall, cpu in self.phases:
+            share = '' if name.startswith('(') else f'{wall / total * 100 if total else 0:6.1f}'
+            lines.append(f'(time) {name:20} {wall:8.4f} {cpu:8.4f} {share:>6}')
+        lines.append(f'(time) {"total":20} {total:8.4f}')
+        return '\n'.join(lines)
+
+# count and seconds per AST node type dispatched by a visitor. attach()
+# replaces the visitor's code_gen with a timed one, every recursive
+# dispatch goes through it. Inclusive time counts the children, self time
+# does not
+class NodeProfiler:
+
+    def __init__(self):
+        self.counts = {}
+        self.inclusive = {}
+        self.exclusive = {}
+        self.children = [0.0]               # time spent in children, per open dispatch
+        self.open = {}                      # node type -> dispatches of it in progress
+
+    def attach(self, visitor):
+        visit = visitor.code_gen
+
+        def timed(node):
+            nodeType = node.__class__.__name__
+            self.open[nodeType] = self.open.get(nodeType, 0) + 1
+            self.children.append(0.0)
+            start = time.perf_counter()
+            try:
+                return visit(node)
+            finally:
+                elapsed = time.perf_counter() - start
+                self.open[nodeType] -= 1
+                self.counts[nodeType] = self.counts.get(nodeType, 0) + 1
+                if not self.open[nodeType]:                 # a Block in a Block is counted once
+                    self.inclusive[nodeType] = self.inclusive.get(nodeType, 0.0) + elapsed
+                self.exclusive[nodeType] = self.exclusive.get(nodeType, 0.0) + elapsed - self.children.pop()
+                self.children[-1] += elapsed
+
+        visitor.code_gen = timed
+
+    def report(self):
+        lines = ['(codegen) node type           count  inclusive s    self s']
+        for nodeType in sorted(self.exclusive, key=self.exclusive.get, reverse=True):
+            lines.append(f'(codegen) {nodeType:18} {self.counts[nodeType]:8} {self.inclusive[nodeType]:12.4f} {self.exclusive[nodeType]:9.4f}')
+        return '\n'.join(lines)
@@ -1,6 +1,8 @@
+from src.ast import ast
+from src.ast.visitor import NodeVisitor
 
 class Warning:
-    
+
     def __init__(self, msg):
         self.msg = msg
 
@@ -10,8 +12,242 @@ class Error:
         self.msg = msg
         self.token = token
 
+    def __str__(self):
+        return f'(semantic) Error line {getattr(self.token, "lineno", 0)}: {self.msg}'
+
 class SyntaxError(Error):
 
     def __init__(self, msg, token):
-        super.__init__(msg, token)
+        super().__init__(msg, token)
+
+# resolves every name and annotates every expression with its static type
+# (node.vtype), once, before code generation. Types are the source type
+# names: 'i32', 'idouble', 'char', 'str', 'bool', a struct name, 'T*' for
+# pointers and 'T[]' for arrays.
+#
+# every declaration gets a slot, a number unique in the program, and every
+# Identifier is given the slot of the declaration it refers to
+# (Identifier.slot), the compiler's SlotTable is indexed by it
+#
+# follows the scopes the compiler uses. Nodes the compiler skips (Define,
+# Include, Class, ...) are skipped here too
+class SemanticAnalyzer(NodeVisitor):
+
+    def __init__(self):
+        self.scopes = [{}]                  # name -> declaring Identifier, global scope first
+        self.slots = 0
+        self.functions = {}                 # name -> return type
+        self.types = {}                     # struct name -> {field: type}, enum name -> None
+        self.loops = 0                      # loop bodies the visit is inside of
+        self.errors = []
+
+    # list of Error, empty when the tree can be compiled
+    def analyze(self, tree):
+        self.visit(tree)
+        return self.errors
+
+    def error(self, msg, node):
+        self.errors.append(Error(msg, node))
+
+    def generic_visit(self, node):
+        return None
+
+    # SCOPES
+
+    def declare(self, node: ast.Identifier | ast.EnumVal, vtype):
+        node.vtype = vtype
+        node.slot = self.slots
+        self.slots += 1
+        self.scopes[-1][node.name] = node
+
+    def lookUp(self, name):
+        for scope in reversed(self.scopes):
+            if name in scope:
+                return scope[name]
+        return None
+
+    def scoped(self, node):
+        self.scopes.append({})
+        self.visit(node)
+        self.scopes.pop()
+
+    # STATEMENTS
+
+    def visit_Program(self, node: ast.Program):
+        for statement in node.statement:
+            self.visit(statement)
+
+    def visit_Block(self, node: ast.Block):
+        self.scopes.append({})
+        self.visit_Program(node)
+        self.scopes.pop()
+
+    def visit_Function(self, node: ast.Function):
+        self.functions[node.name] = node._type          # before the body, for recursion
+        self.scopes.append({})
+        for arg in node.args.value:
+            if isinstance(arg, ast.Assign):
+                self.declare(arg.name, arg.type)
+        self.visit(node.block)
+        self.scopes.pop()
+
+    def visit_Assign(self, node: ast.Assign):
+        self.visit(node.value)
+        _type = node.type
+        if not _type:                                   # assignment, the target is an expression
+            self.visit(node.name)
+            return
+
+        if isinstance(_type, ast.Array):
+            vtype = f'{_type._type}[]'
+        elif _type in self.types:
+            vtype = _type if self.types[_type] is not None else 'i32'   # enums are i32
+        elif isinstance(node.name, ast.Pointer):
+            vtype = f'{_type}*'
+        else:
+            vtype = _type
+        self.declare(self.getName(node.name), vtype)
+
+    # the Identifier a declaration declares, i32 *p declares p
+    def getName(self, node):
+        while not isinstance(node, ast.Identifier):
+            node = node.name
+        return node
+
+    def visit_Return(self, node: ast.Return):
+        self.visit(node.value)
+
+    def visit_Write(self, node: ast.Write):
+        self.visit(node.expr)
+
+    def visit_IfStatement(self, node: ast.IfStatement):
+        self.visit(node.condition)
+        self.scoped(node.then_branch)
+        for elseif in node.elseif_branch:
+            self.visit(elseif.condition)
+            self.scoped(elseif.then_branch)
+        if node.else_branch:
+            self.scoped(node.else_branch.then_branch)
+
+    def visit_WhileLoop(self, node: ast.WhileLoop):
+        self.visit(node.condition)
+        self.loops += 1
+        self.scoped(node.block)
+        self.loops -= 1
+
+    def visit_ForLoop(self, node: ast.ForLoop):
+        self.scopes.append({})
+        self.visit(node.exp1)
+        self.visit(node.exp2)
+        self.visit(node.exp3)
+        self.loops += 1
+        self.visit(node.block)
+        self.loops -= 1
+        self.scopes.pop()
+
+    def visit_ControlFlow(self, node: ast.ControlFlow):
+        if not self.loops:
+            self.error(f'{node.name} outside a loop', node)
+
+    def visit_Struct(self, node: ast.Struct):
+        self.types[node.name] = {arg.name.name: arg.type for arg in node.block.value if isinstance(arg, ast.Assign)}
+
+    # the members are i32 constants, declared in the enclosing scope. An
+    # Identifier naming one gets the slot of its EnumVal
+    def visit_Enum(self, node: ast.Enum):
+        self.types[node.name] = None
+        for value in node.block:
+            self.declare(value, 'i32')
+
+    # EXPRESSIONS, each returns and stores its type
+
+    def visit_Number(self, node: ast.Number):
+        node.vtype = 'idouble' if node._float else 'i32'
+        return node.vtype
+
+    def visit_String(self, node: ast.String):
+        node.vtype = 'str'
+        return node.vtype
+
+    def visit_Character(self, node: ast.Character):
+        node.vtype = 'char'
+        return node.vtype
+
+    def visit_Bool(self, node: ast.Bool):
+        node.vtype = 'bool'
+        return node.vtype
+
+    def visit_Identifier(self, node: ast.Identifier):
+        declaration = self.lookUp(node.name)
+        if declaration is None:
+            self.error(f'undeclared identifier {node.name}', node)
+            node.vtype = None
+            return None
+        node.vtype = declaration.vtype
+        node.slot = declaration.slot
+        return node.vtype
+
+    def visit_Group(self, node: ast.Group):
+        for value in node.value:
+            self.visit(value)
+
+    def visit_BinaryOp(self, node: ast.BinaryOp):
+        left = self.visit(node.left)
+        right = self.visit(node.right)
+        if left and right and left != right:
+            self.error(f'mismatched types {left} {node.op} {right}', node)
+        node.vtype = left
+        return node.vtype
+
+    def visit_CompareOp(self, node: ast.CompareOp):
+        left = self.visit(node.left)
+        right = self.visit(node.right)
+        if left and right and left != right:
+            self.error(f'mismatched types {left} {node.op} {right}', node)
+        node.vtype = 'bool'
+        return node.vtype
+
+    def visit_LogicalOp(self, node: ast.LogicalOp):
+        self.visit(node.left)
+        self.visit(node.right)                          # None for not
+        node.vtype = 'bool'
+        return node.vtype
+
+    def visit_FunctionCall(self, node: ast.FunctionCall):
+        self.visit(node.args)
+        node.vtype = self.functions.get(node.name)
+        if node.vtype is None:
+            self.error(f'undefined function {node.name}', node)
+        return node.vtype
+
+    def visit_getArray(self, node: ast.getArray):
+        array = self.visit(node.name)
+        self.visit(node.index)
+        node.vtype = None
+        if array and array.endswith('[]'):
+            node.vtype = array[:-2]
+        elif array:
+            self.error(f'{node.name.name} is not an array', node)
+        return node.vtype
+
+    def visit_Pointer(self, node: ast.Pointer):
+        pointer = self.visit(node.name)
+        node.vtype = None
+        if pointer and pointer.endswith('*'):
+            node.vtype = pointer[:-1]
+        elif pointer:
+            self.error(f'{node.name.name} is not a pointer', node)
+        return node.vtype
+
+    def visit_Reference(self, node: ast.Reference):
+        value = self.visit(node.name)
+        node.vtype = f'{value}*' if value else None
+        return node.vtype
 
+    def visit_Access(self, node: ast.Access):
+        struct = self.visit(node.left)
+        fields = self.types.get(struct) if struct else None
+        node.vtype = fields.get(node.right.name) if fields else None
+        if struct and node.vtype is None:
+            self.error(f'{node.left.name} has no field {node.right.name}', node)
+        return node.vtype
@@ -0,0 +1,93 @@
+import json
+import os
+import socket
+import sys
+import time
+
+# yanc, the compiler command. When a compile server is running, an
+# invocation is forwarded to it over a Unix socket. The server already has
+# ply, llvmlite, the parser tables and LLVM's native target loaded, so the
+# client only starts Python and connects. Without a server the compile runs
+# in this process, like main.py
+#
+#   python yanc.py --serve              run the server
+#   python yanc.py --stop               stop it
+#   python yanc.py test4.yan -O2 -o hello
+#
+# the server compiles one request at a time, in the client's directory.
+# --jit runs in the client, the program's output belongs there
+
+SOCKET = os.environ.get('YANC_SOCKET', os.path.join(os.environ.get('TMPDIR', '/tmp'), f'yanc-{os.getuid()}.sock'))
+
+# one request, a JSON line each way. None when no server is listening or
+# it gave no reply
+def send(request, path=SOCKET):
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(path)
+    except OSError:
+        client.close()
+        return None
+    with client, client.makefile('rw') as stream:
+        try:
+            stream.write(json.dumps(request) + '\n')
+            stream.flush()
+            reply = stream.readline()
+        except OSError:
+            reply = ''
+    return json.loads(reply) if reply else None     # empty when the server died mid-request
+
+def serve(path=SOCKET):
+    import contextlib
+    import io
+    import traceback
+    import main                             # ply, llvmlite and the compiler, once
+    main.Compiler()                         # LLVM's native target
+
+    if os.path.exists(path):
+        os.unlink(path)                     # left by a server that was killed
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(path)
+    server.listen()
+    print(f'yanc server on {path}', flush=True)
+    home = os.getcwd()
+
+    try:
+        while True:
+            connection = server.accept()[0]
+            with connection, connection.makefile('rw') as stream:
+                request = json.loads(stream.readline())
+                if request.get('stop'):
+                    stream.write(json.dumps({'output': 'yanc server stopped\n'}) + '\n')
+                    break
+
+                # everything the compile prints, gcc's diagnostics included
+                output = io.StringIO()
+                start = time.perf_counter()
+                with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+                    try:
+                        os.chdir(request['cwd'])
+                        main.cli(request['argv'])
+                    except Exception:
+                        traceback.print_exc(file=output)
+                    finally:
+                        os.chdir(home)
+                stream.write(json.dumps({'output': output.getvalue(), 'seconds': time.perf_counter() - start}) + '\n')
+    finally:
+        server.close()
+        os.unlink(path)
+
+if __name__=='__main__':
+    argv = sys.argv[1:]
+    if argv == ['--serve']:
+        serve()
+    elif argv == ['--stop']:
+        reply = send({'stop': True})
+        print(reply['output'] if reply else 'no yanc server', end='')
+    else:
+        reply = None if '--jit' in argv else send({'argv': argv, 'cwd': os.getcwd()})
+        if reply is None:                   # no server, compile here
+            import main
+            main.cli(argv)
+        else:
+            sys.stdout.write(reply['output'])